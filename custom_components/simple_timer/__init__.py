@@ -7,15 +7,23 @@ import json
 import asyncio
 import homeassistant.helpers.config_validation as cv
 
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.config_entries import ConfigEntry
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.exceptions import ServiceValidationError
-from homeassistant.helpers import entity_registry as er
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.frontend import async_register_built_in_panel, add_extra_js_url
 from homeassistant.components.lovelace.resources import ResourceStorageCollection
 
-from .const import DOMAIN, PLATFORMS, CARD_URL, LEGACY_CARD_URL
+from .actuation import SETTING_LANE_LIMITS, async_get_actuation_queue
+from .const import DOMAIN, PLATFORMS, CARD_URL, LEGACY_CARD_URL, DEFAULT_BULK_CONCURRENCY
+from .cron import CronError, CronExpression
+from .index import async_get_timer_index
+from .journal import async_get_session_journal
+from .programs import ProgramStep, async_get_program_runner
+from .startup import async_get_startup_gate
+from .storage import async_get_storage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +76,25 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     if hass.data.setdefault(DOMAIN, {}).get("services_registered"):
         return True
 
+    # Load the consolidated storage document once for all instances, folding in
+    # any per-entry files left by older versions.
+    storage = async_get_storage(hass)
+    await storage.async_load()
+    await storage.async_migrate_legacy(
+        [entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN)]
+    )
+
+    # Past runs are answered from memory by get_sessions
+    await async_get_session_journal(hass).async_load()
+
+    # Start listening for startup readiness events before any sensor is added
+    async_get_startup_gate(hass)
+
+    # Per-integration switch command rate limits (user overrides of the defaults)
+    async_get_actuation_queue(hass).async_set_limits(
+        storage.async_get_setting(SETTING_LANE_LIMITS, {})
+    )
+
     # Serve the card from our own URL namespace (CARD_URL), directly out of the
     # integration's dist folder. Not under "/local/" — see const.py for why.
     integration_path = os.path.dirname(__file__)
@@ -98,58 +125,136 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     await init_resource(hass, CARD_URL, cache_id)
 
     UNIT_OPTIONS = ["s", "sec", "seconds", "m", "min", "minutes", "h", "hr", "hours", "d", "day", "days"]
+    UNIT_SECONDS = {
+        **dict.fromkeys(["s", "sec", "seconds"], 1),
+        **dict.fromkeys(["m", "min", "minutes"], 60),
+        **dict.fromkeys(["h", "hr", "hours"], 3600),
+        **dict.fromkeys(["d", "day", "days"], 86400),
+    }
 
     # Services accept either entry_id or entity_id (exactly one). entity_id
     # resolves via the entity registry to the owning config entry.
+    # Timer services additionally accept lists of either, plus area_id and
+    # label_id, and run on every matched instance (see _async_run_bulk).
+    BULK_TARGET_KEYS = ("entry_id", "entity_id", "area_id", "label_id")
+    BULK_TARGET_FIELDS = {
+        vol.Optional("entry_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("area_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("label_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("max_concurrency", default=DEFAULT_BULK_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
     SERVICE_START_TIMER_SCHEMA = vol.Schema(vol.All(
         {
-            vol.Exclusive("entry_id", "target"): cv.string,
-            vol.Exclusive("entity_id", "target"): cv.entity_id,
+            **BULK_TARGET_FIELDS,
             vol.Required("duration"): cv.positive_float,
             vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
             vol.Optional("reverse_mode", default=False): cv.boolean,
             vol.Optional("start_method", default="button"): vol.In(["button", "slider"]),
         },
-        cv.has_at_least_one_key("entry_id", "entity_id"),
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
     ))
     DAY_OPTIONS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
     DAY_TO_WEEKDAY = {d: i for i, d in enumerate(DAY_OPTIONS)}
 
     SERVICE_SCHEDULE_TIMER_SCHEMA = vol.Schema(vol.All(
         {
-            vol.Exclusive("entry_id", "target"): cv.string,
-            vol.Exclusive("entity_id", "target"): cv.entity_id,
+            **BULK_TARGET_FIELDS,
             vol.Required("start_time"): cv.time,
             vol.Required("duration"): cv.positive_float,
             vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
             vol.Optional("repeat", default=False): cv.boolean,
             vol.Optional("days", default=list): [vol.In(DAY_OPTIONS)],
         },
-        cv.has_at_least_one_key("entry_id", "entity_id"),
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
     ))
-    SERVICE_CANCEL_SCHEDULE_SCHEMA = vol.Schema(vol.All(
+
+    def _cron_expression(value: Any) -> str:
+        """Validate a five-field cron expression."""
+        try:
+            return CronExpression(cv.string(value)).expression
+        except CronError as e:
+            raise vol.Invalid(f"Invalid cron expression: {e}") from e
+
+    SERVICE_ADD_SCHEDULE_SLOT_SCHEMA = vol.Schema(vol.All(
+        {
+            **BULK_TARGET_FIELDS,
+            vol.Optional("slot_id"): cv.string,
+            vol.Exclusive("cron", "when"): _cron_expression,
+            vol.Exclusive("start_time", "when"): cv.time,
+            vol.Optional("days", default=list): [vol.In(DAY_OPTIONS)],
+            vol.Required("duration"): cv.positive_float,
+            vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
+        },
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
+        cv.has_at_least_one_key("cron", "start_time"),
+    ))
+    SERVICE_START_CYCLE_SCHEMA = vol.Schema(vol.All(
+        {
+            **BULK_TARGET_FIELDS,
+            vol.Required("on_duration"): cv.positive_float,
+            vol.Optional("off_duration", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Required("repeats"): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+            vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
+        },
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
+    ))
+    PROGRAM_STEP_SCHEMA = vol.Schema(vol.All(
         {
             vol.Exclusive("entry_id", "target"): cv.string,
             vol.Exclusive("entity_id", "target"): cv.entity_id,
+            vol.Required("duration"): cv.positive_float,
+            vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
         },
         cv.has_at_least_one_key("entry_id", "entity_id"),
     ))
+    SERVICE_RUN_PROGRAM_SCHEMA = vol.Schema({
+        vol.Optional("program_id", default="default"): cv.string,
+        vol.Required("steps"): vol.All(cv.ensure_list, [PROGRAM_STEP_SCHEMA], vol.Length(min=1)),
+        vol.Optional("gap", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("overlap", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    })
+    SERVICE_STOP_PROGRAM_SCHEMA = vol.Schema({
+        vol.Optional("program_id", default="default"): cv.string,
+    })
+    SERVICE_GET_SESSIONS_SCHEMA = vol.Schema(vol.All(
+        {
+            **BULK_TARGET_FIELDS,
+            vol.Optional("days", default=30): vol.All(vol.Coerce(int), vol.Range(min=1, max=3650)),
+        },
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
+    ))
+    SERVICE_REMOVE_SCHEDULE_SLOT_SCHEMA = vol.Schema(vol.All(
+        {
+            **BULK_TARGET_FIELDS,
+            vol.Required("slot_id"): cv.string,
+        },
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
+    ))
+    SERVICE_CANCEL_SCHEDULE_SCHEMA = vol.Schema(vol.All(
+        {
+            **BULK_TARGET_FIELDS,
+        },
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
+    ))
+    # Timer services that take nothing but their targets
+    SERVICE_TARGET_ONLY_SCHEMA = SERVICE_CANCEL_SCHEDULE_SCHEMA
     SERVICE_ADD_TIMER_SCHEMA = vol.Schema(vol.All(
         {
-            vol.Exclusive("entry_id", "target"): cv.string,
-            vol.Exclusive("entity_id", "target"): cv.entity_id,
+            **BULK_TARGET_FIELDS,
             vol.Required("duration"): cv.positive_float,
             vol.Optional("unit", default="min"): vol.In(UNIT_OPTIONS),
         },
-        cv.has_at_least_one_key("entry_id", "entity_id"),
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
     ))
     SERVICE_CANCEL_TIMER_SCHEMA = vol.Schema(vol.All(
         {
-            vol.Exclusive("entry_id", "target"): cv.string,
-            vol.Exclusive("entity_id", "target"): cv.entity_id,
+            **BULK_TARGET_FIELDS,
             vol.Optional("turn_off_entity", default=True): cv.boolean,
         },
-        cv.has_at_least_one_key("entry_id", "entity_id"),
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
     ))
     SERVICE_UPDATE_SWITCH_SCHEMA = vol.Schema(vol.All(
         {
@@ -182,83 +287,235 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
     ))
     SERVICE_RESET_DAILY_USAGE_SCHEMA = vol.Schema(vol.All(
         {
-            vol.Exclusive("entry_id", "target"): cv.string,
-            vol.Exclusive("entity_id", "target"): cv.entity_id,
+            **BULK_TARGET_FIELDS,
         },
-        cv.has_at_least_one_key("entry_id", "entity_id"),
+        cv.has_at_least_one_key(*BULK_TARGET_KEYS),
     ))
     SERVICE_RELOAD_RESOURCES_SCHEMA = vol.Schema({})
+    SERVICE_CONFIGURE_ACTUATION_SCHEMA = vol.Schema({
+        vol.Required("integration"): cv.string,
+        vol.Required("min_interval"): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+        vol.Optional("jitter", default=0): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+    })
+
+    # entity_id/entry_id -> sensor index, kept current from registry events
+    index = async_get_timer_index(hass)
 
     def _resolve_entry_id(call: ServiceCall) -> tuple[str, str]:
         """Return (config_entry_id, human_label) from entry_id or entity_id."""
-        entry_id = call.data.get("entry_id")
-        if entry_id:
-            return entry_id, f"entry_id: {entry_id}"
-
-        entity_id = call.data["entity_id"]
-        registry = er.async_get(hass)
-        reg_entry = registry.async_get(entity_id)
-        if reg_entry is None or reg_entry.platform != DOMAIN:
-            raise ServiceValidationError(
-                f"'{entity_id}' is not a Simple Timer entity"
-            )
-        if reg_entry.config_entry_id is None:
-            raise ServiceValidationError(
-                f"'{entity_id}' has no associated config entry"
-            )
-        return reg_entry.config_entry_id, f"entity_id: {entity_id}"
+        return index.async_resolve(call.data.get("entry_id"), call.data.get("entity_id"))
 
     def _get_sensor(entry_id: str, label: str):
         """Return the loaded sensor for entry_id or raise a clear error."""
-        entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
-        sensor = entry_data.get("sensor") if isinstance(entry_data, dict) else None
-        if sensor is None:
-            raise ServiceValidationError(
-                f"No Simple Timer sensor loaded for {label}"
+        return index.async_get_sensor(entry_id, label)
+
+    def _resolve_bulk_targets(call: ServiceCall) -> tuple[dict[str, tuple[str, str]], dict[str, str]]:
+        """Resolve every target of a bulk call.
+
+        Returns ({target: (entry_id, label)}, {target: error}) where target is
+        the entry_id or entity_id as given (or matched via area/label).
+        """
+        resolved: dict[str, tuple[str, str]] = {}
+        errors: dict[str, str] = {}
+        seen_entries: set[str] = set()
+
+        entity_ids = list(call.data.get("entity_id", []))
+        if call.data.get("area_id") or call.data.get("label_id"):
+            entity_ids += index.async_match_entities(
+                call.data.get("area_id", []), call.data.get("label_id", [])
             )
-        return sensor
+
+        for entry_id in call.data.get("entry_id", []):
+            if entry_id not in seen_entries:
+                seen_entries.add(entry_id)
+                resolved[entry_id] = (entry_id, f"entry_id: {entry_id}")
+        for entity_id in entity_ids:
+            try:
+                entry_id, label = index.async_resolve(None, entity_id)
+            except ServiceValidationError as e:
+                errors[entity_id] = str(e)
+                continue
+            if entry_id not in seen_entries:
+                seen_entries.add(entry_id)
+                resolved[entity_id] = (entry_id, label)
+
+        return resolved, errors
+
+    async def _async_run_bulk(call: ServiceCall, action) -> ServiceResponse:
+        """Run action(sensor) on every target concurrently, up to max_concurrency.
+
+        A call naming a single entry_id/entity_id keeps the old behaviour of
+        raising on failure; otherwise failures are isolated per target and
+        reported in the response data.
+        """
+        resolved, errors = _resolve_bulk_targets(call)
+        if not resolved and not errors:
+            raise ServiceValidationError("No Simple Timer entities matched the given targets")
+
+        single = (
+            len(resolved) + len(errors) == 1
+            and not call.data.get("area_id")
+            and not call.data.get("label_id")
+        )
+        if single and errors:
+            raise ServiceValidationError(next(iter(errors.values())))
+
+        semaphore = asyncio.Semaphore(call.data.get("max_concurrency", DEFAULT_BULK_CONCURRENCY))
+
+        async def _async_run_target(entry_id: str, label: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    await action(_get_sensor(entry_id, label))
+                except Exception as e:
+                    if single:
+                        raise
+                    _LOGGER.warning(f"Simple Timer: {call.service} failed for {label}: {e}")
+                    return {"entry_id": entry_id, "success": False, "error": str(e)}
+                return {"entry_id": entry_id, "success": True}
+
+        outcomes = await asyncio.gather(
+            *(_async_run_target(entry_id, label) for entry_id, label in resolved.values())
+        )
+        results: dict[str, dict[str, Any]] = dict(zip(resolved, outcomes))
+        for target, error in errors.items():
+            results[target] = {"entry_id": None, "success": False, "error": error}
+
+        if not call.return_response:
+            return None
+        return {"results": results}
 
     async def test_notification(call: ServiceCall):
         """Test notification functionality."""
         sensor = _get_sensor(*_resolve_entry_id(call))
         await sensor._send_notification(call.data.get("message", "Test notification"))
 
-    async def start_timer(call: ServiceCall):
+    async def start_timer(call: ServiceCall) -> ServiceResponse:
         """Handle the service call to start the device timer."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
-        await sensor.async_start_timer(
+        return await _async_run_bulk(call, lambda sensor: sensor.async_start_timer(
             call.data["duration"],
             call.data.get("unit", "min"),
             call.data.get("reverse_mode", False),
             call.data.get("start_method", "button"),
-        )
+        ))
 
-    async def add_timer(call: ServiceCall):
+    async def add_timer(call: ServiceCall) -> ServiceResponse:
         """Handle the service call to add time to an active timer."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
-        await sensor.async_add_timer(call.data["duration"], call.data.get("unit", "min"))
+        return await _async_run_bulk(call, lambda sensor: sensor.async_add_timer(
+            call.data["duration"], call.data.get("unit", "min")
+        ))
 
-    async def schedule_timer(call: ServiceCall):
+    async def schedule_timer(call: ServiceCall) -> ServiceResponse:
         """Handle the service call to arm a scheduled start."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
         days = [DAY_TO_WEEKDAY[d] for d in call.data.get("days", [])]
-        await sensor.async_schedule_timer(
+        return await _async_run_bulk(call, lambda sensor: sensor.async_schedule_timer(
             call.data["start_time"],
             call.data["duration"],
             call.data.get("unit", "min"),
             call.data.get("repeat", False),
             days,
-        )
+        ))
 
-    async def cancel_schedule(call: ServiceCall):
+    async def cancel_schedule(call: ServiceCall) -> ServiceResponse:
         """Handle the service call to cancel an armed schedule."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
-        await sensor.async_cancel_schedule()
+        return await _async_run_bulk(call, lambda sensor: sensor.async_cancel_schedule())
+
+    async def add_schedule_slot(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to add a slot to the schedule table."""
+        if (cron := call.data.get("cron")) is None:
+            # Time of day (+ weekdays) is shorthand for a cron expression
+            start_time = call.data["start_time"]
+            days = ",".join(call.data.get("days", [])) or "*"
+            cron = f"{start_time.minute} {start_time.hour} * * {days}"
+        return await _async_run_bulk(call, lambda sensor: sensor.async_add_schedule_slot(
+            call.data.get("slot_id"),
+            cron,
+            call.data["duration"],
+            call.data.get("unit", "min"),
+        ))
+
+    async def remove_schedule_slot(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to remove a slot from the schedule table."""
+        return await _async_run_bulk(
+            call, lambda sensor: sensor.async_remove_schedule_slot(call.data["slot_id"])
+        )
+
+    async def clear_schedule_slots(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to remove every slot from the schedule table."""
+        return await _async_run_bulk(call, lambda sensor: sensor.async_clear_schedule_slots())
+
+    async def pause_timer(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to pause an active timer."""
+        return await _async_run_bulk(call, lambda sensor: sensor.async_pause_timer())
+
+    async def resume_timer(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to resume a paused timer."""
+        return await _async_run_bulk(call, lambda sensor: sensor.async_resume_timer())
 
-    async def cancel_timer(call: ServiceCall):
+    async def start_cycle(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to run the switch in an on/off duty cycle."""
+        return await _async_run_bulk(call, lambda sensor: sensor.async_start_cycle(
+            call.data["on_duration"],
+            call.data.get("off_duration", 0),
+            call.data["repeats"],
+            call.data.get("unit", "min"),
+        ))
+
+    async def stop_cycle(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to stop a running duty cycle."""
+        return await _async_run_bulk(call, lambda sensor: sensor.async_stop_cycle())
+
+    async def run_program(call: ServiceCall) -> ServiceResponse:
+        """Handle the service call to run instances one after another."""
+        index = async_get_timer_index(hass)
+        steps = []
+        for step in call.data["steps"]:
+            entry_id, label = index.async_resolve(step.get("entry_id"), step.get("entity_id"))
+            index.async_get_sensor(entry_id, label)
+            steps.append(ProgramStep(entry_id, step["duration"] * UNIT_SECONDS[step.get("unit", "min")]))
+
+        run = await async_get_program_runner(hass).async_start(
+            call.data.get("program_id", "default"), steps, call.data.get("gap", 0), call.data.get("overlap", 0)
+        )
+        if not call.return_response:
+            return None
+        return {
+            "steps": [
+                {
+                    "entry_id": step.entry_id,
+                    "start": run.step_start(step_index).isoformat(),
+                    "end": run.step_end(step_index).isoformat(),
+                }
+                for step_index, step in enumerate(run.steps)
+            ]
+        }
+
+    async def stop_program(call: ServiceCall):
+        """Handle the service call to stop a running program."""
+        try:
+            await async_get_program_runner(hass).async_stop(call.data.get("program_id", "default"))
+        except ValueError as e:
+            raise ServiceValidationError(str(e)) from e
+
+    async def get_sessions(call: ServiceCall) -> ServiceResponse:
+        """Return the journalled runs and older day/week totals of each target."""
+        resolved, errors = _resolve_bulk_targets(call)
+        if not resolved and not errors:
+            raise ServiceValidationError("No Simple Timer entities matched the given targets")
+
+        journal = async_get_session_journal(hass)
+        sessions: dict[str, dict[str, Any]] = {
+            target: {"entry_id": entry_id, **journal.async_query(entry_id, call.data["days"])}
+            for target, (entry_id, _) in resolved.items()
+        }
+        for target, error in errors.items():
+            sessions[target] = {"entry_id": None, "error": error}
+        return {"sessions": sessions}
+
+    async def cancel_timer(call: ServiceCall) -> ServiceResponse:
         """Handle the service call to cancel the device timer."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
-        await sensor.async_cancel_timer(call.data.get("turn_off_entity", True))
+        return await _async_run_bulk(call, lambda sensor: sensor.async_cancel_timer(
+            call.data.get("turn_off_entity", True)
+        ))
 
     async def update_switch_entity(call: ServiceCall):
         """Handle the service call to update the switch entity for the sensor."""
@@ -288,11 +545,21 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
         sensor = _get_sensor(*_resolve_entry_id(call))
         await sensor.async_manual_power_toggle(call.data["action"])
 
-    async def reset_daily_usage(call: ServiceCall):
+    async def reset_daily_usage(call: ServiceCall) -> ServiceResponse:
         """Handle manual daily usage reset."""
-        sensor = _get_sensor(*_resolve_entry_id(call))
-        await sensor.async_reset_daily_usage()
+        return await _async_run_bulk(call, lambda sensor: sensor.async_reset_daily_usage())
             
+    async def configure_actuation(call: ServiceCall):
+        """Set the switch command rate limit for one integration (mesh)."""
+        overrides = dict(storage.async_get_setting(SETTING_LANE_LIMITS, {}))
+        overrides[call.data["integration"]] = {
+            "min_interval": call.data["min_interval"],
+            "jitter": call.data.get("jitter", 0),
+        }
+        await storage.async_set_setting(SETTING_LANE_LIMITS, overrides)
+        async_get_actuation_queue(hass).async_set_limits(overrides)
+        _LOGGER.info(f"Simple Timer: Actuation limits for '{call.data['integration']}' set to {overrides[call.data['integration']]}")
+
     async def reload_resources(call: ServiceCall):
         """Reload frontend resources with current manifest version."""
         try:
@@ -343,19 +610,63 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
 
     # Register all services
     hass.services.async_register(
-        DOMAIN, "start_timer", start_timer, schema=SERVICE_START_TIMER_SCHEMA
+        DOMAIN, "start_timer", start_timer, schema=SERVICE_START_TIMER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "add_timer", add_timer, schema=SERVICE_ADD_TIMER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "schedule_timer", schedule_timer, schema=SERVICE_SCHEDULE_TIMER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, "add_timer", add_timer, schema=SERVICE_ADD_TIMER_SCHEMA
+        DOMAIN, "cancel_schedule", cancel_schedule, schema=SERVICE_CANCEL_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, "schedule_timer", schedule_timer, schema=SERVICE_SCHEDULE_TIMER_SCHEMA
+        DOMAIN, "add_schedule_slot", add_schedule_slot, schema=SERVICE_ADD_SCHEDULE_SLOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, "cancel_schedule", cancel_schedule, schema=SERVICE_CANCEL_SCHEDULE_SCHEMA
+        DOMAIN, "remove_schedule_slot", remove_schedule_slot, schema=SERVICE_REMOVE_SCHEDULE_SLOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, "cancel_timer", cancel_timer, schema=SERVICE_CANCEL_TIMER_SCHEMA
+        DOMAIN, "clear_schedule_slots", clear_schedule_slots, schema=SERVICE_TARGET_ONLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "pause_timer", pause_timer, schema=SERVICE_TARGET_ONLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "resume_timer", resume_timer, schema=SERVICE_TARGET_ONLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "start_cycle", start_cycle, schema=SERVICE_START_CYCLE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "stop_cycle", stop_cycle, schema=SERVICE_TARGET_ONLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "run_program", run_program, schema=SERVICE_RUN_PROGRAM_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "stop_program", stop_program, schema=SERVICE_STOP_PROGRAM_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "get_sessions", get_sessions, schema=SERVICE_GET_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, "cancel_timer", cancel_timer, schema=SERVICE_CANCEL_TIMER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
         DOMAIN, "update_switch_entity", update_switch_entity, schema=SERVICE_UPDATE_SWITCH_SCHEMA
@@ -370,11 +681,15 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
         DOMAIN, "test_notification", test_notification, schema=SERVICE_TEST_NOTIFICATION_SCHEMA
     )
     hass.services.async_register(
-        DOMAIN, "reset_daily_usage", reset_daily_usage, schema=SERVICE_RESET_DAILY_USAGE_SCHEMA
+        DOMAIN, "reset_daily_usage", reset_daily_usage, schema=SERVICE_RESET_DAILY_USAGE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
         DOMAIN, "reload_resources", reload_resources, schema=vol.Schema({})
     )
+    hass.services.async_register(
+        DOMAIN, "configure_actuation", configure_actuation, schema=SERVICE_CONFIGURE_ACTUATION_SCHEMA
+    )
     
     hass.data[DOMAIN]["services_registered"] = True
     return True
@@ -382,6 +697,9 @@ async def async_setup(hass: HomeAssistant, _: dict) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a single Simple Timer config entry."""
     hass.data[DOMAIN][entry.entry_id] = {"sensor": None} # Initialize with None
+
+    # Restarts the daily journal compaction if every instance was unloaded before
+    await async_get_session_journal(hass).async_load()
     
     # Add update listener to block title-only changes (3-dots rename)
     entry.add_update_listener(_async_update_listener)
@@ -401,6 +719,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        async_get_timer_index(hass).async_remove_sensor(entry.entry_id)
+
+        # Stop the domain-wide compaction listener with the last loaded instance
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            async_get_session_journal(hass).async_unload()
     return unload_ok
 
 async def _async_delete_resources(hass: HomeAssistant, *url_prefixes: str) -> None:
@@ -460,6 +787,9 @@ async def _async_cleanup_resources(hass: HomeAssistant) -> None:
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a Simple Timer config entry."""
+    await async_get_storage(hass).async_remove_entry(entry.entry_id)
+    await async_get_session_journal(hass).async_remove_entry(entry.entry_id)
+
     # Check if there are other entries for this domain
     other_entries = [
         e for e in hass.config_entries.async_entries(DOMAIN)
@@ -0,0 +1,365 @@
+"""Switch actuation with event-driven confirmation.
+
+All on/off commands go through a domain-wide ActuationQueue. Commands are
+grouped into lanes by the switch's integration (zha, zwave_js, mqtt, ...), and
+each lane can be rate limited with a minimum spacing plus random jitter so that
+a burst of schedules firing in the same second doesn't flood a radio mesh.
+While a command waits in its lane, further commands for the same switch are
+merged into it.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, Event, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ACTUATION_QUEUE = "actuation_queue"
+
+# Storage setting holding user overrides of DEFAULT_LANE_LIMITS
+SETTING_LANE_LIMITS = "actuation_limits"
+
+# Lane used when the switch's integration can't be determined
+DEFAULT_LANE = "default"
+
+# Minimum seconds between commands, plus up to jitter seconds, per integration.
+# Integrations not listed (and lanes set to 0/0) are not throttled.
+DEFAULT_LANE_LIMITS: dict[str, dict[str, float]] = {
+    "zha": {"min_interval": 0.2, "jitter": 0.1},
+    "zwave_js": {"min_interval": 0.2, "jitter": 0.1},
+    "deconz": {"min_interval": 0.2, "jitter": 0.1},
+    "mqtt": {"min_interval": 0.1, "jitter": 0.05},
+}
+
+# Seconds to wait for the confirming state_changed event, per attempt
+CONFIRM_TIMEOUTS = (3.0, 5.0)
+
+# Background retry policy used after restarts, when integrations may still be
+# coming up (one timeout per attempt)
+RETRY_TIMEOUTS = (5.0, 10.0, 20.0, 40.0)
+
+
+class CommandSuperseded(Exception):
+    """A queued command was replaced by an opposite one for the same switch before it was sent."""
+
+
+@callback
+def _async_state_future(
+    hass: HomeAssistant, entity_id: str, desired_state: str | None
+) -> tuple[asyncio.Future[None], CALLBACK_TYPE]:
+    """Return a future resolved by the next matching state_changed event, and its unsubscribe."""
+    changed: asyncio.Future[None] = hass.loop.create_future()
+
+    @callback
+    def _async_state_listener(event: Event) -> None:
+        new_state = event.data.get("new_state")
+        if changed.done() or new_state is None:
+            return
+        if desired_state is None or new_state.state == desired_state:
+            changed.set_result(None)
+
+    unsub = async_track_state_change_event(hass, [entity_id], _async_state_listener)
+    return changed, unsub
+
+
+async def _async_await_future(changed: asyncio.Future[None], timeout: float) -> bool:
+    """Await a state future with a timeout; False if it timed out."""
+    try:
+        async with asyncio.timeout(timeout):
+            await changed
+        return True
+    except TimeoutError:
+        return False
+
+
+async def async_wait_for_state(
+    hass: HomeAssistant,
+    entity_id: str,
+    timeout: float,
+    desired_state: str | None = None,
+) -> bool:
+    """Wait for a state_changed event of entity_id (to desired_state, if given).
+
+    Returns False if nothing matching arrived within timeout.
+    """
+    changed, unsub = _async_state_future(hass, entity_id, desired_state)
+    try:
+        return await _async_await_future(changed, timeout)
+    finally:
+        unsub()
+
+
+async def async_actuate_and_confirm(
+    hass: HomeAssistant,
+    entity_id: str,
+    desired_state: str,
+    timeout: float,
+    blocking: bool = False,
+) -> float | None:
+    """Turn entity_id on/off via the queue and wait for the matching state_changed event.
+
+    Returns the actuation latency in seconds (measured from the command being
+    sent, not queued), or None if the state was not confirmed within timeout.
+    Raises CommandSuperseded if an opposite command replaced it while queued;
+    that is not a failure and must not be retried. Service call errors
+    propagate to the caller.
+    """
+    return await async_get_actuation_queue(hass).async_enqueue(
+        entity_id, desired_state, timeout, blocking
+    )
+
+
+@callback
+def async_actuate(hass: HomeAssistant, entity_id: str, desired_state: str, blocking: bool = False) -> None:
+    """Queue an on/off command without waiting for it (errors are logged)."""
+    command = async_get_actuation_queue(hass).async_enqueue(entity_id, desired_state, None, blocking)
+    command.add_done_callback(_async_log_failure)
+
+
+@callback
+def _async_log_failure(result: asyncio.Future) -> None:
+    """Consume and log the error of a fire-and-forget command."""
+    if result.cancelled() or isinstance(result.exception(), CommandSuperseded):
+        return
+    if (error := result.exception()) is not None:
+        _LOGGER.warning(f"Simple Timer: Switch command failed: {error}")
+
+
+@dataclass(slots=True)
+class _Command:
+    """One pending on/off command; callers await result."""
+
+    entity_id: str
+    desired_state: str
+    timeout: float | None
+    blocking: bool
+    queued_at: float
+    result: asyncio.Future
+
+
+@dataclass(slots=True)
+class _Lane:
+    """Commands for one integration, sent in order with rate limiting."""
+
+    pending: dict[str, _Command] = field(default_factory=dict)
+    worker: asyncio.Task | None = None
+    last_sent: float = 0.0
+    sent: int = 0
+    merged: int = 0
+    superseded: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    total_wait: float = 0.0
+
+
+class ActuationQueue:
+    """Domain-wide, per-integration rate-limited switch command queue."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self._lanes: dict[str, _Lane] = {}
+        self._lane_of: dict[str, str] = {}
+        self._limits: dict[str, dict[str, float]] = dict(DEFAULT_LANE_LIMITS)
+
+    @callback
+    def async_set_limits(self, overrides: dict[str, dict[str, float]]) -> None:
+        """Apply per-integration limits on top of the defaults."""
+        self._limits = {**DEFAULT_LANE_LIMITS, **overrides}
+
+    @callback
+    def async_get_limits(self) -> dict[str, dict[str, float]]:
+        """Return the effective per-integration limits."""
+        return {lane: dict(limits) for lane, limits in self._limits.items()}
+
+    @callback
+    def _async_lane_key(self, entity_id: str) -> str:
+        """Return the integration (mesh) an entity's commands are queued under."""
+        if (key := self._lane_of.get(entity_id)) is None:
+            reg_entry = er.async_get(self.hass).async_get(entity_id)
+            key = self._lane_of[entity_id] = reg_entry.platform if reg_entry else DEFAULT_LANE
+        return key
+
+    @callback
+    def async_enqueue(
+        self, entity_id: str, desired_state: str, timeout: float | None, blocking: bool = False
+    ) -> asyncio.Future:
+        """Queue a command and return a future for its confirmation latency.
+
+        timeout None means send only (the future resolves with None once sent).
+        """
+        key = self._async_lane_key(entity_id)
+        lane = self._lanes.setdefault(key, _Lane())
+        limits = self._limits.get(key, {})
+
+        if (existing := lane.pending.get(entity_id)) is not None:
+            if existing.desired_state == desired_state:
+                # Same command already waiting: share it
+                lane.merged += 1
+                existing.blocking = existing.blocking or blocking
+                if timeout is not None:
+                    existing.timeout = max(existing.timeout or 0, timeout)
+                return existing.result
+            # Opposite command: the newer one wins, keeping the queue position
+            lane.superseded += 1
+            if not existing.result.done():
+                existing.result.set_exception(CommandSuperseded(entity_id))
+
+        command = _Command(
+            entity_id, desired_state, timeout, blocking, time.monotonic(), self.hass.loop.create_future()
+        )
+
+        if not limits.get("min_interval") and not limits.get("jitter"):
+            # Unthrottled integration: send right away
+            lane.pending.pop(entity_id, None)
+            self._async_record_wait(lane, command)
+            self.hass.async_create_task(self._async_execute(command))
+            return command.result
+
+        lane.pending[entity_id] = command
+        if lane.worker is None:
+            lane.worker = self.hass.async_create_background_task(
+                self._async_run_lane(key, lane), f"{DOMAIN} actuation {key}"
+            )
+        return command.result
+
+    async def _async_run_lane(self, key: str, lane: _Lane) -> None:
+        """Send a lane's commands in order, spaced by its limits."""
+        try:
+            while lane.pending:
+                limits = self._limits.get(key, {})
+                spacing = limits.get("min_interval", 0) + random.uniform(0, limits.get("jitter", 0))
+                if (delay := lane.last_sent + spacing - time.monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                if not lane.pending:
+                    break
+
+                # Take the oldest switch; it may have been replaced while we slept
+                entity_id = next(iter(lane.pending))
+                command = lane.pending.pop(entity_id)
+                self._async_record_wait(lane, command)
+                await self._async_execute(command)
+                lane.last_sent = time.monotonic()
+        finally:
+            lane.worker = None
+
+    @callback
+    def _async_record_wait(self, lane: _Lane, command: _Command) -> None:
+        """Record how long a command waited in its lane."""
+        waited = time.monotonic() - command.queued_at
+        lane.sent += 1
+        lane.last_wait = waited
+        lane.max_wait = max(lane.max_wait, waited)
+        lane.total_wait += waited
+
+    async def _async_execute(self, command: _Command) -> None:
+        """Send one command; confirmation is awaited in the background."""
+        if command.result.done():
+            return
+        action = "turn_on" if command.desired_state == "on" else "turn_off"
+
+        # Subscribe before calling the service so a fast switch can't be missed
+        changed = unsub = None
+        if command.timeout is not None:
+            changed, unsub = _async_state_future(self.hass, command.entity_id, command.desired_state)
+        started = time.monotonic()
+        try:
+            await self.hass.services.async_call(
+                "homeassistant", action, {"entity_id": command.entity_id}, blocking=command.blocking
+            )
+        except Exception as e:
+            if unsub is not None:
+                unsub()
+            if not command.result.done():
+                command.result.set_exception(e)
+            return
+
+        if changed is None:
+            if not command.result.done():
+                command.result.set_result(None)
+            return
+        self.hass.async_create_task(self._async_confirm(command, changed, unsub, started))
+
+    async def _async_confirm(
+        self, command: _Command, changed: asyncio.Future, unsub: CALLBACK_TYPE, started: float
+    ) -> None:
+        """Resolve a command's result once its state_changed event arrives."""
+        try:
+            confirmed = await _async_await_future(changed, command.timeout)
+        finally:
+            unsub()
+        if not command.result.done():
+            command.result.set_result(time.monotonic() - started if confirmed else None)
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return per-lane depth and wait statistics for diagnostics."""
+        return {
+            key: {
+                "depth": len(lane.pending),
+                "sent": lane.sent,
+                "merged": lane.merged,
+                "superseded": lane.superseded,
+                "last_wait_ms": round(lane.last_wait * 1000, 1),
+                "max_wait_ms": round(lane.max_wait * 1000, 1),
+                "average_wait_ms": round(lane.total_wait / lane.sent * 1000, 1) if lane.sent else 0.0,
+                "limits": self._limits.get(key),
+            }
+            for key, lane in self._lanes.items()
+        }
+
+
+class ActuationStats:
+    """Measured actuation latency per switch."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self._stats: dict[str, dict] = {}
+
+    @callback
+    def async_record(self, entity_id: str, latency: float | None) -> None:
+        """Record one confirmed actuation (latency in seconds) or a timeout (None)."""
+        stats = self._stats.setdefault(
+            entity_id,
+            {"confirmed": 0, "timeouts": 0, "last_ms": None, "average_ms": None, "max_ms": None},
+        )
+        if latency is None:
+            stats["timeouts"] += 1
+            return
+
+        latency_ms = round(latency * 1000, 1)
+        count = stats["confirmed"]
+        stats["confirmed"] = count + 1
+        stats["last_ms"] = latency_ms
+        stats["max_ms"] = max(stats["max_ms"] or 0, latency_ms)
+        previous_avg = stats["average_ms"] or 0
+        stats["average_ms"] = round((previous_avg * count + latency_ms) / (count + 1), 1)
+
+    @callback
+    def async_last_latency_ms(self, entity_id: str | None) -> float | None:
+        """Return the last confirmed latency (ms) for entity_id."""
+        stats = self._stats.get(entity_id) if entity_id else None
+        return stats["last_ms"] if stats else None
+
+    @callback
+    def as_dict(self) -> dict[str, dict]:
+        """Return a copy of all stats for diagnostics."""
+        return {entity_id: dict(stats) for entity_id, stats in self._stats.items()}
+
+
+@callback
+def async_get_actuation_queue(hass: HomeAssistant) -> ActuationQueue:
+    """Return the domain-wide actuation queue, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (queue := domain_data.get(DATA_ACTUATION_QUEUE)) is None:
+        queue = domain_data[DATA_ACTUATION_QUEUE] = ActuationQueue(hass)
+    return queue
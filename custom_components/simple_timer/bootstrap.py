@@ -0,0 +1,118 @@
+"""Domain-level restoration of all Simple Timer sensors after startup.
+
+Sensors register here when added to hass instead of each waiting and
+initializing on its own. Every sensor registered before startup completes is
+restored in one batch: the storage document is loaded once, sensors sharing a
+switch are restored one after the other (so their switch corrections don't
+fight), and different switches are restored concurrently up to a limit.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .programs import async_get_program_runner
+from .reset import async_get_reset_coordinator
+from .startup import async_get_startup_gate
+from .storage import async_get_storage
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_BOOTSTRAP = "bootstrap"
+
+# Switch groups restored at the same time
+RESTORE_CONCURRENCY = 8
+
+
+class TimerBootstrap:
+    """Batch the post-startup initialization of every sensor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bootstrap."""
+        self.hass = hass
+        self._pending: list[TimerRuntimeSensor] = []
+        self._task: asyncio.Task | None = None
+        self._last_restore: dict | None = None
+
+    @callback
+    def async_register(self, sensor: TimerRuntimeSensor) -> None:
+        """Queue a sensor for initialization once startup is ready."""
+        self._pending.append(sensor)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} bootstrap"
+            )
+
+    async def _async_run(self) -> None:
+        """Restore queued sensors in batches until none are left."""
+        try:
+            while self._pending:
+                # Everything registered while core was starting lands in one batch
+                await async_get_startup_gate(self.hass).async_wait(None)
+                batch, self._pending = self._pending, []
+                await self._async_restore(batch)
+        finally:
+            self._task = None
+
+    async def _async_restore(self, sensors: list[TimerRuntimeSensor]) -> None:
+        """Restore one batch of sensors, grouped by switch."""
+        started = time.monotonic()
+        gate = async_get_startup_gate(self.hass)
+        semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+        # One read of the shared document for the whole batch
+        await async_get_storage(self.hass).async_load()
+
+        # Missed daily resets for the whole batch in one pass / one write
+        await async_get_reset_coordinator(self.hass).async_catch_up(sensors)
+
+        groups: dict[str | None, list[TimerRuntimeSensor]] = defaultdict(list)
+        for sensor in sensors:
+            groups[sensor._switch_entity_id].append(sensor)
+
+        async def _async_restore_group(switch_entity_id: str | None, members: list[TimerRuntimeSensor]) -> None:
+            if not await gate.async_wait(switch_entity_id):
+                _LOGGER.warning(f"Simple Timer: Timed out waiting for {switch_entity_id} - initializing anyway")
+            async with semaphore:
+                for sensor in members:
+                    await sensor._complete_initialization()
+
+        await asyncio.gather(
+            *(_async_restore_group(switch, members) for switch, members in groups.items())
+        )
+
+        elapsed = time.monotonic() - started
+        self._last_restore = {
+            "sensors": len(sensors),
+            "switch_groups": len(groups),
+            "duration_s": round(elapsed, 3),
+        }
+        _LOGGER.info(
+            f"Simple Timer: Restored {len(sensors)} timer(s) across {len(groups)} switch group(s) in {elapsed:.2f}s"
+        )
+
+        # Programs drive sensors, so they resume once the first batch is up
+        await async_get_program_runner(self.hass).async_restore()
+
+    @callback
+    def async_get_stats(self) -> dict | None:
+        """Return the last batch's restore statistics for diagnostics."""
+        return self._last_restore
+
+
+@callback
+def async_get_bootstrap(hass: HomeAssistant) -> TimerBootstrap:
+    """Return the domain-wide bootstrap, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (bootstrap := domain_data.get(DATA_BOOTSTRAP)) is None:
+        bootstrap = domain_data[DATA_BOOTSTRAP] = TimerBootstrap(hass)
+    return bootstrap
@@ -8,7 +8,15 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import selector
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    DEFAULT_STATE_WRITE_INTERVAL,
+    MIN_STATE_WRITE_INTERVAL,
+    DEFAULT_NOTIFICATION_WINDOW,
+    DEFAULT_NOTIFICATION_RATE_LIMIT,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_ENERGY_METHOD,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +33,79 @@ def _validate_time_string(time_str: str) -> bool:
     except (ValueError, TypeError):
         return False
 
+def _state_write_interval_selector() -> selector.NumberSelector:
+    """Number selector for the lazy-accumulation write cadence (seconds)."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=MIN_STATE_WRITE_INTERVAL,
+            max=3600,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+def _notification_window_selector() -> selector.NumberSelector:
+    """Number selector for the notification coalescing window (seconds, 0 = off)."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            max=3600,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+def _notification_rate_limit_selector() -> selector.NumberSelector:
+    """Number selector for the per-target notification rate limit (per minute, 0 = off)."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            max=600,
+            step=1,
+            unit_of_measurement="/min",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+def _group_members_selector() -> selector.EntitySelector:
+    """Entity selector for the switches driven together with the main one."""
+    return selector.EntitySelector(
+        selector.EntitySelectorConfig(
+            domain=["switch", "input_boolean", "light", "fan"],
+            multiple=True,
+        )
+    )
+
+def _daily_budget_selector() -> selector.NumberSelector:
+    """Number selector for the daily runtime budget (hours, 0 = off)."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            max=24,
+            step=0.25,
+            unit_of_measurement="h",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
+
+def _power_sensor_selector() -> selector.EntitySelector:
+    """Entity selector for the power sensor energy is integrated from."""
+    return selector.EntitySelector(
+        selector.EntitySelectorConfig(domain="sensor", device_class="power")
+    )
+
+def _energy_method_selector() -> selector.SelectSelector:
+    """Select selector for the Riemann sum method."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=["trapezoidal", "left"],
+            mode=selector.SelectSelectorMode.DROPDOWN,
+            translation_key="energy_method",
+        )
+    )
+
 def _parse_duration_string(duration_str: str) -> tuple[float, str | None]:
     """
     Parse a duration string (e.g., '10', '10s', '1.5h').
@@ -222,6 +303,14 @@ class SimpleTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 selected_notifications = user_input.get("Select one or more notification entity (optional):", [])
                 reset_time_str = user_input.get("reset_time", "00:00")
                 default_duration_input = user_input.get("default_timer_duration", 0.0)
+                lazy_accumulation = user_input.get("lazy_accumulation", False)
+                state_write_interval = int(user_input.get("state_write_interval", DEFAULT_STATE_WRITE_INTERVAL))
+                notification_window = int(user_input.get("notification_window", DEFAULT_NOTIFICATION_WINDOW))
+                notification_rate_limit = int(user_input.get("notification_rate_limit", DEFAULT_NOTIFICATION_RATE_LIMIT))
+                group_members = user_input.get("group_members", [])
+                daily_budget = float(user_input.get("daily_budget", DEFAULT_DAILY_BUDGET))
+                power_sensor = user_input.get("power_sensor") or None
+                energy_method = user_input.get("energy_method", DEFAULT_ENERGY_METHOD)
                 
                 # Parse duration
                 default_duration = 0.0
@@ -261,7 +350,15 @@ class SimpleTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                                 "show_seconds": show_seconds,
                                 "reset_time": reset_time_str,
                                 "default_timer_duration": default_duration,
-                                "default_timer_unit": default_unit
+                                "default_timer_unit": default_unit,
+                                "lazy_accumulation": lazy_accumulation,
+                                "state_write_interval": state_write_interval,
+                                "notification_window": notification_window,
+                                "notification_rate_limit": notification_rate_limit,
+                                "group_members": group_members,
+                                "daily_budget": daily_budget,
+                                "power_sensor": power_sensor,
+                                "energy_method": energy_method
                             }
                         )
                         
@@ -314,6 +411,24 @@ class SimpleTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
         )
         
+        # Lazy accumulation (fewer state writes / recorder rows)
+        schema_dict[vol.Optional("lazy_accumulation", default=False)] = bool
+        schema_dict[vol.Optional("state_write_interval", default=DEFAULT_STATE_WRITE_INTERVAL)] = _state_write_interval_selector()
+
+        # Notification coalescing and rate limiting
+        schema_dict[vol.Optional("notification_window", default=DEFAULT_NOTIFICATION_WINDOW)] = _notification_window_selector()
+        schema_dict[vol.Optional("notification_rate_limit", default=DEFAULT_NOTIFICATION_RATE_LIMIT)] = _notification_rate_limit_selector()
+
+        # Further switches driven together with the main one
+        schema_dict[vol.Optional("group_members", default=[])] = _group_members_selector()
+
+        # Daily runtime cap
+        schema_dict[vol.Optional("daily_budget", default=DEFAULT_DAILY_BUDGET)] = _daily_budget_selector()
+
+        # Energy from a power sensor
+        schema_dict[vol.Optional("power_sensor")] = _power_sensor_selector()
+        schema_dict[vol.Optional("energy_method", default=DEFAULT_ENERGY_METHOD)] = _energy_method_selector()
+
         # Add show_seconds at the bottom
         schema_dict[vol.Optional("show_seconds", default=False)] = bool
 
@@ -422,6 +537,14 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                 selected_notifications = user_input.get("Select one or more notification entity (optional):", [])
                 reset_time_str = user_input.get("reset_time", "00:00")
                 default_duration_input = user_input.get("default_timer_duration", 0.0)
+                lazy_accumulation = user_input.get("lazy_accumulation", False)
+                state_write_interval = int(user_input.get("state_write_interval", DEFAULT_STATE_WRITE_INTERVAL))
+                notification_window = int(user_input.get("notification_window", DEFAULT_NOTIFICATION_WINDOW))
+                notification_rate_limit = int(user_input.get("notification_rate_limit", DEFAULT_NOTIFICATION_RATE_LIMIT))
+                group_members = user_input.get("group_members", [])
+                daily_budget = float(user_input.get("daily_budget", DEFAULT_DAILY_BUDGET))
+                power_sensor = user_input.get("power_sensor") or None
+                energy_method = user_input.get("energy_method", DEFAULT_ENERGY_METHOD)
                 
                 # Parse duration
                 default_duration = 0.0
@@ -458,7 +581,10 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                             errors["switch_entity_id"] = "Entity not found"
                         else:
                             _LOGGER.info(f"Simple Timer: FINAL SUBMIT - Saving with notifications={self._notification_entities}, reset_time={reset_time_str}")
-                            await self._update_config_entry(name, switch_entity_id, show_seconds, reset_time_str, default_duration, default_unit)
+                            await self._update_config_entry(name, switch_entity_id, show_seconds, reset_time_str, default_duration, default_unit,
+                                                            lazy_accumulation, state_write_interval,
+                                                            notification_window, notification_rate_limit, group_members,
+                                                            daily_budget, power_sensor, energy_method)
                             return self.async_create_entry(title="", data={})
                         
             except Exception as e:
@@ -469,9 +595,17 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
         current_name = self.config_entry.data.get("name") or self.config_entry.title or "Timer"
         current_switch_entity = self.config_entry.data.get("switch_entity_id", "")
         current_show_seconds = self.config_entry.data.get("show_seconds", False)
+        current_group_members = self.config_entry.data.get("group_members", [])
+        current_daily_budget = self.config_entry.data.get("daily_budget", DEFAULT_DAILY_BUDGET)
+        current_power_sensor = self.config_entry.data.get("power_sensor")
+        current_energy_method = self.config_entry.data.get("energy_method", DEFAULT_ENERGY_METHOD)
         current_reset_time = self.config_entry.data.get("reset_time", "00:00")
         current_default_duration = self.config_entry.data.get("default_timer_duration", 0.0)
         current_default_unit = self.config_entry.data.get("default_timer_unit", "min")
+        current_lazy_accumulation = self.config_entry.data.get("lazy_accumulation", False)
+        current_state_write_interval = self.config_entry.data.get("state_write_interval", DEFAULT_STATE_WRITE_INTERVAL)
+        current_notification_window = self.config_entry.data.get("notification_window", DEFAULT_NOTIFICATION_WINDOW)
+        current_notification_rate_limit = self.config_entry.data.get("notification_rate_limit", DEFAULT_NOTIFICATION_RATE_LIMIT)
         
         # Format current duration for display
         # Reconstruct "1.5h" or "10" (no unit if min)
@@ -533,6 +667,24 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
             )
         )
         
+        # Lazy accumulation (fewer state writes / recorder rows)
+        schema_dict[vol.Optional("lazy_accumulation", default=current_lazy_accumulation)] = bool
+        schema_dict[vol.Optional("state_write_interval", default=current_state_write_interval)] = _state_write_interval_selector()
+
+        # Notification coalescing and rate limiting
+        schema_dict[vol.Optional("notification_window", default=current_notification_window)] = _notification_window_selector()
+        schema_dict[vol.Optional("notification_rate_limit", default=current_notification_rate_limit)] = _notification_rate_limit_selector()
+
+        # Further switches driven together with the main one
+        schema_dict[vol.Optional("group_members", default=current_group_members)] = _group_members_selector()
+
+        # Daily runtime cap
+        schema_dict[vol.Optional("daily_budget", default=current_daily_budget)] = _daily_budget_selector()
+
+        # Energy from a power sensor (suggested, so it can be cleared)
+        schema_dict[vol.Optional("power_sensor", description={"suggested_value": current_power_sensor})] = _power_sensor_selector()
+        schema_dict[vol.Optional("energy_method", default=current_energy_method)] = _energy_method_selector()
+
         # Add show_seconds at the bottom
         schema_dict[vol.Optional("show_seconds", default=current_show_seconds)] = bool
 
@@ -576,7 +728,14 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                 data=new_data
             )
 
-    async def _update_config_entry(self, name: str, switch_entity_id: str, show_seconds: bool, reset_time: str, default_duration: float, default_unit: str):
+    async def _update_config_entry(self, name: str, switch_entity_id: str, show_seconds: bool, reset_time: str, default_duration: float, default_unit: str,
+                                   lazy_accumulation: bool = False, state_write_interval: int = DEFAULT_STATE_WRITE_INTERVAL,
+                                   notification_window: int = DEFAULT_NOTIFICATION_WINDOW,
+                                   notification_rate_limit: int = DEFAULT_NOTIFICATION_RATE_LIMIT,
+                                   group_members: list[str] | None = None,
+                                   daily_budget: float = DEFAULT_DAILY_BUDGET,
+                                   power_sensor: str | None = None,
+                                   energy_method: str = DEFAULT_ENERGY_METHOD):
         """Update config entry and force immediate sensor sync."""
         new_data = {
             "name": name,
@@ -585,7 +744,15 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
             "show_seconds": show_seconds,
             "reset_time": reset_time,
             "default_timer_duration": default_duration,
-            "default_timer_unit": default_unit
+            "default_timer_unit": default_unit,
+            "lazy_accumulation": lazy_accumulation,
+            "state_write_interval": state_write_interval,
+            "notification_window": notification_window,
+            "notification_rate_limit": notification_rate_limit,
+            "group_members": group_members or [],
+            "daily_budget": daily_budget,
+            "power_sensor": power_sensor,
+            "energy_method": energy_method
         }
         
         _LOGGER.info(f"Simple Timer: Updating entry {self.config_entry.entry_id} with name='{name}', switch='{switch_entity_id}', notifications={self._notification_entities}, show_seconds={show_seconds}, reset_time={reset_time}")
@@ -621,10 +788,13 @@ class SimpleTimerOptionsFlow(config_entries.OptionsFlow):
                     # Method 4: Force default timer config update
                     await sensor._update_default_timer_config()
                     
-                    # Method 5: Force state write
+                    # Method 5: Force accumulation mode update
+                    await sensor._update_accumulation_config()
+
+                    # Method 6: Force state write
                     sensor.async_write_ha_state()
                     
-                    # Method 6: Force entity registry update
+                    # Method 7: Force entity registry update
                     from homeassistant.helpers import entity_registry as er
                     entity_registry = er.async_get(self.hass)
                     if entity_registry:
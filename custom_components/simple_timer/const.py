@@ -10,4 +10,24 @@ PLATFORMS = ["sensor"]
 CARD_URL = "/simple_timer/timer-card.js"
 LEGACY_CARD_URL = "/local/simple-timer/timer-card.js"
 
+# Lazy accumulation: state is computed on read and only written on transitions
+# and at this coarse cadence (seconds)
+DEFAULT_STATE_WRITE_INTERVAL = 60
+MIN_STATE_WRITE_INTERVAL = 10
+
+# Notifications: messages within this window (seconds) are merged into one
+# digest per target, and each target gets at most this many per minute
+# (0 disables either)
+DEFAULT_NOTIFICATION_WINDOW = 0
+DEFAULT_NOTIFICATION_RATE_LIMIT = 20
+
+# Daily runtime budget in hours (0 = no budget)
+DEFAULT_DAILY_BUDGET = 0.0
+
+# Energy from a linked power sensor: Riemann sum method
+DEFAULT_ENERGY_METHOD = "trapezoidal"
+
+# Bulk service calls: targets processed at the same time by default
+DEFAULT_BULK_CONCURRENCY = 10
+
 WARNING_MSG_OFFLINE = "Warning: Home assistant was offline or reloaded during a running timer! Usage time may be unsynchronized."
\ No newline at end of file
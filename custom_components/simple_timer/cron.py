@@ -0,0 +1,245 @@
+"""Cron-style multi-slot schedules for one Simple Timer instance.
+
+A slot is a five-field cron expression (minute hour day-of-month month
+day-of-week) plus the duration of the bounded run it starts. The slots of an
+instance are kept in a ScheduleTable: a min-heap of each slot's next fire time,
+so "what fires next" is answered from the top of the heap and only that one
+deadline needs to be armed. Firing a slot advances just that slot and pushes it
+back onto the heap.
+"""
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+# Field ranges (inclusive) in expression order
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+_MONTH_NAMES = {
+    name: number for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1
+    )
+}
+_DAY_NAMES = {name: number for number, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# Give up looking for a match this far ahead (e.g. "0 0 30 2 *")
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+class CronError(ValueError):
+    """A cron expression that cannot be parsed."""
+
+
+def _parse_field(text: str, index: int) -> tuple[list[int], bool]:
+    """Return the sorted values of one field and whether it was restricted."""
+    low, high = _FIELD_RANGES[index]
+    names = _MONTH_NAMES if index == 3 else _DAY_NAMES if index == 4 else {}
+    values: set[int] = set()
+
+    def _value(token: str) -> int:
+        token = token.lower()
+        if token in names:
+            return names[token]
+        try:
+            number = int(token)
+        except ValueError:
+            raise CronError(f"Invalid value '{token}'") from None
+        if not low <= number <= high:
+            raise CronError(f"Value {number} out of range {low}-{high}")
+        return number
+
+    for part in text.split(","):
+        part, _, step_text = part.partition("/")
+        step = 1
+        if step_text:
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise CronError(f"Invalid step '{step_text}'")
+            step = int(step_text)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, _, end_text = part.partition("-")
+            start, end = _value(start_text), _value(end_text)
+            if start > end:
+                raise CronError(f"Invalid range '{part}'")
+        else:
+            start = _value(part)
+            end = high if step_text else start
+
+        values.update(range(start, end + 1, step))
+
+    if index == 4 and 7 in values:
+        # Both 0 and 7 mean Sunday
+        values.discard(7)
+        values.add(0)
+
+    return sorted(values), text != "*"
+
+
+class CronExpression:
+    """A parsed five-field cron expression evaluated in local time."""
+
+    __slots__ = ("expression", "_minutes", "_hours", "_days", "_months", "_weekdays", "_day_restricted", "_weekday_restricted")
+
+    def __init__(self, expression: str) -> None:
+        """Parse the expression; raises CronError if it is invalid."""
+        fields = expression.split()
+        if len(fields) != 5:
+            raise CronError(f"Expected 5 fields, got {len(fields)}: '{expression}'")
+        self.expression = " ".join(fields)
+        self._minutes, _ = _parse_field(fields[0], 0)
+        self._hours, _ = _parse_field(fields[1], 1)
+        days, self._day_restricted = _parse_field(fields[2], 2)
+        self._months = set(_parse_field(fields[3], 3)[0])
+        weekdays, self._weekday_restricted = _parse_field(fields[4], 4)
+        self._days = set(days)
+        # Store as Python weekdays (Mon=0)
+        self._weekdays = {(day - 1) % 7 for day in weekdays}
+
+    def _day_matches(self, candidate: datetime) -> bool:
+        """Apply cron's rule: if both day fields are restricted, either may match."""
+        day_ok = candidate.day in self._days
+        weekday_ok = candidate.weekday() in self._weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime | None:
+        """Return the first matching minute strictly after `after` (same tzinfo)."""
+        tzinfo = after.tzinfo
+        candidate = after.replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self._months or not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            hour_index = bisect_left(self._hours, candidate.hour)
+            if hour_index == len(self._hours):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if self._hours[hour_index] != candidate.hour:
+                candidate = candidate.replace(hour=self._hours[hour_index], minute=0)
+
+            minute_index = bisect_left(self._minutes, candidate.minute)
+            if minute_index == len(self._minutes):
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return candidate.replace(minute=self._minutes[minute_index], tzinfo=tzinfo)
+
+        return None
+
+    def __repr__(self) -> str:
+        """Return the normalized expression."""
+        return f"CronExpression('{self.expression}')"
+
+
+@dataclass(slots=True)
+class ScheduleSlot:
+    """One start slot: when it fires and how long the bounded run lasts."""
+
+    slot_id: str
+    cron: CronExpression
+    duration: float
+    unit: str = "min"
+    next_fire: datetime | None = None
+
+    def as_attribute(self) -> dict:
+        """Return the slot as exposed in the sensor's attributes."""
+        return {
+            "id": self.slot_id,
+            "cron": self.cron.expression,
+            "duration": self.duration,
+            "unit": self.unit,
+            "next_start": self.next_fire.isoformat() if self.next_fire else None,
+        }
+
+
+@dataclass
+class ScheduleTable:
+    """The slots of one instance, indexed by next fire time."""
+
+    slots: dict[str, ScheduleSlot] = field(default_factory=dict)
+    # (timestamp, sequence, slot_id); entries whose slot moved or was removed are stale
+    _heap: list[tuple[float, int, str]] = field(default_factory=list, init=False, repr=False)
+    _sequence: int = field(default=0, init=False, repr=False)
+    # Bumped on every change so the sensor can cache its attributes
+    version: int = field(default=0, init=False)
+
+    def add(self, slot: ScheduleSlot, now: datetime) -> None:
+        """Add or replace a slot and index its next fire after now."""
+        self.slots[slot.slot_id] = slot
+        self._advance(slot, now)
+
+    def remove(self, slot_id: str) -> bool:
+        """Remove a slot; its heap entry is dropped lazily. False if unknown."""
+        if self.slots.pop(slot_id, None) is None:
+            return False
+        self.version += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove every slot."""
+        self.slots.clear()
+        self._heap.clear()
+        self.version += 1
+
+    def reindex(self, now: datetime) -> None:
+        """Recompute every slot's next fire from now (restore, time jumps)."""
+        self._heap.clear()
+        for slot in self.slots.values():
+            self._advance(slot, now)
+
+    def _advance(self, slot: ScheduleSlot, after: datetime) -> None:
+        """Move a slot to its next fire after `after` and push it onto the heap."""
+        slot.next_fire = slot.cron.next_after(after)
+        self.version += 1
+        if slot.next_fire is not None:
+            self._sequence += 1
+            heapq.heappush(self._heap, (slot.next_fire.timestamp(), self._sequence, slot.slot_id))
+
+    def _is_live(self, entry: tuple[float, int, str]) -> bool:
+        """Return True if a heap entry is the current one for an existing slot."""
+        timestamp, _, slot_id = entry
+        slot = self.slots.get(slot_id)
+        return slot is not None and slot.next_fire is not None and slot.next_fire.timestamp() == timestamp
+
+    def peek(self) -> ScheduleSlot | None:
+        """Return the slot that fires next, discarding stale heap entries."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self.slots[self._heap[0][2]] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[ScheduleSlot]:
+        """Return every slot due at or before now and advance each past now."""
+        due: list[ScheduleSlot] = []
+        timestamp = now.timestamp()
+        while (slot := self.peek()) is not None and self._heap[0][0] <= timestamp:
+            heapq.heappop(self._heap)
+            due.append(slot)
+            self._advance(slot, now)
+        return due
+
+    def as_storage(self) -> list[list]:
+        """Return the compact stored form: [[id, cron, duration, unit], ...]."""
+        return [
+            [slot.slot_id, slot.cron.expression, slot.duration, slot.unit]
+            for slot in self.slots.values()
+        ]
+
+    @classmethod
+    def from_storage(cls, stored: list[list], now: datetime) -> ScheduleTable:
+        """Rebuild a table from its stored form, skipping invalid rows."""
+        table = cls()
+        for row in stored or []:
+            try:
+                slot_id, expression, duration, unit = row
+                table.add(ScheduleSlot(slot_id, CronExpression(expression), float(duration), unit), now)
+            except (CronError, TypeError, ValueError):
+                continue
+        return table
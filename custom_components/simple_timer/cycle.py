@@ -0,0 +1,63 @@
+"""Duty-cycle (pulse) mode: on for a while, off for a while, N times.
+
+The whole cycle is a pure function of its start time, so only the start and
+the three parameters are persisted. The current phase, and when it ends, is
+computed from the clock, which lets a restart resume in the right phase with
+no per-phase writes.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+PHASE_ON = "on"
+PHASE_OFF = "off"
+PHASE_DONE = "done"
+
+
+class CyclePhase(NamedTuple):
+    """Where a cycle is at a given moment."""
+
+    phase: str
+    repeat: int               # 1-based repeat the phase belongs to
+    ends_at: datetime | None  # None once done
+
+
+@dataclass(slots=True)
+class DutyCycle:
+    """On/off durations (seconds) and repeat count, anchored at a start time."""
+
+    started_at: datetime
+    on_seconds: float
+    off_seconds: float
+    repeats: int
+
+    @property
+    def finishes_at(self) -> datetime:
+        """Return when the last on phase ends (the trailing off phase is skipped)."""
+        period = self.on_seconds + self.off_seconds
+        return self.started_at + timedelta(seconds=(self.repeats - 1) * period + self.on_seconds)
+
+    def phase_at(self, now: datetime) -> CyclePhase:
+        """Return the phase at now."""
+        if now >= self.finishes_at:
+            return CyclePhase(PHASE_DONE, self.repeats, None)
+
+        period = self.on_seconds + self.off_seconds
+        elapsed = max(0.0, (now - self.started_at).total_seconds())
+        index, into = divmod(elapsed, period)
+        period_start = self.started_at + timedelta(seconds=index * period)
+        if into < self.on_seconds:
+            return CyclePhase(PHASE_ON, int(index) + 1, period_start + timedelta(seconds=self.on_seconds))
+        return CyclePhase(PHASE_OFF, int(index) + 1, period_start + timedelta(seconds=period))
+
+    def as_storage(self) -> list:
+        """Return the compact stored form: [started_at, on_s, off_s, repeats]."""
+        return [self.started_at.isoformat(), self.on_seconds, self.off_seconds, self.repeats]
+
+    @classmethod
+    def from_storage(cls, stored: list) -> DutyCycle:
+        """Rebuild a cycle from its stored form; raises ValueError/TypeError if invalid."""
+        started_at, on_seconds, off_seconds, repeats = stored
+        return cls(datetime.fromisoformat(started_at), float(on_seconds), float(off_seconds), int(repeats))
@@ -0,0 +1,191 @@
+"""Domain-owned deadline heap for timer completions and scheduled starts.
+
+Every instance's deadlines live in one min-heap, and only the earliest one has
+a Home Assistant point-in-time listener armed. Rescheduling (add_timer) pushes
+a new heap entry and invalidates the old one lazily, so it is O(log n) and
+never touches HA's scheduler unless the earliest deadline changes. Deadlines
+due by the time the listener fires run in one batch; none fires early.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+from datetime import datetime
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DEADLINES = "deadlines"
+
+# Rebuild the heap when stale (cancelled/rescheduled) entries outnumber live
+# ones by this factor
+COMPACT_RATIO = 2
+
+
+class DeadlineHandle:
+    """A scheduled deadline. Calling the handle cancels it."""
+
+    __slots__ = ("_scheduler", "when", "job", "generation", "active")
+
+    def __init__(self, scheduler: DeadlineScheduler, when: datetime, job: HassJob) -> None:
+        """Initialize the handle."""
+        self._scheduler = scheduler
+        self.when = when
+        self.job = job
+        self.generation = 0
+        self.active = True
+
+    def __call__(self) -> None:
+        """Cancel the deadline (no-op once fired or cancelled)."""
+        if self.active:
+            self.active = False
+            # Its heap entry is now stale and is dropped lazily
+            self._scheduler._stale += 1
+
+
+class DeadlineScheduler:
+    """Min-heap of deadlines behind a single armed HA timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # (timestamp, sequence, generation, handle)
+        self._heap: list[tuple[float, int, int, DeadlineHandle]] = []
+        self._sequence = 0
+        self._stale = 0
+        self._unsub_armed: CALLBACK_TYPE | None = None
+        self._armed_at: float | None = None
+
+        # Statistics for diagnostics
+        self._fired = 0
+        self._batches = 0
+        self._max_batch = 0
+        self._rearms = 0
+
+    @callback
+    def async_schedule(self, when: datetime, action: Callable[[datetime], Any]) -> DeadlineHandle:
+        """Call action(now) at when; returns a handle that cancels it when called."""
+        handle = DeadlineHandle(self, when, HassJob(action, f"{DOMAIN} deadline"))
+        self._async_push(handle)
+        return handle
+
+    @callback
+    def async_reschedule(self, handle: DeadlineHandle, when: datetime) -> DeadlineHandle:
+        """Move an existing deadline; the old heap entry is dropped lazily."""
+        if handle.active:
+            self._stale += 1
+        handle.when = when
+        handle.generation += 1
+        handle.active = True
+        self._async_push(handle)
+        return handle
+
+    @callback
+    def _async_push(self, handle: DeadlineHandle) -> None:
+        """Add a heap entry for handle and re-arm if it is the new earliest."""
+        timestamp = dt_util.as_timestamp(handle.when)
+        self._sequence += 1
+        heapq.heappush(self._heap, (timestamp, self._sequence, handle.generation, handle))
+
+        if self._stale > 16 and self._stale > COMPACT_RATIO * self._live_count():
+            self._async_compact()
+
+        if self._armed_at is None or timestamp < self._armed_at:
+            self._async_arm()
+
+    def _live_count(self) -> int:
+        """Return the number of heap entries that will still fire."""
+        return len(self._heap) - self._stale
+
+    @staticmethod
+    def _is_live(entry: tuple[float, int, int, DeadlineHandle]) -> bool:
+        """Return True if a heap entry is the current, uncancelled one for its handle."""
+        _, _, generation, handle = entry
+        return handle.active and generation == handle.generation
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop stale entries from the heap."""
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the single HA timer for the earliest live deadline."""
+        # Discard stale entries at the top so we don't wake up for nothing
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+            self._stale -= 1
+
+        if self._unsub_armed is not None:
+            self._unsub_armed()
+            self._unsub_armed = None
+            self._armed_at = None
+
+        if not self._heap:
+            return
+
+        timestamp = self._heap[0][0]
+        self._armed_at = timestamp
+        self._rearms += 1
+        self._unsub_armed = async_track_point_in_utc_time(
+            self.hass, self._async_handle_fire, dt_util.utc_from_timestamp(timestamp)
+        )
+
+    @callback
+    def _async_handle_fire(self, now: datetime) -> None:
+        """Fire every deadline due by now, then re-arm for the next."""
+        self._unsub_armed = None
+        self._armed_at = None
+        now_timestamp = dt_util.as_timestamp(now)
+
+        due: list[DeadlineHandle] = []
+        while self._heap and self._heap[0][0] <= now_timestamp:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                entry[3].active = False
+                due.append(entry[3])
+            else:
+                self._stale -= 1
+
+        for handle in due:
+            try:
+                self.hass.async_run_hass_job(handle.job, now)
+            except Exception as e:
+                _LOGGER.error(f"Simple Timer: Deadline callback failed: {e}")
+
+        if due:
+            self._fired += len(due)
+            self._batches += 1
+            self._max_batch = max(self._max_batch, len(due))
+
+        self._async_arm()
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return heap and firing statistics for diagnostics."""
+        return {
+            "heap_size": len(self._heap),
+            "pending": self._live_count(),
+            "next_deadline": dt_util.utc_from_timestamp(self._armed_at).isoformat() if self._armed_at else None,
+            "fired": self._fired,
+            "batches": self._batches,
+            "max_batch": self._max_batch,
+            "rearms": self._rearms,
+        }
+
+
+@callback
+def async_get_deadline_scheduler(hass: HomeAssistant) -> DeadlineScheduler:
+    """Return the domain-wide deadline scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_DEADLINES)) is None:
+        scheduler = domain_data[DATA_DEADLINES] = DeadlineScheduler(hass)
+    return scheduler
@@ -0,0 +1,54 @@
+"""Diagnostics support for Simple Timer."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .actuation import async_get_actuation_queue
+from .bootstrap import async_get_bootstrap
+from .deadlines import async_get_deadline_scheduler
+from .const import DOMAIN
+from .index import async_get_timer_index
+from .journal import async_get_session_journal
+from .notifications import async_get_notification_dispatcher
+from .programs import async_get_program_runner
+from .reset import async_get_reset_coordinator
+from .statistics import async_get_statistics_publisher
+from .tick import async_get_tick_hub
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    sensor = entry_data.get("sensor") if isinstance(entry_data, dict) else None
+
+    sensor_info = None
+    if sensor is not None:
+        sensor_info = {
+            "entity_id": sensor.entity_id,
+            "state": sensor.native_value,
+            "attributes": sensor.extra_state_attributes,
+            "accumulating": sensor._accumulating,
+            "counting_down": sensor._counting_down,
+            "actuation": sensor._actuation_stats.as_dict(),
+        }
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+        },
+        "sensor": sensor_info,
+        "tick_hub": async_get_tick_hub(hass).async_get_stats(),
+        "last_restore": async_get_bootstrap(hass).async_get_stats(),
+        "notifications": async_get_notification_dispatcher(hass).async_get_stats(),
+        "index": async_get_timer_index(hass).async_get_stats(),
+        "actuation_queue": async_get_actuation_queue(hass).async_get_stats(),
+        "deadlines": async_get_deadline_scheduler(hass).async_get_stats(),
+        "daily_reset": async_get_reset_coordinator(hass).async_get_stats(),
+        "programs": async_get_program_runner(hass).async_get_stats(),
+        "statistics": async_get_statistics_publisher(hass).async_get_stats(),
+        "journal": async_get_session_journal(hass).async_get_stats(),
+    }
@@ -0,0 +1,91 @@
+"""Energy (kWh) integrated from a linked power sensor's state changes.
+
+Power is only integrated while the timer's switch is on, so the energy covers
+the same sessions as the runtime. Each power change adds the area since the
+previous sample (trapezoidal or left Riemann sum); between samples the last
+value is held, which is also how a session is closed when the switch turns
+off. Nothing is polled.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.const import UnitOfPower
+
+METHOD_TRAPEZOIDAL = "trapezoidal"
+METHOD_LEFT = "left"
+METHODS = (METHOD_TRAPEZOIDAL, METHOD_LEFT)
+
+# Power units understood, as factors to watts
+_POWER_FACTORS = {
+    UnitOfPower.WATT: 1.0,
+    UnitOfPower.KILO_WATT: 1000.0,
+}
+
+
+def power_to_watts(state: str, unit: str | None) -> float | None:
+    """Return a power state in watts, or None if it is not a usable number."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    factor = _POWER_FACTORS.get(unit or UnitOfPower.WATT)
+    return value * factor if factor is not None else None
+
+
+class EnergyIntegrator:
+    """Running Riemann sum of power (W) over time, in kWh."""
+
+    __slots__ = ("method", "energy", "active", "_power", "_since")
+
+    def __init__(self, method: str = METHOD_TRAPEZOIDAL, energy: float = 0.0) -> None:
+        """Initialize the integrator."""
+        self.method = method if method in METHODS else METHOD_TRAPEZOIDAL
+        self.energy = energy
+        self.active = False
+        self._power: float | None = None
+        self._since: datetime | None = None
+
+    def start(self, when: datetime, power: float | None) -> None:
+        """Begin a session at when with the current power (None if unknown)."""
+        if self.active:
+            return
+        self.active = True
+        self._power = power
+        self._since = when
+
+    def stop(self, when: datetime) -> None:
+        """End the session, holding the last power up to when."""
+        if not self.active:
+            return
+        self._add(when, self._power)
+        self.active = False
+        self._power = None
+        self._since = None
+
+    def sample(self, when: datetime, power: float | None) -> bool:
+        """Add a new power value; returns True if the energy changed."""
+        if not self.active:
+            return False
+        before = self.energy
+        self._add(when, power)
+        self._power = power
+        self._since = when
+        return self.energy != before
+
+    def reset(self, when: datetime) -> None:
+        """Start counting from zero at when."""
+        self.energy = 0.0
+        if self.active:
+            self._since = when
+
+    def _add(self, when: datetime, power: float | None) -> None:
+        """Add the area from the previous sample to when."""
+        if self._power is None or self._since is None or when <= self._since:
+            return
+        hours = (when - self._since).total_seconds() / 3600
+        if self.method == METHOD_TRAPEZOIDAL and power is not None:
+            watts = (self._power + power) / 2
+        else:
+            watts = self._power
+        self.energy += max(0.0, watts) * hours / 1000
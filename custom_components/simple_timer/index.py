@@ -0,0 +1,163 @@
+"""In-memory index from entity_id / entry_id to the live Simple Timer sensor.
+
+Service calls resolve their target with a single dict lookup instead of an
+entity-registry query plus a walk through hass.data. The index is kept current
+from entity-registry update events (renames, removals) and from sensors being
+added to and removed from hass.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_INDEX = "index"
+
+
+class TimerIndex:
+    """Map entity_id -> entry_id and entry_id -> loaded sensor."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._sensors: dict[str, TimerRuntimeSensor] = {}
+        self._entry_ids: dict[str, str] = {}
+
+        # Lookup counters for diagnostics
+        self._lookups = 0
+        self._misses = 0
+        self._registry_updates = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Index the registry's Simple Timer entities and follow its updates."""
+        registry = er.async_get(self.hass)
+        for reg_entry in registry.entities.values():
+            if reg_entry.platform == DOMAIN and reg_entry.config_entry_id:
+                self._entry_ids[reg_entry.entity_id] = reg_entry.config_entry_id
+
+        self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_handle_registry_update
+        )
+
+    @callback
+    def _async_handle_registry_update(self, event: Event) -> None:
+        """Track created, renamed and removed Simple Timer entities."""
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+
+        if action == "remove":
+            if self._entry_ids.pop(entity_id, None) is not None:
+                self._registry_updates += 1
+            return
+
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._entry_ids.pop(old_entity_id, None)
+
+        reg_entry = er.async_get(self.hass).async_get(entity_id)
+        if reg_entry is None or reg_entry.platform != DOMAIN or not reg_entry.config_entry_id:
+            return
+        self._entry_ids[entity_id] = reg_entry.config_entry_id
+        self._registry_updates += 1
+
+    @callback
+    def async_add_sensor(self, entry_id: str, sensor: TimerRuntimeSensor) -> None:
+        """Register a sensor once it is added to hass."""
+        self._sensors[entry_id] = sensor
+        if sensor.entity_id:
+            self._entry_ids[sensor.entity_id] = entry_id
+
+    @callback
+    def async_remove_sensor(self, entry_id: str) -> None:
+        """Forget the sensor of an unloaded entry (its entity mapping stays valid)."""
+        self._sensors.pop(entry_id, None)
+
+    @callback
+    def async_resolve(self, entry_id: str | None, entity_id: str | None) -> tuple[str, str]:
+        """Return (config_entry_id, human_label) from entry_id or entity_id."""
+        if entry_id:
+            return entry_id, f"entry_id: {entry_id}"
+
+        self._lookups += 1
+        if (resolved := self._entry_ids.get(entity_id)) is not None:
+            return resolved, f"entity_id: {entity_id}"
+
+        # Not indexed: fall back to the registry for a precise error
+        self._misses += 1
+        reg_entry = er.async_get(self.hass).async_get(entity_id)
+        if reg_entry is None or reg_entry.platform != DOMAIN:
+            raise ServiceValidationError(
+                f"'{entity_id}' is not a Simple Timer entity"
+            )
+        if reg_entry.config_entry_id is None:
+            raise ServiceValidationError(
+                f"'{entity_id}' has no associated config entry"
+            )
+        self._entry_ids[entity_id] = reg_entry.config_entry_id
+        return reg_entry.config_entry_id, f"entity_id: {entity_id}"
+
+    @callback
+    def async_match_entities(self, area_ids: list[str], label_ids: list[str]) -> list[str]:
+        """Return indexed entities in any of the areas or carrying any of the labels.
+
+        The entity's own area/labels are used, falling back to its device's
+        area and including its device's labels.
+        """
+        areas = set(area_ids)
+        labels = set(label_ids)
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
+
+        matched = []
+        for entity_id in self._entry_ids:
+            if (reg_entry := entity_registry.async_get(entity_id)) is None:
+                continue
+            device = device_registry.async_get(reg_entry.device_id) if reg_entry.device_id else None
+
+            area_id = reg_entry.area_id or (device.area_id if device else None)
+            entity_labels = set(reg_entry.labels) | (set(device.labels) if device else set())
+            if (area_id and area_id in areas) or entity_labels & labels:
+                matched.append(entity_id)
+        return matched
+
+    @callback
+    def async_get_sensor(self, entry_id: str, label: str) -> TimerRuntimeSensor:
+        """Return the loaded sensor for entry_id or raise a clear error."""
+        self._lookups += 1
+        if (sensor := self._sensors.get(entry_id)) is None:
+            self._misses += 1
+            raise ServiceValidationError(
+                f"No Simple Timer sensor loaded for {label}"
+            )
+        return sensor
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return index size and lookup counters for diagnostics."""
+        return {
+            "sensors": len(self._sensors),
+            "entities": len(self._entry_ids),
+            "lookups": self._lookups,
+            "misses": self._misses,
+            "registry_updates": self._registry_updates,
+        }
+
+
+@callback
+def async_get_timer_index(hass: HomeAssistant) -> TimerIndex:
+    """Return the domain-wide index, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (index := domain_data.get(DATA_INDEX)) is None:
+        index = domain_data[DATA_INDEX] = TimerIndex(hass)
+        index.async_setup()
+    return index
@@ -0,0 +1,236 @@
+"""Append-only journal of finished timer runs, compacted on a rolling schedule.
+
+Every finished or cancelled run of an instance is appended as one compact row
+(start, end, mode, start method, planned duration, actual runtime, outcome).
+Recent runs are kept individually; once a day, runs older than
+RUN_RETENTION_DAYS are folded into per-day totals and days older than
+DAY_RETENTION_DAYS into per-week totals, so the journal stays small however
+long it runs. Everything lives in memory and in its own storage file (written
+debounced), so queries never touch the recorder.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_JOURNAL = "journal"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}_journal"
+
+# Delay before appended runs are written (seconds)
+SAVE_DELAY = 30
+
+RUN_RETENTION_DAYS = 35
+DAY_RETENTION_DAYS = 182
+WEEK_RETENTION_WEEKS = 156
+
+# Local time of the daily compaction
+COMPACT_HOUR = 3
+COMPACT_MINUTE = 15
+
+# Compact row layouts
+RUN_FIELDS = ("start", "end", "mode", "start_method", "duration", "runtime", "outcome")
+TOTAL_FIELDS = ("runs", "runtime", "duration")
+
+
+def _local_date(timestamp: float) -> date:
+    """Return the local date of a UTC timestamp."""
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+
+
+def _fold(totals: dict[str, list], key: str, runs: int, runtime: float, duration: float) -> None:
+    """Add one run (or one aggregate) to the [runs, runtime, duration] total of key."""
+    total = totals.setdefault(key, [0, 0, 0])
+    total[0] += runs
+    total[1] += runtime
+    total[2] += duration
+
+
+class SessionJournal:
+    """Per-instance run journals in one storage file."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, dict[str, list]] | None = None
+        self._load_lock = asyncio.Lock()
+        self._compact_unsub: CALLBACK_TYPE | None = None
+        self._last_compaction: dict | None = None
+
+    async def async_load(self) -> None:
+        """Read the journal once and start the daily compaction if it isn't running."""
+        await self._async_read()
+        if self._compact_unsub is not None:
+            return
+        self._compact_unsub = async_track_time_change(
+            self.hass, self._async_compact_time_reached,
+            hour=COMPACT_HOUR, minute=COMPACT_MINUTE, second=0,
+        )
+        self.async_compact()
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop the daily compaction (the last instance was unloaded)."""
+        if self._compact_unsub is not None:
+            self._compact_unsub()
+            self._compact_unsub = None
+
+    async def _async_read(self) -> None:
+        """Read the journal from storage once."""
+        if self._data is not None:
+            return
+        async with self._load_lock:
+            if self._data is not None:
+                return
+            try:
+                data = await self._store.async_load()
+            except Exception as e:
+                _LOGGER.error(f"Simple Timer: Error loading session journal: {e}")
+                data = None
+            self._data = data if isinstance(data, dict) else {}
+
+    def _journal(self, entry_id: str) -> dict[str, list]:
+        """Return the journal of one instance, creating it if needed."""
+        return self._data.setdefault(entry_id, {"runs": [], "days": [], "weeks": []})
+
+    async def async_append(
+        self,
+        entry_id: str,
+        start: datetime,
+        end: datetime,
+        mode: str,
+        start_method: str | None,
+        duration: float,
+        runtime: float,
+        outcome: str,
+    ) -> None:
+        """Append one finished run."""
+        await self.async_load()
+        self._journal(entry_id)["runs"].append([
+            int(start.timestamp()), int(end.timestamp()), mode, start_method,
+            round(duration), round(runtime), outcome,
+        ])
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Drop the journal of a removed instance."""
+        await self._async_read()
+        if self._data.pop(entry_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_compact_time_reached(self, now: datetime) -> None:
+        """Run the daily compaction."""
+        self.async_compact()
+
+    @callback
+    def async_compact(self) -> None:
+        """Fold old runs into day totals and old days into week totals."""
+        if self._data is None:
+            return
+        today = dt_util.now().date()
+        run_cutoff = dt_util.as_utc(dt_util.start_of_local_day(today - timedelta(days=RUN_RETENTION_DAYS))).timestamp()
+        day_cutoff = today - timedelta(days=DAY_RETENTION_DAYS)
+        week_cutoff = today - timedelta(weeks=WEEK_RETENTION_WEEKS)
+        folded_runs = folded_days = 0
+
+        for journal in self._data.values():
+            old_runs = [run for run in journal["runs"] if run[0] < run_cutoff]
+            if old_runs:
+                journal["runs"] = [run for run in journal["runs"] if run[0] >= run_cutoff]
+                days = {row[0]: row[1:] for row in journal["days"]}
+                for run in old_runs:
+                    _fold(days, _local_date(run[0]).isoformat(), 1, run[5], run[4])
+                journal["days"] = [[key, *total] for key, total in sorted(days.items())]
+                folded_runs += len(old_runs)
+
+            old_days = [row for row in journal["days"] if date.fromisoformat(row[0]) < day_cutoff]
+            if old_days:
+                journal["days"] = [row for row in journal["days"] if date.fromisoformat(row[0]) >= day_cutoff]
+                weeks = {row[0]: row[1:] for row in journal["weeks"]}
+                for key, runs, runtime, duration in old_days:
+                    day = date.fromisoformat(key)
+                    _fold(weeks, (day - timedelta(days=day.weekday())).isoformat(), runs, runtime, duration)
+                journal["weeks"] = [[key, *total] for key, total in sorted(weeks.items())]
+                folded_days += len(old_days)
+
+            journal["weeks"] = [row for row in journal["weeks"] if date.fromisoformat(row[0]) >= week_cutoff]
+
+        self._last_compaction = {
+            "at": dt_util.utcnow().isoformat(),
+            "runs_folded": folded_runs,
+            "days_folded": folded_days,
+        }
+        if folded_runs or folded_days:
+            _LOGGER.info(f"Simple Timer: Journal compaction folded {folded_runs} run(s) and {folded_days} day(s)")
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_query(self, entry_id: str, days: int) -> dict[str, Any]:
+        """Return the runs, day totals and week totals of the last `days` days, newest first."""
+        journal = (self._data or {}).get(entry_id, {"runs": [], "days": [], "weeks": []})
+        since = dt_util.now() - timedelta(days=days)
+        since_timestamp = since.timestamp()
+        since_date = since.date()
+        since_week = since_date - timedelta(days=since_date.weekday())
+
+        runs = []
+        for row in reversed(journal["runs"]):
+            if row[1] < since_timestamp:
+                # Rows are appended in end order
+                break
+            run = dict(zip(RUN_FIELDS, row))
+            run["start"] = dt_util.utc_from_timestamp(run["start"]).isoformat()
+            run["end"] = dt_util.utc_from_timestamp(run["end"]).isoformat()
+            runs.append(run)
+
+        return {
+            "runs": runs,
+            "days": [
+                {"date": row[0], **dict(zip(TOTAL_FIELDS, row[1:]))}
+                for row in reversed(journal["days"]) if date.fromisoformat(row[0]) >= since_date
+            ],
+            "weeks": [
+                {"week": row[0], **dict(zip(TOTAL_FIELDS, row[1:]))}
+                for row in reversed(journal["weeks"]) if date.fromisoformat(row[0]) >= since_week
+            ],
+        }
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the journal to persist."""
+        return self._data or {}
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return journal sizes and the last compaction for diagnostics."""
+        data = self._data or {}
+        return {
+            "instances": len(data),
+            "runs": sum(len(journal["runs"]) for journal in data.values()),
+            "days": sum(len(journal["days"]) for journal in data.values()),
+            "weeks": sum(len(journal["weeks"]) for journal in data.values()),
+            "last_compaction": self._last_compaction,
+        }
+
+
+@callback
+def async_get_session_journal(hass: HomeAssistant) -> SessionJournal:
+    """Return the domain-wide session journal, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (journal := domain_data.get(DATA_JOURNAL)) is None:
+        journal = domain_data[DATA_JOURNAL] = SessionJournal(hass)
+    return journal
@@ -0,0 +1,274 @@
+"""Background notification delivery for all Simple Timer instances.
+
+Sensors enqueue a message and return immediately; a small pool of workers
+delivers queued messages concurrently and fans each one out to its targets in
+parallel, each bounded by a timeout, so a slow notify endpoint never delays
+timer completion or the other targets.
+
+Before queuing, messages are coalesced per instance and target: everything
+arriving within the instance's coalescing window, or while the target is over
+its per-minute rate limit, is merged into one digest.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_NOTIFICATIONS = "notifications"
+
+# Messages waiting for delivery; further messages are dropped when full
+QUEUE_SIZE = 50
+
+# Messages delivered at the same time
+WORKER_COUNT = 4
+
+# Longest a single target may take to accept a notification (seconds)
+TARGET_TIMEOUT = 10.0
+
+# Sliding window the per-target rate limit applies to (seconds)
+RATE_LIMIT_PERIOD = 60.0
+
+# Most recent messages listed in a digest; older ones are only counted
+DIGEST_MAX_LINES = 10
+
+
+@dataclass(slots=True)
+class Notification:
+    """One message for one instance's configured targets."""
+
+    entry_id: str
+    title: str
+    message: str
+    targets: list[str]
+
+
+@dataclass(slots=True)
+class _PendingDigest:
+    """Messages held back for one instance/target pair."""
+
+    title: str
+    messages: list[str] = field(default_factory=list)
+    unsub_flush: CALLBACK_TYPE | None = None
+
+
+class NotificationDispatcher:
+    """Bounded queue plus workers delivering notifications concurrently."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._queue: asyncio.Queue[Notification] = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._workers: set[asyncio.Task] = set()
+        self._dropped = 0
+        self._coalesced = 0
+        self._rate_limited = 0
+        self._target_stats: dict[str, dict] = {}
+        self._pending: dict[tuple[str, str], _PendingDigest] = {}
+        self._sent_times: dict[tuple[str, str], deque[float]] = {}
+
+    @callback
+    def async_notify(
+        self,
+        entry_id: str,
+        title: str,
+        message: str,
+        targets: list[str],
+        window: float = 0,
+        rate_limit: int = 0,
+    ) -> None:
+        """Coalesce a message per target and queue it when its window closes.
+
+        window is the coalescing window in seconds (0 sends right away unless
+        rate limited); rate_limit is the most messages per target per minute
+        (0 for unlimited).
+        """
+        # Targets whose digest is due now and identical share one queue item
+        due: dict[tuple[str, str], list[str]] = {}
+        for target in targets:
+            key = (entry_id, target)
+            if (pending := self._pending.get(key)) is None:
+                pending = self._pending[key] = _PendingDigest(title)
+            else:
+                self._coalesced += 1
+            pending.title = title
+            pending.messages.append(message)
+
+            if pending.unsub_flush is None and (digest := self._async_flush_or_schedule(key, window, rate_limit)):
+                due.setdefault(digest, []).append(target)
+
+        for (digest_title, body), due_targets in due.items():
+            self.async_enqueue(Notification(entry_id, digest_title, body, due_targets))
+
+    @callback
+    def _async_flush_or_schedule(self, key: tuple[str, str], delay: float, rate_limit: int) -> tuple[str, str] | None:
+        """Return a pending digest's (title, body) if it may be sent now, otherwise arm its flush timer."""
+        pending = self._pending[key]
+        if delay <= 0:
+            delay = self._rate_limit_delay(key, rate_limit)
+            if delay > 0:
+                self._rate_limited += 1
+                _LOGGER.debug(f"Simple Timer: [{key[0]}] Rate limit reached for {key[1]} - holding messages for {delay:.0f}s")
+
+        if delay > 0:
+            @callback
+            def _async_flush(_now: datetime) -> None:
+                pending.unsub_flush = None
+                if digest := self._async_flush_or_schedule(key, 0, rate_limit):
+                    self.async_enqueue(Notification(key[0], *digest, [key[1]]))
+
+            pending.unsub_flush = async_call_later(self.hass, delay, _async_flush)
+            return None
+
+        del self._pending[key]
+        if rate_limit > 0:
+            self._sent_times.setdefault(key, deque()).append(time.monotonic())
+        return pending.title, self._build_digest(pending.messages)
+
+    def _rate_limit_delay(self, key: tuple[str, str], rate_limit: int) -> float:
+        """Return how long to wait before key may send again (0 if it may now)."""
+        if rate_limit <= 0 or (sent := self._sent_times.get(key)) is None:
+            return 0
+        now = time.monotonic()
+        while sent and now - sent[0] >= RATE_LIMIT_PERIOD:
+            sent.popleft()
+        if len(sent) < rate_limit:
+            return 0
+        return sent[0] + RATE_LIMIT_PERIOD - now
+
+    @staticmethod
+    def _build_digest(messages: list[str]) -> str:
+        """Merge held-back messages into one notification body."""
+        if len(messages) == 1:
+            return messages[0]
+        lines = messages[-DIGEST_MAX_LINES:]
+        header = f"{len(messages)} updates"
+        if len(messages) > len(lines):
+            header += f" (last {len(lines)} shown)"
+        return header + ":\n" + "\n".join(f"- {line}" for line in lines)
+
+    @callback
+    def async_enqueue(self, notification: Notification) -> bool:
+        """Queue a notification without waiting; False if the queue was full."""
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            _LOGGER.warning(
+                f"Simple Timer: [{notification.entry_id}] Notification queue full - dropping '{notification.message}'"
+            )
+            return False
+
+        # One more worker per queued message, up to WORKER_COUNT; a hung
+        # target then only holds up its own worker
+        running = sum(1 for worker in self._workers if not worker.done())
+        if running < min(WORKER_COUNT, self._queue.qsize()):
+            worker = self.hass.async_create_background_task(
+                self._async_worker(), f"{DOMAIN} notifications"
+            )
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        return True
+
+    async def _async_worker(self) -> None:
+        """Deliver queued notifications until the queue is empty, targets in parallel."""
+        while True:
+            try:
+                notification = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await asyncio.gather(
+                    *(self._async_send(notification, target) for target in notification.targets)
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _async_send(self, notification: Notification, target: str) -> None:
+        """Deliver to one target with a timeout, recording latency and failures."""
+        stats = self._target_stats.setdefault(
+            target,
+            {"sent": 0, "failures": 0, "timeouts": 0, "last_ms": None, "average_ms": None, "max_ms": None},
+        )
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(TARGET_TIMEOUT):
+                await self._async_call_target(notification, target)
+        except TimeoutError:
+            stats["timeouts"] += 1
+            _LOGGER.error(
+                f"Simple Timer: [{notification.entry_id}] Notification to {target} timed out after {TARGET_TIMEOUT}s"
+            )
+            return
+        except Exception as e:
+            stats["failures"] += 1
+            _LOGGER.error(f"Simple Timer: [{notification.entry_id}] Failed to send notification to {target}: {e}")
+            return
+
+        latency_ms = round((time.monotonic() - started) * 1000, 1)
+        count = stats["sent"]
+        stats["sent"] = count + 1
+        stats["last_ms"] = latency_ms
+        stats["max_ms"] = max(stats["max_ms"] or 0, latency_ms)
+        stats["average_ms"] = round(((stats["average_ms"] or 0) * count + latency_ms) / (count + 1), 1)
+
+    async def _async_call_target(self, notification: Notification, target: str) -> None:
+        """Call the service behind one configured notification target."""
+        # Parse the service call format
+        service_parts = target.split('.')
+        if len(service_parts) < 2:
+            raise ValueError(f"Invalid notification entity format: {target}")
+
+        domain = service_parts[0]
+        service = service_parts[1]
+
+        # Special handling for boolean/switch/button entities used as notifications
+        if domain in ["input_boolean", "switch", "light"]:
+            _LOGGER.debug(f"Simple Timer: [{notification.entry_id}] Turning on configured notification entity: {target}")
+            await self.hass.services.async_call(
+                domain, "turn_on", {"entity_id": target}, blocking=True
+            )
+        elif domain == "input_button":
+            _LOGGER.debug(f"Simple Timer: [{notification.entry_id}] Pressing configured notification button: {target}")
+            await self.hass.services.async_call(
+                domain, "press", {"entity_id": target}, blocking=True
+            )
+        else:
+            # Standard notification service (e.g., notify.mobile_app_x)
+            # We assume the second part is the service name
+            _LOGGER.info(f"Simple Timer: [{notification.entry_id}] Sending notification to {domain}.{service}: '{notification.message}'")
+            await self.hass.services.async_call(
+                domain, service, {"message": notification.message, "title": notification.title}, blocking=True
+            )
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return queue and per-target statistics for diagnostics."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "workers": len(self._workers),
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "rate_limited": self._rate_limited,
+            "pending_digests": len(self._pending),
+            "targets": {target: dict(stats) for target, stats in self._target_stats.items()},
+        }
+
+
+@callback
+def async_get_notification_dispatcher(hass: HomeAssistant) -> NotificationDispatcher:
+    """Return the domain-wide notification dispatcher, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (dispatcher := domain_data.get(DATA_NOTIFICATIONS)) is None:
+        dispatcher = domain_data[DATA_NOTIFICATIONS] = NotificationDispatcher(hass)
+    return dispatcher
@@ -0,0 +1,234 @@
+"""Sequenced multi-zone programs run by one domain coordinator.
+
+A program is an ordered list of (instance, duration) steps started back to
+back, optionally with a gap or an overlap between consecutive steps. All step
+start times follow from the program's start, so a single pending deadline per
+running program hands over to the next step exactly on time.
+Progress (which steps were started) is persisted in the shared storage
+document after every handover, so after a restart the program continues with
+the step that is due instead of starting over; steps whose time passed while
+Home Assistant was down are started for whatever is left of them.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .deadlines import DeadlineHandle, async_get_deadline_scheduler
+from .index import async_get_timer_index
+from .storage import async_get_storage
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROGRAMS = "programs"
+
+# Storage setting holding the progress of every running program
+SETTING_PROGRAMS = "programs"
+
+# Steps with less than this left are skipped rather than started (seconds)
+MIN_STEP_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class ProgramStep:
+    """One instance and how long it runs (seconds)."""
+
+    entry_id: str
+    seconds: float
+
+
+@dataclass
+class ProgramRun:
+    """A running program and how far it got."""
+
+    program_id: str
+    started_at: datetime
+    steps: list[ProgramStep]
+    gap: float = 0.0
+    overlap: float = 0.0
+    next_step: int = 0
+    handle: DeadlineHandle | None = field(default=None, repr=False)
+
+    def step_start(self, index: int) -> datetime:
+        """Return when step index starts."""
+        offset = 0.0
+        for step in self.steps[:index]:
+            offset += max(0.0, step.seconds + self.gap - self.overlap)
+        return self.started_at + timedelta(seconds=offset)
+
+    def step_end(self, index: int) -> datetime:
+        """Return when step index ends."""
+        return self.step_start(index) + timedelta(seconds=self.steps[index].seconds)
+
+    @property
+    def finishes_at(self) -> datetime:
+        """Return when the last running step ends."""
+        return max(self.step_end(index) for index in range(len(self.steps)))
+
+    def as_storage(self) -> dict:
+        """Return the persisted progress."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "steps": [[step.entry_id, step.seconds] for step in self.steps],
+            "gap": self.gap,
+            "overlap": self.overlap,
+            "next_step": self.next_step,
+        }
+
+    @classmethod
+    def from_storage(cls, program_id: str, stored: dict) -> ProgramRun:
+        """Rebuild a run from its persisted progress; raises on invalid data."""
+        return cls(
+            program_id,
+            datetime.fromisoformat(stored["started_at"]),
+            [ProgramStep(entry_id, float(seconds)) for entry_id, seconds in stored["steps"]],
+            float(stored.get("gap", 0)),
+            float(stored.get("overlap", 0)),
+            int(stored.get("next_step", 0)),
+        )
+
+
+class ProgramRunner:
+    """Start the steps of every running program on their deadlines."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the runner."""
+        self.hass = hass
+        self._runs: dict[str, ProgramRun] = {}
+        self._restored = False
+        self._completed = 0
+
+    async def async_start(
+        self, program_id: str, steps: list[ProgramStep], gap: float = 0, overlap: float = 0
+    ) -> ProgramRun:
+        """Start (or restart) a program from its first step."""
+        if program_id in self._runs:
+            await self.async_stop(program_id, cancel_timers=False)
+
+        run = ProgramRun(program_id, dt_util.utcnow(), steps, gap, overlap)
+        self._runs[program_id] = run
+        _LOGGER.info(
+            f"Simple Timer: Starting program '{program_id}' with {len(steps)} step(s) "
+            f"(gap {gap}s, overlap {overlap}s), finishing at {run.finishes_at.isoformat()}"
+        )
+        await self._async_advance(run)
+        return run
+
+    async def async_stop(self, program_id: str, cancel_timers: bool = True) -> None:
+        """Stop a program; steps still running are cancelled unless told otherwise."""
+        if (run := self._runs.pop(program_id, None)) is None:
+            raise ValueError(f"Program '{program_id}' is not running")
+        if run.handle:
+            run.handle()
+
+        if cancel_timers:
+            now = dt_util.utcnow()
+            index = async_get_timer_index(self.hass)
+            for step_index in range(run.next_step):
+                if run.step_end(step_index) <= now:
+                    continue
+                entry_id = run.steps[step_index].entry_id
+                try:
+                    await index.async_get_sensor(entry_id, f"entry_id: {entry_id}").async_cancel_timer()
+                except Exception as e:
+                    _LOGGER.warning(f"Simple Timer: [{entry_id}] Could not cancel program step: {e}")
+
+        _LOGGER.info(f"Simple Timer: Program '{program_id}' stopped")
+        await self._async_save()
+
+    async def _async_advance(self, run: ProgramRun, now: datetime | None = None) -> None:
+        """Start every step that is due, persist progress and arm the next handover."""
+        if self._runs.get(run.program_id) is not run:
+            return
+        now = now or dt_util.utcnow()
+        index = async_get_timer_index(self.hass)
+
+        while run.next_step < len(run.steps) and run.step_start(run.next_step) <= now:
+            step = run.steps[run.next_step]
+            remaining = float(round((run.step_end(run.next_step) - now).total_seconds()))
+            run.next_step += 1
+            if remaining < MIN_STEP_SECONDS:
+                _LOGGER.info(f"Simple Timer: [{step.entry_id}] Program '{run.program_id}' step {run.next_step} already over - skipping")
+                continue
+            try:
+                sensor = index.async_get_sensor(step.entry_id, f"entry_id: {step.entry_id}")
+                await sensor.async_start_timer(remaining, "sec", reverse_mode=False, start_method="program")
+            except Exception as e:
+                _LOGGER.error(f"Simple Timer: [{step.entry_id}] Program '{run.program_id}' step {run.next_step} failed: {e}")
+
+        deadlines = async_get_deadline_scheduler(self.hass)
+        if run.next_step < len(run.steps):
+            when = run.step_start(run.next_step)
+        elif (when := run.finishes_at) <= now:
+            # Last step is over - the program is complete
+            if run.handle:
+                run.handle()
+            del self._runs[run.program_id]
+            self._completed += 1
+            _LOGGER.info(f"Simple Timer: Program '{run.program_id}' completed")
+            await self._async_save()
+            return
+
+        @callback
+        def _async_handover(fired: datetime) -> None:
+            self.hass.async_create_task(self._async_advance(run, fired))
+
+        if run.handle:
+            run.handle()
+        run.handle = deadlines.async_schedule(when, _async_handover)
+        await self._async_save()
+
+    async def _async_save(self) -> None:
+        """Persist the progress of every running program."""
+        await async_get_storage(self.hass).async_set_setting(
+            SETTING_PROGRAMS, {program_id: run.as_storage() for program_id, run in self._runs.items()}
+        )
+
+    async def async_restore(self) -> None:
+        """Resume programs that were running before the restart (once)."""
+        if self._restored:
+            return
+        self._restored = True
+
+        stored = async_get_storage(self.hass).async_get_setting(SETTING_PROGRAMS, {})
+        for program_id, progress in stored.items():
+            try:
+                run = ProgramRun.from_storage(program_id, progress)
+            except (KeyError, TypeError, ValueError) as e:
+                _LOGGER.warning(f"Simple Timer: Discarding unreadable program '{program_id}': {e}")
+                continue
+            self._runs[program_id] = run
+            _LOGGER.info(f"Simple Timer: Resuming program '{program_id}' at step {run.next_step + 1}/{len(run.steps)}")
+            await self._async_advance(run)
+
+        if not self._runs and stored:
+            await self._async_save()
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return running programs for diagnostics."""
+        return {
+            "running": {
+                program_id: {
+                    "step": min(run.next_step, len(run.steps)),
+                    "steps": len(run.steps),
+                    "finishes_at": run.finishes_at.isoformat(),
+                }
+                for program_id, run in self._runs.items()
+            },
+            "completed": self._completed,
+        }
+
+
+@callback
+def async_get_program_runner(hass: HomeAssistant) -> ProgramRunner:
+    """Return the domain-wide program runner, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (runner := domain_data.get(DATA_PROGRAMS)) is None:
+        runner = domain_data[DATA_PROGRAMS] = ProgramRunner(hass)
+    return runner
@@ -0,0 +1,152 @@
+"""Shared daily-reset engine for all Simple Timer instances.
+
+Instances are grouped by their configured reset time and each group has a
+single time-change listener. When it fires, every member is reset
+concurrently and the storage changes from all of them are written once.
+Missed resets after a restart are caught up for all instances in one pass,
+also with a single write.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time as monotonic_time
+from datetime import datetime, time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DOMAIN
+from .storage import async_get_storage
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RESET_COORDINATOR = "reset_coordinator"
+
+
+class ResetCoordinator:
+    """Fire one listener per distinct reset time and reset its members together."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self._groups: dict[time, dict[str, TimerRuntimeSensor]] = {}
+        self._unsubs: dict[time, CALLBACK_TYPE] = {}
+        self._last_run: dict | None = None
+        self._last_catch_up: dict | None = None
+
+    @callback
+    def async_register(self, sensor: TimerRuntimeSensor) -> CALLBACK_TYPE:
+        """Add a sensor to the group of its reset time; returns the remover."""
+        reset_time = sensor.reset_time
+        entry_id = sensor._entry_id
+        group = self._groups.setdefault(reset_time, {})
+        group[entry_id] = sensor
+
+        if reset_time not in self._unsubs:
+            @callback
+            def _async_reset_time_reached(now: datetime) -> None:
+                self.hass.async_create_task(self._async_reset_group(reset_time))
+
+            self._unsubs[reset_time] = async_track_time_change(
+                self.hass,
+                _async_reset_time_reached,
+                hour=reset_time.hour,
+                minute=reset_time.minute,
+                second=reset_time.second,
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            members = self._groups.get(reset_time)
+            if not members or members.get(entry_id) is not sensor:
+                return
+            del members[entry_id]
+            if not members:
+                del self._groups[reset_time]
+                if (unsub := self._unsubs.pop(reset_time, None)) is not None:
+                    unsub()
+
+        return _async_unregister
+
+    async def _async_reset_group(self, reset_time: time) -> None:
+        """Reset every member of a group concurrently with one storage write."""
+        members = list(self._groups.get(reset_time, {}).values())
+        if not members:
+            return
+
+        started = monotonic_time.monotonic()
+        async with async_get_storage(self.hass).async_batch(flush=True):
+            results = await asyncio.gather(
+                *(sensor._async_reset_at_scheduled_time() for sensor in members),
+                return_exceptions=True,
+            )
+
+        for sensor, result in zip(members, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(f"Simple Timer: [{sensor._entry_id}] Daily reset failed: {result}")
+
+        elapsed = monotonic_time.monotonic() - started
+        self._last_run = {
+            "reset_time": reset_time.strftime("%H:%M:%S"),
+            "instances": len(members),
+            "duration_s": round(elapsed, 3),
+        }
+        _LOGGER.info(
+            f"Simple Timer: Daily reset at {reset_time.strftime('%H:%M:%S')} for {len(members)} instance(s) took {elapsed:.2f}s"
+        )
+
+    async def async_catch_up(self, sensors: list[TimerRuntimeSensor]) -> None:
+        """Restore reset dates and perform missed resets for all sensors in one pass."""
+        if not sensors:
+            return
+
+        started = monotonic_time.monotonic()
+        storage = async_get_storage(self.hass)
+
+        async def _async_catch_up(sensor: TimerRuntimeSensor) -> bool:
+            return await sensor._restore_reset_state(await sensor._load_storage_data())
+
+        async with storage.async_batch():
+            results = await asyncio.gather(
+                *(_async_catch_up(sensor) for sensor in sensors), return_exceptions=True
+            )
+
+        for sensor, result in zip(sensors, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(f"Simple Timer: [{sensor._entry_id}] Reset catch-up failed: {result}")
+
+        caught_up = sum(1 for result in results if result is True)
+        elapsed = monotonic_time.monotonic() - started
+        self._last_catch_up = {
+            "instances": len(sensors),
+            "caught_up": caught_up,
+            "duration_s": round(elapsed, 3),
+        }
+        if caught_up:
+            _LOGGER.info(f"Simple Timer: Caught up missed resets for {caught_up} of {len(sensors)} instance(s) in {elapsed:.2f}s")
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return group sizes and last run statistics for diagnostics."""
+        return {
+            "groups": {
+                reset_time.strftime("%H:%M:%S"): len(members)
+                for reset_time, members in self._groups.items()
+            },
+            "last_run": self._last_run,
+            "last_catch_up": self._last_catch_up,
+        }
+
+
+@callback
+def async_get_reset_coordinator(hass: HomeAssistant) -> ResetCoordinator:
+    """Return the domain-wide reset coordinator, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (coordinator := domain_data.get(DATA_RESET_COORDINATOR)) is None:
+        coordinator = domain_data[DATA_RESET_COORDINATOR] = ResetCoordinator(hass)
+    return coordinator
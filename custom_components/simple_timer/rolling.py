@@ -0,0 +1,67 @@
+"""Fixed-size ring buffer of daily runtime totals with rolling window sums.
+
+The day's total is pushed at every daily reset. Each window (7 and 30 days)
+keeps a running sum that is updated by adding the new day and subtracting the
+one that falls out of the window, so a push costs the same however long the
+windows are and reading a rolling total is a lookup.
+"""
+from __future__ import annotations
+
+# Days kept in the buffer, and the rolling windows exposed as sensors
+RING_DAYS = 30
+WINDOWS = (7, 30)
+
+
+class DailyTotals:
+    """The last RING_DAYS daily totals (seconds) and their rolling sums."""
+
+    __slots__ = ("_values", "_head", "_count", "_sums")
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._values = [0.0] * RING_DAYS
+        self._head = 0    # slot the next day is written to
+        self._count = 0   # days pushed so far (capped at RING_DAYS)
+        self._sums = dict.fromkeys(WINDOWS, 0.0)
+
+    def push(self, seconds: float) -> None:
+        """Add a finished day, dropping the oldest one from each full window."""
+        for window in WINDOWS:
+            if self._count >= window:
+                self._sums[window] -= self._values[(self._head - window) % RING_DAYS]
+            self._sums[window] += seconds
+        self._values[self._head] = seconds
+        self._head = (self._head + 1) % RING_DAYS
+        self._count = min(self._count + 1, RING_DAYS)
+
+    def total(self, window: int) -> float:
+        """Return the sum of the last `window` days."""
+        return max(0.0, round(self._sums[window], 3))
+
+    def days(self, window: int) -> int:
+        """Return how many days the window currently covers."""
+        return min(self._count, window)
+
+    def as_storage(self) -> list:
+        """Return the stored form: [head, count, [values...]]."""
+        return [self._head, self._count, list(self._values)]
+
+    @classmethod
+    def from_storage(cls, stored: list | None) -> DailyTotals:
+        """Rebuild a buffer, recomputing the window sums; empty if invalid."""
+        totals = cls()
+        try:
+            head, count, values = stored
+            if len(values) != RING_DAYS:
+                return totals
+            totals._values = [float(value) for value in values]
+            totals._head = int(head) % RING_DAYS
+            totals._count = max(0, min(int(count), RING_DAYS))
+        except (TypeError, ValueError):
+            return totals
+        for window in WINDOWS:
+            totals._sums[window] = sum(
+                totals._values[(totals._head - offset) % RING_DAYS]
+                for offset in range(1, totals.days(window) + 1)
+            )
+        return totals
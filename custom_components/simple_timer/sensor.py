@@ -12,26 +12,57 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    UnitOfEnergy,
     UnitOfTime,
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import HomeAssistant, callback, Event, State, CoreState
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.event import (
     async_track_state_change_event,
-    async_track_time_change,
     async_call_later,
-    async_track_point_in_utc_time,
     async_track_time_interval,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, WARNING_MSG_OFFLINE
+from .actuation import (
+    CONFIRM_TIMEOUTS,
+    RETRY_TIMEOUTS,
+    ActuationStats,
+    CommandSuperseded,
+    async_actuate,
+    async_actuate_and_confirm,
+    async_get_actuation_queue,
+    async_wait_for_state,
+)
+from .bootstrap import async_get_bootstrap
+from .const import (
+    DOMAIN,
+    WARNING_MSG_OFFLINE,
+    DEFAULT_STATE_WRITE_INTERVAL,
+    MIN_STATE_WRITE_INTERVAL,
+    DEFAULT_NOTIFICATION_WINDOW,
+    DEFAULT_NOTIFICATION_RATE_LIMIT,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_ENERGY_METHOD,
+)
+from .cron import CronExpression, ScheduleSlot, ScheduleTable
+from .cycle import PHASE_DONE, PHASE_ON, DutyCycle
+from .deadlines import async_get_deadline_scheduler
+from .energy import EnergyIntegrator, power_to_watts
+from .index import async_get_timer_index
+from .journal import async_get_session_journal
+from .notifications import async_get_notification_dispatcher
+from .reset import async_get_reset_coordinator
+from .rolling import RING_DAYS, WINDOWS, DailyTotals
+from .statistics import STORAGE_KEY_STATISTICS, RuntimeIntervals, async_get_statistics_publisher
+from .storage import async_get_storage
+from .tick import async_get_tick_hub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +81,13 @@ ATTR_INSTANCE_TITLE = "instance_title"
 ATTR_NEXT_RESET_DATE = "next_reset_date"
 ATTR_RESET_TIME = "reset_time"
 ATTR_TIMER_START_METHOD = "timer_start_method"
+ATTR_ACCUMULATION_MODE = "accumulation_mode"
+ATTR_ACTUATION_LATENCY = "actuation_latency_ms"
+ATTR_PAUSED_REMAINING = "paused_remaining"
+ATTR_GROUP_MEMBERS = "group_members"
+ATTR_MEMBER_RUNTIME = "member_runtime"
+ATTR_DAILY_BUDGET = "daily_budget"
+ATTR_BUDGET_CUTOFF_AT = "budget_cutoff_at"
 
 # Scheduled-start attributes
 ATTR_SCHEDULE_STATE = "schedule_state"
@@ -59,9 +97,23 @@ ATTR_SCHEDULED_UNIT = "scheduled_unit"
 ATTR_SCHEDULE_REPEAT = "schedule_repeat"
 ATTR_SCHEDULE_DAYS = "schedule_days"
 
+# Multi-slot (cron) schedule attributes
+ATTR_SCHEDULE_SLOTS = "schedule_slots"
+ATTR_NEXT_SLOT_START = "next_slot_start"
+
+# Duty-cycle attributes
+ATTR_CYCLE_STATE = "cycle_state"
+ATTR_CYCLE_REPEAT = "cycle_repeat"
+ATTR_CYCLE_REPEATS = "cycle_repeats"
+ATTR_CYCLE_PHASE_ENDS_AT = "cycle_phase_ends_at"
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    """Create a TimerRuntimeSensor for this config entry."""
-    async_add_entities([TimerRuntimeSensor(hass, entry)])
+    """Create a TimerRuntimeSensor and its rolling usage sensors for this config entry."""
+    sensor = TimerRuntimeSensor(hass, entry)
+    entities = [sensor, *(RollingUsageSensor(sensor, window) for window in WINDOWS)]
+    if entry.data.get("power_sensor"):
+        entities.append(EnergyUsageSensor(sensor))
+    async_add_entities(entities)
 
 class TimerRuntimeSensor(SensorEntity, RestoreEntity):
     """The sensor entity for Simple Timer."""
@@ -70,8 +122,31 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    STORAGE_VERSION = 2
-    STORAGE_KEY_FORMAT = f"{DOMAIN}_{{}}"
+    # Static config and derived values: kept on the state for the card, but not
+    # worth a recorder row whenever they (or the countdown) change.
+    _unrecorded_attributes = frozenset({
+        ATTR_TIMER_REMAINING,
+        "entry_id",
+        ATTR_SWITCH_ENTITY_ID,
+        ATTR_INSTANCE_TITLE,
+        ATTR_NEXT_RESET_DATE,
+        ATTR_RESET_TIME,
+        ATTR_ACCUMULATION_MODE,
+        ATTR_ACTUATION_LATENCY,
+        "show_seconds",
+        "default_timer_enabled",
+        "default_timer_duration",
+        "default_timer_unit",
+        "default_timer_reverse_mode",
+        ATTR_SCHEDULED_DURATION,
+        ATTR_SCHEDULED_UNIT,
+        ATTR_SCHEDULE_REPEAT,
+        ATTR_SCHEDULE_DAYS,
+        ATTR_SCHEDULE_SLOTS,
+        ATTR_GROUP_MEMBERS,
+        ATTR_MEMBER_RUNTIME,
+        ATTR_DAILY_BUDGET,
+    })
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         """Initialize the sensor."""
@@ -79,6 +154,34 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._entry = entry
         self._entry_id = entry.entry_id
         self._switch_entity_id = entry.data.get("switch_entity_id")
+
+        # Group mode: further switches driven with the main one; the group
+        # counts as on while any member is on
+        self._group_members = [m for m in entry.data.get("group_members", []) if m != self._switch_entity_id]
+        self._group_state = None            # last aggregated state seen by the listener
+        self._member_runtime: dict[str, float] = {}        # seconds per member, today
+        self._member_on_since: dict[str, datetime] = {}
+
+        # Daily runtime budget: one deadline at the moment usage reaches it
+        self._daily_budget = self._parse_daily_budget(entry.data.get("daily_budget", DEFAULT_DAILY_BUDGET))
+        self._budget_unsub = None
+        self._budget_cutoff_at: datetime | None = None
+
+        # Energy integrated from an optional power sensor over the same sessions
+        self._power_sensor = entry.data.get("power_sensor") or None
+        self._energy = EnergyIntegrator(entry.data.get("energy_method", DEFAULT_ENERGY_METHOD))
+        self._energy_last_reset: datetime | None = None
+        self._power_unsub = None
+        self._energy_sensor: EnergyUsageSensor | None = None
+        self._energy_restored = False
+
+        # Daily totals of the last 30 days, feeding the rolling usage sensors
+        self._daily_totals = DailyTotals()
+        self._rolling_sensors: list[RollingUsageSensor] = []
+
+        # Switch-on intervals awaiting the hourly long-term statistics push
+        self._runtime_intervals = RuntimeIntervals()
+        self._statistics_unsub = None
         self._entry_id_short = self._entry_id[:8]
 
         self._attr_unique_id = f"timer_runtime_{self._entry_id}"
@@ -93,12 +196,19 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # Initialize reset time from config
         self._reset_time = self._parse_reset_time(entry.data.get("reset_time", "00:00"))
         self._reset_time_tracker = None  # Track the current reset time listener
+        self._reset_state_restored = False  # Set once next_reset_date was restored / caught up
 
         # Initialize state and timer variables
         self._state = 0.0
         self._last_on_timestamp = None
-        self._accumulation_task = None
+        self._accumulating = False
         self._state_listener_disposer = None
+
+        # Lazy accumulation: runtime is computed on read, state written on
+        # transitions and every _state_write_interval seconds only
+        self._lazy_accumulation = entry.data.get("lazy_accumulation", False)
+        self._state_write_interval = self._parse_state_write_interval(entry.data.get("state_write_interval"))
+        self._lazy_write_unsub = None
         self._stop_event_received = False
         self._is_finishing_normally = False
 
@@ -106,10 +216,13 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._timer_finishes_at = None
         self._timer_duration = 0
         self._timer_start_moment = None  # Track exact timer start moment
+        self._timer_paused_remaining = None  # float seconds left while paused
+        self._timer_paused_at = None         # datetime (UTC) the timer was paused
         self._runtime_at_timer_start = 0  # Track runtime when timer started
         self._timer_unsub = None
         self._watchdog_message = None
-        self._timer_update_task = None
+        self._counting_down = False
+        self._tick_unsub = None  # Subscription to the shared domain tick
         self._is_performing_reset = False
         self._timer_start_method = None
         self._last_accumulated_seconds = 0
@@ -127,6 +240,15 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._schedule_repeat = False
         self._schedule_days = []            # list[int] weekday Mon=0; empty = every day
 
+        # Multi-slot cron schedule; only the earliest slot has a deadline armed
+        self._slots = ScheduleTable()
+        self._slot_unsub = None
+
+        # Duty cycle: one deadline, rescheduled in place at every phase change
+        self._cycle: DutyCycle | None = None
+        self._cycle_unsub = None
+        self._cycle_phase = None            # CyclePhase of the phase being run
+
         # Default timer config
         # Default timer config from entry data
         self._default_timer_duration = entry.data.get("default_timer_duration", 0.0)
@@ -134,9 +256,15 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._default_timer_enabled = self._default_timer_duration > 0
         self._default_timer_reverse_mode = False # Config flow currently doesn't support reverse mode default
 
-        # Storage setup
-        self._storage_lock = asyncio.Lock()
-        self._store = Store(hass, self.STORAGE_VERSION, self.STORAGE_KEY_FORMAT.format(self._entry_id))
+        # Measured switch actuation latency (event-confirmed)
+        self._actuation_stats = ActuationStats()
+
+        # Attribute snapshot, rebuilt only when an underlying field changes
+        self._attributes_snapshot: dict[str, Any] = {}
+        self._attributes_snapshot_key = None
+
+        # Storage setup (view onto the consolidated domain document)
+        self._store = async_get_storage(hass).async_entry(self._entry_id)
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -177,6 +305,20 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Invalid reset time '{time_str}', using default 00:00:00")
             return DEFAULT_RESET_TIME
 
+    def _parse_state_write_interval(self, value) -> int:
+        """Parse the lazy-mode write cadence, falling back to the default."""
+        try:
+            return max(MIN_STATE_WRITE_INTERVAL, int(value))
+        except (ValueError, TypeError):
+            return DEFAULT_STATE_WRITE_INTERVAL
+
+    def _parse_daily_budget(self, value) -> float:
+        """Parse the daily budget (hours), falling back to no budget."""
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return DEFAULT_DAILY_BUDGET
+
     @property
     def reset_time(self) -> time:
         """Get the current reset time."""
@@ -226,37 +368,107 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
     def native_value(self) -> float:
         """Return the current daily runtime in seconds."""
         # Return whole seconds only
-        return float(int(self._state))
+        return float(int(self._state + self._pending_runtime_seconds()))
+
+    def _pending_runtime_seconds(self) -> int:
+        """Return whole seconds accumulated but not yet folded into _state (lazy mode)."""
+        if not (self._lazy_accumulation and self._accumulating and self._last_on_timestamp):
+            return 0
+        elapsed = round((dt_util.utcnow() - self._last_on_timestamp).total_seconds())
+        return max(0, elapsed - self._last_accumulated_seconds)
 
     def _calculate_timer_remaining(self) -> int:
         """Calculate remaining time in seconds for active timer."""
+        if self._timer_state == "paused" and self._timer_paused_remaining is not None:
+            return max(0, int(self._timer_paused_remaining))
         if self._timer_state == "active" and self._timer_finishes_at:
             now = dt_util.utcnow()
             remaining = (self._timer_finishes_at - now).total_seconds()
             return max(0, int(remaining))
         return 0
 
+    def _attributes_key(self) -> tuple:
+        """Return the raw fields the attribute snapshot is built from."""
+        return (
+            self._timer_state,
+            self._timer_finishes_at,
+            self._timer_duration,
+            self._watchdog_message,
+            self._switch_entity_id,
+            tuple(self._group_members),
+            self._daily_budget,
+            self._budget_cutoff_at,
+            self._last_on_timestamp,
+            self.instance_title,
+            self._next_reset_date,
+            self._reset_time,
+            self._timer_start_method,
+            self._lazy_accumulation,
+            self._actuation_stats.async_last_latency_ms(self._switch_entity_id),
+            self._timer_paused_remaining,
+            self._entry.data.get("show_seconds", False),
+            getattr(self, '_timer_reverse_mode', False),
+            self._default_timer_enabled,
+            self._default_timer_duration,
+            self._default_timer_unit,
+            self._default_timer_reverse_mode,
+            self._scheduled_fire_at,
+            self._scheduled_duration,
+            self._scheduled_unit,
+            self._schedule_repeat,
+            tuple(self._schedule_days),
+            self._slots.version,
+            self._cycle_phase,
+        )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        timer_remaining = self._calculate_timer_remaining()
-        
+        # A countdown tick only changes timer_remaining - reuse the snapshot
+        # instead of re-serializing unchanged datetimes.
+        key = self._attributes_key()
+        if key != self._attributes_snapshot_key:
+            self._attributes_snapshot = self._build_attributes_snapshot()
+            self._attributes_snapshot_key = key
+
+        attrs = {
+            **self._attributes_snapshot,
+            ATTR_TIMER_REMAINING: self._calculate_timer_remaining(),
+        }
+        if self._group_members:
+            attrs[ATTR_MEMBER_RUNTIME] = self._calculate_member_runtime()
+
+        if self._last_reset_was_catchup:
+            attrs["last_reset_type"] = "catch-up"
+            if self._catchup_reset_info:
+                attrs["reset_info"] = self._catchup_reset_info
+            self._last_reset_was_catchup = False
+
+        return attrs
+
+    def _build_attributes_snapshot(self) -> dict[str, Any]:
+        """Build every attribute except the per-second timer_remaining."""
         # Get show_seconds from config entry
         show_seconds_setting = self._entry.data.get("show_seconds", False)
 
-        attrs = {
+        return {
             ATTR_TIMER_STATE: self._timer_state,
             ATTR_TIMER_FINISHES_AT: self._timer_finishes_at.isoformat() if self._timer_finishes_at else None,
             ATTR_TIMER_DURATION: self._timer_duration,
-            ATTR_TIMER_REMAINING: timer_remaining,
             ATTR_WATCHDOG_MESSAGE: self._watchdog_message,
             "entry_id": self._entry_id,
             ATTR_SWITCH_ENTITY_ID: self._switch_entity_id,
+            ATTR_GROUP_MEMBERS: list(self._group_members),
+            ATTR_DAILY_BUDGET: self._daily_budget,
+            ATTR_BUDGET_CUTOFF_AT: self._budget_cutoff_at.isoformat() if self._budget_cutoff_at else None,
             ATTR_LAST_ON_TIMESTAMP: self._last_on_timestamp.isoformat() if self._last_on_timestamp else None,
             ATTR_INSTANCE_TITLE: self.instance_title,
             ATTR_NEXT_RESET_DATE: self._next_reset_date.isoformat() if self._next_reset_date else None,
             ATTR_RESET_TIME: self._reset_time.strftime("%H:%M:%S"),  # Expose current reset time
             ATTR_TIMER_START_METHOD: self._timer_start_method,
+            ATTR_ACCUMULATION_MODE: "lazy" if self._lazy_accumulation else "realtime",
+            ATTR_ACTUATION_LATENCY: self._actuation_stats.async_last_latency_ms(self._switch_entity_id),
+            ATTR_PAUSED_REMAINING: int(self._timer_paused_remaining) if self._timer_paused_remaining is not None else None,
             "show_seconds": show_seconds_setting,  # Expose show_seconds from config entry
             "reverse_mode": getattr(self, '_timer_reverse_mode', False),
             
@@ -272,16 +484,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             ATTR_SCHEDULED_DURATION: self._scheduled_duration,
             ATTR_SCHEDULED_UNIT: self._scheduled_unit,
             ATTR_SCHEDULE_REPEAT: self._schedule_repeat,
-            ATTR_SCHEDULE_DAYS: self._schedule_days,
-        }
+            ATTR_SCHEDULE_DAYS: list(self._schedule_days),
 
-        if self._last_reset_was_catchup:
-            attrs["last_reset_type"] = "catch-up"
-            if self._catchup_reset_info:
-                attrs["reset_info"] = self._catchup_reset_info
-            self._last_reset_was_catchup = False
+            # Multi-slot schedule
+            ATTR_SCHEDULE_SLOTS: [slot.as_attribute() for slot in self._slots.slots.values()],
+            ATTR_NEXT_SLOT_START: next_slot.next_fire.isoformat() if (next_slot := self._slots.peek()) else None,
 
-        return attrs
+            # Duty cycle
+            ATTR_CYCLE_STATE: self._cycle_phase.phase if self._cycle_phase else "idle",
+            ATTR_CYCLE_REPEAT: self._cycle_phase.repeat if self._cycle_phase else None,
+            ATTR_CYCLE_REPEATS: self._cycle.repeats if self._cycle else None,
+            ATTR_CYCLE_PHASE_ENDS_AT: self._cycle_phase.ends_at.isoformat() if self._cycle_phase and self._cycle_phase.ends_at else None,
+        }
 
     async def _get_card_notification_config(self) -> tuple[list[str], bool]:
         """Get notification entities and show_seconds setting from config entry ONLY."""
@@ -393,6 +607,9 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         """Ensure switch is in desired state, attempt to correct if not, and warn on failure."""
         if not self._switch_entity_id:
             return
+
+        # Group members follow in one batched call (not individually confirmed)
+        self._async_command_members(desired_state)
             
         current_state = self.hass.states.get(self._switch_entity_id)
 
@@ -405,25 +622,23 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             
         # State mismatch - attempt to correct
         try:
-            action = "turn_on" if desired_state == "on" else "turn_off"
-            await self.hass.services.async_call(
-                "homeassistant", action, {"entity_id": self._switch_entity_id}, blocking=blocking
-            )
-            
-            # Wait a moment for state change to propagate
-            # Retry a few times to account for slow state updates from integrations
-            max_retries = 3
-            wait_time = 1.0
-            
-            for attempt in range(max_retries):
-                await asyncio.sleep(wait_time)
-                
-                updated_state = self.hass.states.get(self._switch_entity_id)
-                if updated_state and updated_state.state == desired_state:
+            if current_state.state == desired_state:
+                # Forced re-send to an already matching switch: no state change
+                # will follow, so there is nothing to wait for.
+                await async_get_actuation_queue(self.hass).async_enqueue(
+                    self._switch_entity_id, desired_state, None, blocking
+                )
+                return
+
+            # Bounded retries, each resolved by the switch's own state_changed
+            # event instead of polling
+            for timeout in CONFIRM_TIMEOUTS:
+                if await self._async_actuate_switch(desired_state, timeout, blocking):
+                    return
+                # Confirmation may have raced the timeout
+                late_state = self.hass.states.get(self._switch_entity_id)
+                if late_state and late_state.state == desired_state:
                     return
-                
-                # If checking failed, wait a bit longer next time
-                wait_time += 1.0
             
             # Verify correction worked
             updated_state = self.hass.states.get(self._switch_entity_id)
@@ -431,14 +646,40 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 warning_msg = f"Warning: {action_description} - switch should be '{desired_state}' but remains '{updated_state.state}'. Check switch connectivity."
                 _LOGGER.warning(f"Simple Timer: [{self._entry_id}] {warning_msg}")
                 await self._send_notification(warning_msg)
-                
+
+        except CommandSuperseded:
+            # A newer opposite command took over; its caller owns the outcome
+            _LOGGER.debug(f"Simple Timer: [{self._entry_id}] {action_description} superseded before it was sent")
         except Exception as e:
             warning_msg = f"Warning: {action_description} - failed to set switch to '{desired_state}': {e}"
             _LOGGER.warning(f"Simple Timer: [{self._entry_id}] {warning_msg}")
             await self._send_notification(warning_msg)
 
+    async def _async_actuate_switch(self, desired_state: str, timeout: float, blocking: bool = True) -> bool:
+        """Send one on/off command and wait for confirmation; record its latency.
+
+        Returns False only if the switch did not confirm, i.e. when a retry makes sense.
+        """
+        try:
+            latency = await async_actuate_and_confirm(
+                self.hass, self._switch_entity_id, desired_state, timeout, blocking=blocking
+            )
+        except CommandSuperseded:
+            _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch command '{desired_state}' superseded by a newer one")
+            return True
+        self._actuation_stats.async_record(self._switch_entity_id, latency)
+        if latency is None:
+            _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch did not confirm '{desired_state}' within {timeout}s")
+            return False
+        _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch confirmed '{desired_state}' after {latency * 1000:.0f} ms")
+        return True
+
     async def _send_notification(self, message: str) -> None:
-        """Send notification using configured notification entities."""
+        """Queue a notification for the configured notification entities.
+
+        Delivery happens in the background (see notifications.py), so this
+        never waits on a slow notify endpoint.
+        """
         try:
             notification_entities, show_seconds = await self._get_card_notification_config()
             
@@ -451,40 +692,14 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             raw_title = self.instance_title or "Timer"
             title = raw_title.replace("_", " ")
             
-            # Send to all configured notification services
-            for notification_entity in notification_entities:
-                try:
-                    # Parse the service call format
-                    service_parts = notification_entity.split('.')
-                    if len(service_parts) < 2:
-                        _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Invalid notification entity format: {notification_entity}")
-                        continue
-                        
-                    domain = service_parts[0]
-                    service = service_parts[1]
-                    
-                    # Special handling for boolean/switch/button entities used as notifications
-                    if domain in ["input_boolean", "switch", "light"]:
-                        _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Turning on configured notification entity: {notification_entity}")
-                        await self.hass.services.async_call(
-                            domain, "turn_on", {"entity_id": notification_entity}
-                        )
-                    elif domain == "input_button":
-                         _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Pressing configured notification button: {notification_entity}")
-                         await self.hass.services.async_call(
-                            domain, "press", {"entity_id": notification_entity}
-                        )
-                    else:
-                        # Standard notification service (e.g., notify.mobile_app_x)
-                        # We assume the second part is the service name
-                        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Sending notification to {domain}.{service}: '{message}'")
-                        
-                        await self.hass.services.async_call(
-                            domain, service, {"message": message, "title": title}
-                        )
-                    
-                except Exception as e:
-                    _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to send notification to {notification_entity}: {e}")
+            async_get_notification_dispatcher(self.hass).async_notify(
+                self._entry_id,
+                title,
+                message,
+                list(notification_entities),
+                window=self._entry.data.get("notification_window", DEFAULT_NOTIFICATION_WINDOW),
+                rate_limit=self._entry.data.get("notification_rate_limit", DEFAULT_NOTIFICATION_RATE_LIMIT),
+            )
 
         except Exception as e:
             _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to send notifications: {e}")
@@ -496,13 +711,10 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
     async def _save_next_reset_date(self):
         """Save the next reset date to storage."""
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                data["next_reset_date"] = self._next_reset_date.isoformat()
-                await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to save next reset date: {e}")
+        try:
+            await self._store.async_update({"next_reset_date": self._next_reset_date.isoformat()})
+        except Exception as e:
+            _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to save next reset date: {e}")
 
     def _get_next_reset_datetime(self, from_date=None):
         """Calculate the next reset datetime from a given date using configured reset time."""
@@ -520,10 +732,10 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         return reset_datetime
 
-    async def _check_missed_reset(self):
-        """Check if we missed a reset while HA was offline."""
+    async def _check_missed_reset(self) -> bool:
+        """Check if we missed a reset while HA was offline; True if one was caught up."""
         if not self._next_reset_date:
-            return
+            return False
         
         now = dt_util.now()
         
@@ -537,15 +749,17 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 f"Missed resets: {days_missed}"
             )
             
-            await self._perform_reset(is_catchup=True)
+            await self._perform_reset(is_catchup=True, days_missed=days_missed)
             
             self._next_reset_date = self._get_next_reset_datetime()
             await self._save_next_reset_date()
             
             self._last_reset_was_catchup = True
             self._catchup_reset_info = f"Reset performed on startup (missed {days_missed} reset(s))"
+            return True
+        return False
 
-    async def _perform_reset(self, is_catchup=False):
+    async def _perform_reset(self, is_catchup=False, days_missed=1):
         """Perform daily runtime reset."""
         self._is_performing_reset = True
         try:
@@ -558,30 +772,35 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
             await self._stop_realtime_accumulation()
 
-            if self._timer_state == "active":
+            if self._timer_state in ("active", "paused"):
                 _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Reset occurred during an active timer. Adjusting timer's base runtime.")
                 self._runtime_at_timer_start = 0.0 - self._calculate_timer_elapsed_since_start()
                 
                 # PERSISTENCE FIX: Save the adjusted runtime_at_start to storage immediately.
                 # Otherwise, if HA restarts, it will load the old (positive) runtime_at_start
                 # and ignore this daily reset, leading to incorrect usage calculation.
-                async with self._storage_lock:
-                    try:
-                        data = await self._store.async_load() or {}
-                        data["runtime_at_start"] = self._runtime_at_timer_start
-                        await self._store.async_save(data)
-                        _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Persisted adjusted runtime_at_start: {self._runtime_at_timer_start}s")
-                    except Exception as e:
-                        _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to persist adjusted runtime_at_start: {e}")
+                try:
+                    await self._store.async_update({"runtime_at_start": self._runtime_at_timer_start})
+                    _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Persisted adjusted runtime_at_start: {self._runtime_at_timer_start}s")
+                except Exception as e:
+                    _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to persist adjusted runtime_at_start: {e}")
 
+            # The finished day goes into the ring buffer (days missed offline count as zero)
+            self._daily_totals.push(self._state)
+            for _ in range(min(days_missed, RING_DAYS) - 1):
+                self._daily_totals.push(0.0)
+            await self._store.async_update({"daily_totals": self._daily_totals.as_storage()})
+            for rolling_sensor in self._rolling_sensors:
+                rolling_sensor.async_write_ha_state()
+
+            await self._async_reset_energy()
             self._state = 0.0
             self._last_on_timestamp = None
+            await self._async_reset_member_runtime()
             
-            if self._switch_entity_id:
-                current_switch_state = self.hass.states.get(self._switch_entity_id)
-                if current_switch_state and current_switch_state.state == STATE_ON:
-                    self._last_on_timestamp = dt_util.utcnow()
-                    await self._start_realtime_accumulation()
+            if self._is_switch_on():
+                self._last_on_timestamp = dt_util.utcnow()
+                await self._start_realtime_accumulation()
             
             self.async_write_ha_state()
         finally:
@@ -611,33 +830,53 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         await self._handle_name_change()
 
     async def _start_timer_update_task(self):
-        """Start timer update task."""
-        if self._timer_update_task:
+        """Start per-second countdown updates."""
+        if self._counting_down:
             return
-            
-        # Use standard HA timer helper instead of a custom loop
-        self._timer_update_task = async_track_time_interval(
-            self.hass, self._async_timer_update_tick, timedelta(seconds=1)
-        )
+
+        self._counting_down = True
+        self._async_sync_tick_listener()
 
     async def _stop_timer_update_task(self):
-        """Stop timer update task."""
-        if self._timer_update_task:
-            self._timer_update_task()  # Remove callback
-            self._timer_update_task = None
+        """Stop per-second countdown updates."""
+        self._counting_down = False
+        self._async_sync_tick_listener()
 
     @callback
-    async def _async_timer_update_tick(self, now):
-        """Timer update tick."""
-        if self._timer_state != "active" or not self._timer_finishes_at or self._stop_event_received:
-            await self._stop_timer_update_task()
-            return
+    def _async_sync_tick_listener(self) -> None:
+        """Subscribe to the shared tick only while accumulating or counting down."""
+        # Lazy mode computes runtime on read and the card counts down from
+        # timer_finishes_at, so it never needs the per-second tick.
+        needs_tick = not self._lazy_accumulation and (self._accumulating or self._counting_down)
+        if needs_tick and self._tick_unsub is None:
+            self._tick_unsub = async_get_tick_hub(self.hass).async_add_listener(self._async_tick)
+        elif not needs_tick and self._tick_unsub is not None:
+            self._tick_unsub()
+            self._tick_unsub = None
 
-        if self._calculate_timer_remaining() <= 0:
-            await self._stop_timer_update_task()
-            return
-        
-        self.async_write_ha_state()
+    @callback
+    def _async_tick(self, now) -> None:
+        """Shared one-second tick: accumulate runtime and refresh the countdown."""
+        changed = False
+
+        if self._accumulating:
+            changed = self._async_update_accumulated_runtime(now, write_state=False)
+
+        if self._counting_down:
+            if (
+                self._timer_state != "active"
+                or not self._timer_finishes_at
+                or self._stop_event_received
+                or self._calculate_timer_remaining() <= 0
+            ):
+                self._counting_down = False
+                self._async_sync_tick_listener()
+            else:
+                changed = True
+
+        # One state write per tick, even when both accumulating and counting down
+        if changed:
+            self.async_write_ha_state()
 
     async def _async_setup_switch_listener(self) -> None:
         """Set up switch state change listener."""
@@ -645,10 +884,17 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._state_listener_disposer()
         
         if self._switch_entity_id:
-            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Setting up switch listener for: {self._switch_entity_id}")
+            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Setting up switch listener for: {', '.join(self._switch_entities)}")
+            # One listener for the switch and all group members
             self._state_listener_disposer = async_track_state_change_event(
-                self.hass, self._switch_entity_id, self._handle_switch_change_event
+                self.hass, self._switch_entities, self._handle_switch_change_event
             )
+            self._group_state = self._switch_state()
+            now = dt_util.utcnow()
+            self._track_runtime_interval(self._group_state, now)
+            for member in self._group_members:
+                if self._member_is_on(member):
+                    self._member_on_since.setdefault(member, now)
         else:
             _LOGGER.warning(f"Simple Timer: [{self._entry_id}] No switch entity configured")
 
@@ -671,12 +917,129 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         self.async_write_ha_state()
 
+    async def _async_update_group_members(self, group_members: list[str]) -> None:
+        """Apply a changed group member list (re-subscribes the single listener)."""
+        members = [m for m in group_members if m != self._switch_entity_id]
+        if members == self._group_members:
+            return
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Group members changed to: {members}")
+        self._async_fold_member_runtime()
+        self._group_members = members
+        self._member_on_since = {}
+        self._member_runtime = {m: v for m, v in self._member_runtime.items() if m in members}
+        await self._async_setup_switch_listener()
+        self.async_write_ha_state()
+
+    @property
+    def _switch_entities(self) -> list[str]:
+        """Return the switch followed by the group members."""
+        if not self._switch_entity_id:
+            return []
+        return [self._switch_entity_id, *self._group_members]
+
+    def _member_is_on(self, entity_id: str) -> bool:
+        """Return True if one group member is on."""
+        state = self.hass.states.get(entity_id)
+        return state is not None and state.state == STATE_ON
+
+    def _switch_state(self) -> str | None:
+        """Return the switch state, aggregated over group members ("any on")."""
+        if not self._group_members:
+            state = self.hass.states.get(self._switch_entity_id) if self._switch_entity_id else None
+            return state.state if state else None
+        states = [s.state for entity_id in self._switch_entities if (s := self.hass.states.get(entity_id))]
+        if not states:
+            return None
+        if STATE_ON in states:
+            return STATE_ON
+        if STATE_OFF in states:
+            return STATE_OFF
+        return states[0]
+
+    @callback
+    def _async_command_members(self, desired_state: str) -> None:
+        """Send one batched on/off call to the group members not yet in that state."""
+        members = [m for m in self._group_members if (s := self.hass.states.get(m)) is None or s.state != desired_state]
+        if not members:
+            return
+
+        async def _async_call() -> None:
+            try:
+                await self.hass.services.async_call(
+                    "homeassistant", f"turn_{desired_state}", {"entity_id": members}, blocking=True
+                )
+            except Exception as e:
+                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not turn {desired_state} group members {members}: {e}")
+
+        self.hass.async_create_task(_async_call())
+
+    @callback
+    def _async_command_switches(self, desired_state: str) -> None:
+        """Queue the switch command and send the group members theirs in one batch."""
+        if self._switch_entity_id:
+            async_actuate(self.hass, self._switch_entity_id, desired_state)
+        self._async_command_members(desired_state)
+
+    def _calculate_member_runtime(self) -> dict[str, int]:
+        """Return today's on-time per group member in whole seconds."""
+        now = dt_util.utcnow()
+        return {
+            member: int(self._member_runtime.get(member, 0.0) + (
+                (now - self._member_on_since[member]).total_seconds() if member in self._member_on_since else 0
+            ))
+            for member in self._group_members
+        }
+
+    @callback
+    def _async_fold_member_runtime(self) -> None:
+        """Fold running member sessions into the totals (before resets/changes)."""
+        now = dt_util.utcnow()
+        for member, since in self._member_on_since.items():
+            self._member_runtime[member] = self._member_runtime.get(member, 0.0) + (now - since).total_seconds()
+            self._member_on_since[member] = now
+
+    async def _async_reset_member_runtime(self) -> None:
+        """Start a new day of per-member runtime."""
+        if not self._group_members and not self._member_runtime:
+            return
+        now = dt_util.utcnow()
+        self._member_runtime = {}
+        self._member_on_since = {member: now for member in self._group_members if self._member_is_on(member)}
+        await self._store.async_remove("member_runtime")
+
+    @callback
+    def _async_track_member(self, event: Event) -> None:
+        """Update one member's on-time from its state change."""
+        entity_id = event.data.get("entity_id")
+        if entity_id not in self._group_members:
+            return
+        new_state = event.data.get("new_state")
+        now = dt_util.utcnow()
+        if new_state is not None and new_state.state == STATE_ON:
+            self._member_on_since.setdefault(entity_id, now)
+        elif (since := self._member_on_since.pop(entity_id, None)) is not None:
+            self._member_runtime[entity_id] = self._member_runtime.get(entity_id, 0.0) + (now - since).total_seconds()
+            self.hass.async_create_task(self._store.async_update({"member_runtime": dict(self._member_runtime)}))
+
     @callback
     def _handle_switch_change_event(self, event: Event) -> None:
         """Handle switch state change events."""
         if self._stop_event_received:
             return
-        self._handle_switch_change(event)
+
+        if not self._group_members:
+            old_state = event.data.get("old_state")
+            new_state = event.data.get("new_state")
+            self._handle_switch_change(old_state.state if old_state else None, new_state.state if new_state else None)
+            return
+
+        # Group: only a change of the aggregated state is a switch transition
+        self._async_track_member(event)
+        old_group_state, self._group_state = self._group_state, self._switch_state()
+        if self._group_state != old_group_state:
+            self._handle_switch_change(old_group_state, self._group_state)
+        else:
+            self.async_write_ha_state()
 
     async def _handle_config_entry_update(self, hass: HomeAssistant, entry: ConfigEntry):
         """Handle config entry updates including reset time changes."""
@@ -694,27 +1057,70 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.info(f"Simple Timer: [{self._entry_id}] Switch entity changed to: {new_switch_entity}")
             await self.async_update_switch_entity(new_switch_entity)
         
+        # 2b. Group members
+        await self._async_update_group_members(entry.data.get("group_members", []))
+
         # 3. Reset Time
         await self._update_reset_time()
 
         # 4. Default Timer Config
         await self._update_default_timer_config()
 
+        # 5. Accumulation mode
+        await self._update_accumulation_config()
+
+        # 6. Power sensor / energy
+        power_sensor = entry.data.get("power_sensor") or None
+        if bool(power_sensor) != bool(self._power_sensor):
+            # The energy entity comes and goes with the power sensor
+            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Power sensor {'added' if power_sensor else 'removed'} - reloading")
+            self.hass.config_entries.async_schedule_reload(self._entry_id)
+            return
+        self._energy.method = entry.data.get("energy_method", DEFAULT_ENERGY_METHOD)
+        if power_sensor != self._power_sensor:
+            self._power_sensor = power_sensor
+            self._async_setup_power_listener()
+
+        # 7. Daily budget
+        daily_budget = self._parse_daily_budget(entry.data.get("daily_budget", DEFAULT_DAILY_BUDGET))
+        if daily_budget != self._daily_budget:
+            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Daily budget changed to {daily_budget}h")
+            self._daily_budget = daily_budget
+            self._async_arm_budget_cutoff()
+            self.async_write_ha_state()
+
     @callback
-    def _handle_switch_change(self, event: Event) -> None:
-        """Process switch state changes for runtime calculation."""
+    def _track_runtime_interval(self, state: str | None, now: datetime) -> None:
+        """Open or close the statistics interval on a definitive on/off."""
+        if state == STATE_ON:
+            if self._runtime_intervals.on_since is not None:
+                return
+            self._runtime_intervals.switch_on(now)
+        elif state == STATE_OFF:
+            if self._runtime_intervals.on_since is None:
+                return
+            self._runtime_intervals.switch_off(now)
+        else:
+            return
+        self.hass.async_create_task(
+            self._store.async_update({STORAGE_KEY_STATISTICS: self._runtime_intervals.as_storage()})
+        )
+
+    @callback
+    def _handle_switch_change(self, from_state: str | None, to_state: str | None) -> None:
+        """Process switch (or aggregated group) state changes for runtime calculation."""
         if self._stop_event_received:
             return
 
-        from_state = event.data.get("old_state")
-        to_state = event.data.get("new_state")
         now = dt_util.utcnow()
 
         if not to_state:
             return
 
+        self._track_runtime_interval(to_state, now)
+
         # Switch turned on
-        if to_state.state == STATE_ON and (not from_state or from_state.state != STATE_ON):
+        if to_state == STATE_ON and from_state != STATE_ON:
             if self._watchdog_message:
                 self._watchdog_message = None
             self._last_on_timestamp = now
@@ -722,17 +1128,19 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
             # Auto-start default timer if enabled and idle
             _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch ON detected. Default timer enabled: {self._default_timer_enabled}, State: {self._timer_state}")
-            if self._default_timer_enabled and self._timer_state == "idle" and self._default_timer_duration > 0:
+            if self._default_timer_enabled and self._timer_state == "idle" and self._default_timer_duration > 0 and not self._cycle:
                 _LOGGER.info(f"Simple Timer: [{self._entry_id}] Auto-starting default timer ({self._default_timer_duration} {self._default_timer_unit}, reverse={self._default_timer_reverse_mode})")
                 self.hass.async_create_task(
                     self.async_start_timer(self._default_timer_duration, self._default_timer_unit, reverse_mode=self._default_timer_reverse_mode)
                 )
 
         # Switch transitioned to a non-ON state
-        elif to_state.state != STATE_ON:
-            is_definitive_off = to_state.state == STATE_OFF
+        elif to_state != STATE_ON:
+            is_definitive_off = to_state == STATE_OFF
 
             if is_definitive_off:
+                # Fold the session before dropping its start timestamp
+                self._async_fold_accumulated_runtime()
                 self.hass.async_create_task(self._stop_realtime_accumulation())
                 self._last_on_timestamp = None
 
@@ -750,13 +1158,16 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         self.async_write_ha_state()
 
-    async def _cleanup_timer_state(self):
-        """Clean up timer state and storage."""
+    async def _cleanup_timer_state(self, outcome: str | None = None):
+        """Clean up timer state and storage; with an outcome, journal the run first."""
         if self._timer_unsub:
             self._timer_unsub()
             self._timer_unsub = None
         
         await self._stop_timer_update_task()
+
+        if outcome and self._timer_state != "idle" and self._timer_start_moment:
+            await self._async_journal_run(outcome)
         
         self._timer_state = "idle"
         self._timer_finishes_at = None
@@ -764,18 +1175,39 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._timer_start_moment = None
         self._runtime_at_timer_start = 0
         self._timer_start_method = None
+        self._timer_paused_remaining = None
+        self._timer_paused_at = None
         
         # Clean storage
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                data.pop("finishes_at", None)
-                data.pop("duration", None)
-                data.pop("timer_start", None)
-                data.pop("runtime_at_start", None)
-                await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not clean timer storage: {e}")
+        try:
+            await self._store.async_remove(
+                "finishes_at", "duration", "timer_start", "runtime_at_start", "paused_remaining", "paused_at"
+            )
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not clean timer storage: {e}")
+
+    async def _async_journal_run(self, outcome: str) -> None:
+        """Append the run that is ending to the session journal."""
+        now = dt_util.utcnow()
+        if self._timer_finishes_at and self._timer_finishes_at < now:
+            # Expired while Home Assistant was down
+            now = self._timer_finishes_at
+        elapsed = max(0.0, (now - self._timer_start_moment).total_seconds())
+        # Reverse mode waits with the device off; otherwise the run is the usage since the start
+        runtime = 0.0 if self._timer_reverse_mode else min(max(0.0, self._state - self._runtime_at_timer_start), elapsed)
+        try:
+            await async_get_session_journal(self.hass).async_append(
+                self._entry_id,
+                self._timer_start_moment,
+                now,
+                "reverse" if self._timer_reverse_mode else "normal",
+                self._timer_start_method,
+                self._timer_duration * 60,
+                runtime,
+                outcome,
+            )
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not journal run: {e}")
 
     async def _auto_cancel_timer_on_external_off(self):
         """Auto-cancel timer when switch is turned off externally."""
@@ -784,15 +1216,12 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._watchdog_message:
             self._watchdog_message = None
         
-        await self._cleanup_timer_state()
+        await self._cleanup_timer_state("cancelled")
         self.async_write_ha_state()
         
     def _is_switch_on(self) -> bool:
-        """Check if the monitored switch is currently on."""
-        if self._switch_entity_id:
-            switch_state = self.hass.states.get(self._switch_entity_id)
-            return switch_state is not None and switch_state.state == STATE_ON
-        return False
+        """Check if the monitored switch (or any group member) is currently on."""
+        return self._switch_state() == STATE_ON
 
     async def _start_realtime_accumulation(self) -> None:
         """Start real-time accumulation task."""
@@ -800,13 +1229,11 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             return
         
         # If already running, don't start again
-        if self._accumulation_task:
+        if self._accumulating:
             return
             
-        current_switch_state = self.hass.states.get(self._switch_entity_id) if self._switch_entity_id else None
-        
         # Only start if switch is ON (or we are in a permissive state)
-        if current_switch_state and current_switch_state.state == STATE_ON:
+        if self._is_switch_on():
             if not self._last_on_timestamp:
                 self._last_on_timestamp = dt_util.utcnow()
         else:
@@ -817,17 +1244,157 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # The base state is the state at the beginning of THIS accumulation session
         self._last_accumulated_seconds = 0
         
-        # Use standard HA timer helper instead of a custom loop
-        # Update once per second - the frontend card handles smooth interpolation
-        self._accumulation_task = async_track_time_interval(
-            self.hass, self._async_update_accumulated_runtime, timedelta(seconds=1)
+        # Updated once per second from the shared domain tick - the frontend card
+        # handles smooth interpolation. Lazy mode only writes at a coarse cadence.
+        self._accumulating = True
+        if self._lazy_accumulation:
+            self._lazy_write_unsub = async_track_time_interval(
+                self.hass, self._async_lazy_state_write, timedelta(seconds=self._state_write_interval)
+            )
+            self.async_write_ha_state()
+        self._async_sync_tick_listener()
+        self._async_arm_budget_cutoff()
+        self._energy.start(dt_util.utcnow(), self._read_power())
+
+    def _read_power(self) -> float | None:
+        """Return the linked power sensor's current value in watts."""
+        if not self._power_sensor or not (state := self.hass.states.get(self._power_sensor)):
+            return None
+        return power_to_watts(state.state, state.attributes.get("unit_of_measurement"))
+
+    @callback
+    def _async_setup_power_listener(self) -> None:
+        """Follow the linked power sensor's state changes (no polling)."""
+        if self._power_unsub:
+            self._power_unsub()
+            self._power_unsub = None
+        if not self._power_sensor:
+            return
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Integrating energy from {self._power_sensor} ({self._energy.method})")
+        self._power_unsub = async_track_state_change_event(
+            self.hass, self._power_sensor, self._handle_power_change_event
         )
+        if self._energy.active:
+            # Sample the current value rather than one from before the switch
+            self._energy.sample(dt_util.utcnow(), self._read_power())
+
+    @callback
+    def _handle_power_change_event(self, event: Event) -> None:
+        """Add the energy since the previous power value."""
+        if self._stop_event_received or not self._energy.active:
+            return
+        new_state = event.data.get("new_state")
+        power = power_to_watts(new_state.state, new_state.attributes.get("unit_of_measurement")) if new_state else None
+        if self._energy.sample(new_state.last_updated if new_state else dt_util.utcnow(), power):
+            self._async_energy_changed()
+
+    @callback
+    def _async_energy_changed(self) -> None:
+        """Persist the energy total (debounced) and refresh the energy sensor."""
+        if not self._power_sensor:
+            return
+        self.hass.async_create_task(self._store.async_update({"energy": self._energy_as_storage()}))
+        if self._energy_sensor is not None:
+            self._energy_sensor.async_write_ha_state()
+
+    def _energy_as_storage(self) -> list:
+        """Return the stored energy: [kwh, last_reset]."""
+        return [round(self._energy.energy, 6), self._energy_last_reset.isoformat() if self._energy_last_reset else None]
+
+    def _restore_energy(self, storage_data: dict) -> None:
+        """Restore the energy total and when it was last reset."""
+        try:
+            energy, last_reset = storage_data.get("energy") or [0.0, None]
+            self._energy.energy = float(energy)
+            self._energy_last_reset = datetime.fromisoformat(last_reset) if last_reset else None
+        except (TypeError, ValueError):
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not restore energy total")
+        self._energy_restored = True
+        # The energy sensor was added before the restore; show the restored total
+        if self._energy_sensor is not None and self._energy_sensor.hass is not None:
+            self._energy_sensor.async_write_ha_state()
+
+    async def _async_reset_energy(self) -> None:
+        """Start the energy total over (daily and manual resets)."""
+        now = dt_util.utcnow()
+        self._energy.reset(now)
+        self._energy_last_reset = now
+        if self._power_sensor:
+            await self._store.async_update({"energy": self._energy_as_storage()})
+        if self._energy_sensor is not None:
+            self._energy_sensor.async_write_ha_state()
+
+    @callback
+    def _async_arm_budget_cutoff(self) -> None:
+        """Arm (or clear) the single deadline at which today's usage reaches the budget.
+
+        The cutoff follows from the usage folded so far and the session start, so
+        nothing is compared per second and a restart simply re-arms it.
+        """
+        if not self._daily_budget or not self._accumulating or not self._last_on_timestamp:
+            self._async_disarm_budget_cutoff()
+            return
+
+        self._async_fold_accumulated_runtime()
+        remaining = self._daily_budget * 3600 - self._state
+        # Usage of this session folded into _state so far is already counted
+        session_counted = self._last_accumulated_seconds
+        cutoff = self._last_on_timestamp + timedelta(seconds=session_counted + max(0.0, remaining))
+        if cutoff == self._budget_cutoff_at and self._budget_unsub and self._budget_unsub.active:
+            return
+
+        deadlines = async_get_deadline_scheduler(self.hass)
+        if self._budget_unsub:
+            self._budget_unsub = deadlines.async_reschedule(self._budget_unsub, cutoff)
+        else:
+            self._budget_unsub = deadlines.async_schedule(cutoff, self._budget_cutoff_reached)
+        self._budget_cutoff_at = cutoff
+        _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Daily budget cutoff armed for {cutoff.isoformat()}")
+
+    @callback
+    def _async_disarm_budget_cutoff(self) -> None:
+        """Cancel the budget deadline."""
+        if self._budget_unsub:
+            self._budget_unsub()
+        self._budget_cutoff_at = None
+
+    @callback
+    def _budget_cutoff_reached(self, now: datetime) -> None:
+        """Deadline callback for the budget cutoff."""
+        self.hass.async_create_task(self._async_budget_cutoff())
+
+    async def _async_budget_cutoff(self) -> None:
+        """Turn the switch off once today's usage has reached the budget."""
+        if self._stop_event_received or not self._accumulating or not self._daily_budget:
+            return
+
+        self._async_fold_accumulated_runtime()
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Daily budget of {self._daily_budget}h reached - turning off")
+        self._budget_cutoff_at = None
+        if self._cycle:
+            await self._async_end_cycle(turn_off=True)
+        elif self._switch_entity_id:
+            # Also turns off group members; a coupled timer is cancelled by the resulting switch-off
+            await self._ensure_switch_state("off", "Daily budget cutoff", blocking=True)
+
+        notification_entity, show_seconds = await self._get_card_notification_config()
+        formatted_time, label = self._format_time_for_notification(self._state, show_seconds)
+        await self._send_notification(f"Daily budget reached - device turned off after {formatted_time} {label}")
+        self.async_write_ha_state()
 
     async def _stop_realtime_accumulation(self) -> None:
         """Stop real-time accumulation task."""
-        if self._accumulation_task:
-            self._accumulation_task()  # This is a remove callback for async_track_time_interval
-            self._accumulation_task = None
+        self._async_disarm_budget_cutoff()
+        if self._energy.active:
+            self._energy.stop(dt_util.utcnow())
+            self._async_energy_changed()
+        if self._lazy_write_unsub:
+            self._lazy_write_unsub()
+            self._lazy_write_unsub = None
+
+        if self._accumulating:
+            self._accumulating = False
+            self._async_sync_tick_listener()
             
         # Ensure final state update when stopping
         if self._last_on_timestamp:
@@ -835,22 +1402,38 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
              self._async_update_accumulated_runtime(dt_util.utcnow(), final_update=True)
 
     @callback
-    def _async_update_accumulated_runtime(self, now, final_update=False) -> None:
-        """Periodically update the accumulated runtime."""
+    def _async_lazy_state_write(self, now) -> None:
+        """Coarse-cadence write for lazy accumulation: fold pending runtime and write."""
+        self._async_update_accumulated_runtime(now)
+
+    @callback
+    def _async_fold_accumulated_runtime(self) -> None:
+        """Bring _state up to date before it is read directly or the session ends."""
+        if not self._accumulating or not self._last_on_timestamp:
+            return
+        total_elapsed = round((dt_util.utcnow() - self._last_on_timestamp).total_seconds())
+        diff = total_elapsed - self._last_accumulated_seconds
+        if diff > 0:
+            self._state += diff
+            self._last_accumulated_seconds = total_elapsed
+
+    @callback
+    def _async_update_accumulated_runtime(self, now, final_update=False, write_state=True) -> bool:
+        """Periodically update the accumulated runtime. Returns True if it changed."""
         if self._stop_event_received or not self._switch_entity_id:
             if not final_update:
                 self.hass.async_create_task(self._stop_realtime_accumulation())
-            return
+            return False
 
-        current_switch_state = self.hass.states.get(self._switch_entity_id)
+        current_switch_state = self._switch_state()
         
         # Accumulate ONLY if switch is ON
         should_accumulate = (
             current_switch_state 
             and self._last_on_timestamp
             and (
-                current_switch_state.state == STATE_ON 
-                or current_switch_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+                current_switch_state == STATE_ON 
+                or current_switch_state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
             )
         )
 
@@ -870,22 +1453,19 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             if diff > 0:
                 self._state += diff
                 self._last_accumulated_seconds = current_whole_second
-                self.async_write_ha_state()
+                if write_state:
+                    self.async_write_ha_state()
+                return True
         else:
             if not final_update:
                 self.hass.async_create_task(self._stop_realtime_accumulation())
+        return False
 
     async def async_start_timer(self, duration: float, unit: str = "min", reverse_mode: bool = False, start_method: str = "button") -> None:
         """Start a countdown timer with synchronized accumulation."""
         
         # Convert duration to minutes for internal storage
-        duration_minutes = duration
-        if unit in ["s", "sec", "seconds"]:
-             duration_minutes = duration / 60.0
-        elif unit in ["h", "hr", "hours"]:
-             duration_minutes = duration * 60
-        elif unit in ["d", "day", "days"]:
-             duration_minutes = duration * 1440
+        duration_minutes = self._duration_to_minutes(duration, unit)
              
         # Format for logging and notification
         unit_display = unit
@@ -920,9 +1500,19 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._timer_unsub()
             self._timer_unsub = None
         await self._stop_timer_update_task()
+        if self._cycle:
+            # A plain timer replaces a running duty cycle
+            await self._async_end_cycle(turn_off=False)
+
+        if self._timer_paused_remaining is not None:
+            # Starting over replaces a paused timer
+            self._timer_paused_remaining = None
+            self._timer_paused_at = None
+            await self._store.async_remove("paused_remaining", "paused_at")
         
         # Store the runtime at timer start
         # For reverse mode, we don't want to count runtime until switch actually turns ON
+        self._async_fold_accumulated_runtime()
         if reverse_mode:
             self._runtime_at_timer_start = self._state  # Set to current runtime, but don't accumulate until timer finishes
         else:
@@ -939,12 +1529,12 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             # NORMAL MODE: Convenience turn ON, but don't wait for it
             current_switch_state = self.hass.states.get(self._switch_entity_id) if self._switch_entity_id else None
             if not current_switch_state or current_switch_state.state != STATE_ON:
-                await self.hass.services.async_call(
-                   "homeassistant", "turn_on", {"entity_id": self._switch_entity_id}, blocking=False
-                )
+                # Queued so that many timers starting at once are staggered per mesh
+                async_actuate(self.hass, self._switch_entity_id, "on")
                 # DECOUPLED: Do NOT wait for state change. Start timer immediately.
                 # User can turn switch on/off manually during timer.
-        
+            self._async_command_members("on")
+
         # Now set timer start time and duration atomically
         timer_start_moment = dt_util.utcnow()
         self._timer_duration = duration_minutes
@@ -958,16 +1548,13 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             self._last_on_timestamp = timer_start_moment
         
         # Save timer state to storage
-        async with self._storage_lock:
-            data = await self._store.async_load() or {}
-            data.update({
-               "finishes_at": self._timer_finishes_at.isoformat(),
-               "duration": duration_minutes,
-               "timer_start": timer_start_moment.isoformat(),  # Store exact start time
-               "runtime_at_start": self._runtime_at_timer_start,  # Store runtime when timer started
-               "reverse_mode": reverse_mode
-            })
-            await self._store.async_save(data)
+        await self._store.async_update({
+           "finishes_at": self._timer_finishes_at.isoformat(),
+           "duration": duration_minutes,
+           "timer_start": timer_start_moment.isoformat(),  # Store exact start time
+           "runtime_at_start": self._runtime_at_timer_start,  # Store runtime when timer started
+           "reverse_mode": reverse_mode
+        })
         
         # Start timer tasks
         await self._start_timer_update_task()
@@ -979,8 +1566,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         # Set up timer completion callback
         if self._timer_finishes_at:
-            self._timer_unsub = async_track_point_in_utc_time(
-               self.hass, self._async_timer_finished, self._timer_finishes_at
+            self._timer_unsub = async_get_deadline_scheduler(self.hass).async_schedule(
+               self._timer_finishes_at, self._async_timer_finished
             )
         
         # Send notification
@@ -996,13 +1583,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             return
 
         # Convert duration to minutes
-        duration_minutes = duration
-        if unit in ["s", "sec", "seconds"]:
-             duration_minutes = duration / 60.0
-        elif unit in ["h", "hr", "hours"]:
-             duration_minutes = duration * 60
-        elif unit in ["d", "day", "days"]:
-             duration_minutes = duration * 1440
+        duration_minutes = self._duration_to_minutes(duration, unit)
              
         # Format for notification
         unit_display = unit
@@ -1049,21 +1630,17 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._timer_finishes_at += timedelta(minutes=duration_minutes)
         
         # Update storage
-        async with self._storage_lock:
-            data = await self._store.async_load() or {}
-            data.update({
-               "finishes_at": self._timer_finishes_at.isoformat(),
-               "duration": self._timer_duration,
-            })
-            await self._store.async_save(data)
+        await self._store.async_update({
+           "finishes_at": self._timer_finishes_at.isoformat(),
+           "duration": self._timer_duration,
+        })
             
-        # Update timer completion callback
+        # Update timer completion callback (moves the existing deadline in place)
+        deadlines = async_get_deadline_scheduler(self.hass)
         if self._timer_unsub:
-            self._timer_unsub()
-            
-        self._timer_unsub = async_track_point_in_utc_time(
-           self.hass, self._async_timer_finished, self._timer_finishes_at
-        )
+            self._timer_unsub = deadlines.async_reschedule(self._timer_unsub, self._timer_finishes_at)
+        else:
+            self._timer_unsub = deadlines.async_schedule(self._timer_finishes_at, self._async_timer_finished)
         
         # Send notification
         remaining_seconds = max(0, int((self._timer_finishes_at - dt_util.utcnow()).total_seconds()))
@@ -1073,6 +1650,104 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         await self._send_notification(f"Timer extended by {duration_display} {unit_display}. New remaining: {formatted_rest} {label}")
         self.async_write_ha_state()
 
+    async def async_pause_timer(self) -> None:
+        """Freeze an active timer's remaining time and accumulation.
+
+        Only the completion deadline is dropped; the switch listener and the
+        deadline handle are kept so resuming is just a reschedule.
+        """
+        if self._timer_state != "active" or not self._timer_finishes_at:
+            raise ServiceValidationError("Timer is not active")
+
+        now = dt_util.utcnow()
+        self._timer_paused_remaining = max(0.0, (self._timer_finishes_at - now).total_seconds())
+        self._timer_paused_at = now
+        self._timer_finishes_at = None
+        # Set before switching off so the switch listener doesn't treat it as a cancel
+        self._timer_state = "paused"
+
+        if self._timer_unsub:
+            self._timer_unsub()
+        await self._stop_timer_update_task()
+
+        self._async_fold_accumulated_runtime()
+        await self._store.async_update({
+            "paused_remaining": self._timer_paused_remaining,
+            "paused_at": now.isoformat(),
+        })
+        await self._store.async_remove("finishes_at")
+
+        if not self._timer_reverse_mode and self._switch_entity_id:
+            # Normal mode: the device is off while paused
+            self._async_command_switches("off")
+
+        remaining = round(self._timer_paused_remaining)
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Timer paused with {remaining}s remaining")
+        notification_entity, show_seconds = await self._get_card_notification_config()
+        formatted_rest, label = self._format_time_for_notification(remaining, show_seconds)
+        await self._send_notification(f"Timer paused - {formatted_rest} {label} left")
+        self.async_write_ha_state()
+
+    async def async_resume_timer(self) -> None:
+        """Continue a paused timer by re-arming its completion deadline."""
+        if self._timer_state != "paused" or self._timer_paused_remaining is None:
+            raise ServiceValidationError("Timer is not paused")
+
+        now = dt_util.utcnow()
+        # Shift the start forward by the pause so elapsed time excludes it
+        if self._timer_start_moment and self._timer_paused_at:
+            self._timer_start_moment += now - self._timer_paused_at
+        self._timer_finishes_at = now + timedelta(seconds=self._timer_paused_remaining)
+        self._timer_paused_remaining = None
+        self._timer_paused_at = None
+        self._timer_state = "active"
+
+        deadlines = async_get_deadline_scheduler(self.hass)
+        if self._timer_unsub:
+            self._timer_unsub = deadlines.async_reschedule(self._timer_unsub, self._timer_finishes_at)
+        else:
+            self._timer_unsub = deadlines.async_schedule(self._timer_finishes_at, self._async_timer_finished)
+        await self._start_timer_update_task()
+
+        await self._store.async_update({
+            "finishes_at": self._timer_finishes_at.isoformat(),
+            "timer_start": self._timer_start_moment.isoformat() if self._timer_start_moment else None,
+        })
+        await self._store.async_remove("paused_remaining", "paused_at")
+
+        if not self._timer_reverse_mode and self._switch_entity_id:
+            self._async_command_switches("on")
+
+        remaining = round((self._timer_finishes_at - now).total_seconds())
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Timer resumed with {remaining}s remaining")
+        notification_entity, show_seconds = await self._get_card_notification_config()
+        formatted_rest, label = self._format_time_for_notification(remaining, show_seconds)
+        await self._send_notification(f"Timer resumed - {formatted_rest} {label} left")
+        self.async_write_ha_state()
+
+    def _restore_paused_timer(self, storage_data: dict) -> None:
+        """Restore a paused timer as-is; nothing is armed until it is resumed."""
+        try:
+            self._timer_paused_remaining = float(storage_data["paused_remaining"])
+            self._timer_paused_at = datetime.fromisoformat(storage_data["paused_at"]) if storage_data.get("paused_at") else dt_util.utcnow()
+            if storage_data.get("timer_start"):
+                self._timer_start_moment = datetime.fromisoformat(storage_data["timer_start"])
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Bad stored paused timer: {e}")
+            self._timer_paused_remaining = None
+            self._timer_paused_at = None
+            self._timer_state = "idle"
+            return
+
+        self._timer_duration = storage_data.get("duration", self._timer_duration)
+        self._runtime_at_timer_start = storage_data.get("runtime_at_start", 0)
+        self._timer_reverse_mode = storage_data.get("reverse_mode", False)
+        self._timer_finishes_at = None
+        self._timer_state = "paused"
+        _LOGGER.info(
+            f"Simple Timer: [{self._entry_id}] Restored paused timer with {round(self._timer_paused_remaining)}s remaining"
+        )
+
     async def async_cancel_timer(self, turn_off_entity: bool = True) -> None:
         """Cancel an active timer."""
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Cancelling timer")
@@ -1083,6 +1758,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._watchdog_message:
             self._watchdog_message = None
         
+        self._async_fold_accumulated_runtime()
+
         # For cancelled timers, ensure we use the actual elapsed time, not the full duration
         if self._timer_start_moment:
             actual_elapsed = round((dt_util.utcnow() - self._timer_start_moment).total_seconds())
@@ -1096,7 +1773,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         formatted_time, label = self._format_time_for_notification(current_usage, show_seconds)
         
         # Clean up timer
-        await self._cleanup_timer_state()
+        await self._cleanup_timer_state("cancelled")
         
         # Handle switch state based on timer mode
         reverse_mode = getattr(self, '_timer_reverse_mode', False)
@@ -1112,9 +1789,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 # COUPLED: Turn switch OFF.
                 if self._switch_entity_id:
                     try:
-                        await self.hass.services.async_call(
-                            "homeassistant", "turn_off", {"entity_id": self._switch_entity_id}, blocking=True
-                        )
                         await self._ensure_switch_state("off", "Timer cancellation turn-off")
                         await self._stop_realtime_accumulation()
                     except Exception as e:
@@ -1149,12 +1823,9 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             
             if reverse_mode:
                 # REVERSE MODE: Turn switch ON when timer finishes
-                await self._cleanup_timer_state()
+                await self._cleanup_timer_state("finished")
                 
                 if self._switch_entity_id:
-                    await self.hass.services.async_call(
-                        "homeassistant", "turn_on", {"entity_id": self._switch_entity_id}, blocking=True
-                    )
                     await self._ensure_switch_state("on", "Reverse timer completion turn-on", blocking=True)
                     
                     # Reset state to not count the timer wait time as usage
@@ -1190,7 +1861,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 notification_entity, show_seconds = await self._get_card_notification_config()
                 formatted_time, label = self._format_time_for_notification(current_usage, show_seconds)
                 
-                await self._cleanup_timer_state()
+                await self._cleanup_timer_state("finished")
                 
                 if self._switch_entity_id:
                     await self._ensure_switch_state("off", "Timer completion turn-off", blocking=True)
@@ -1208,6 +1879,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             await self._ensure_switch_state("on", "Manual turn-on")
             await self._send_notification("Timer started")
         elif action == "turn_off":
+            self._async_fold_accumulated_runtime()
             current_usage = self._state
             notification_entity, show_seconds = await self._get_card_notification_config()
             formatted_time, label = self._format_time_for_notification(current_usage, show_seconds)
@@ -1215,13 +1887,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             await self._ensure_switch_state("off", "Manual turn-off")
             await self._send_notification(f"Timer was turned off - daily usage {formatted_time} {label}")
 
-    @callback
-    def _reset_at_scheduled_time(self, now) -> None:
-        """Handle scheduled daily reset."""
-        self.hass.async_create_task(self._async_reset_at_scheduled_time())
-
     async def _async_reset_at_scheduled_time(self):
-        """Perform scheduled daily reset."""
+        """Perform scheduled daily reset (called by the reset coordinator)."""
         await self._perform_reset(is_catchup=False)
         self._next_reset_date = self._get_next_reset_datetime()
         await self._save_next_reset_date()
@@ -1232,21 +1899,26 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Home Assistant shutdown - cancelling tasks")
         
         # Cancel all tasks
-        if self._accumulation_task:
-            self._accumulation_task()
-            self._accumulation_task = None
-            
-        if self._timer_update_task:
-            self._timer_update_task()
-            self._timer_update_task = None
+        self._accumulating = False
+        self._counting_down = False
+        self._async_sync_tick_listener()
             
         if self._timer_unsub:
             self._timer_unsub()
             self._timer_unsub = None
 
+        await self._async_mark_runtime_interval_seen()
+
+    async def _async_mark_runtime_interval_seen(self) -> None:
+        """Record that the switch was on until now, for the next start's statistics."""
+        if self._runtime_intervals.on_since is not None:
+            self._runtime_intervals.seen = dt_util.utcnow()
+            await self._store.async_update({STORAGE_KEY_STATISTICS: self._runtime_intervals.as_storage()})
+
     async def async_will_remove_from_hass(self):
         """Handle entity removal."""
         self._stop_event_received = True
+        async_get_timer_index(self.hass).async_remove_sensor(self._entry_id)
         
         # Remove listeners
         if hasattr(self._entry, 'remove_update_listener'):
@@ -1264,6 +1936,20 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._schedule_unsub:
             self._schedule_unsub()
             self._schedule_unsub = None
+        if self._slot_unsub:
+            self._slot_unsub()
+            self._slot_unsub = None
+        if self._cycle_unsub:
+            self._cycle_unsub()
+            self._cycle_unsub = None
+        self._async_disarm_budget_cutoff()
+        if self._power_unsub:
+            self._power_unsub()
+            self._power_unsub = None
+        if self._statistics_unsub:
+            self._statistics_unsub()
+            self._statistics_unsub = None
+            await self._async_mark_runtime_interval_seen()
 
         # Clean up domain data
         if (DOMAIN in self.hass.data and
@@ -1272,10 +1958,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             del self.hass.data[DOMAIN][self._entry_id]["sensor"]
         
         # Cancel tasks
-        if self._accumulation_task:
-            self._accumulation_task()
-            self._accumulation_task = None
-        
+        self._accumulating = False
         await self._stop_timer_update_task()
         
         if self._timer_unsub:
@@ -1285,6 +1968,9 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._state_listener_disposer:
             self._state_listener_disposer()
             self._state_listener_disposer = None
+
+        # Write any debounced changes now, so a reloaded entity reads fresh data
+        await self._store.async_flush()
         
         self.async_write_ha_state()
         await super().async_will_remove_from_hass()
@@ -1312,6 +1998,28 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self.async_write_ha_state()
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Updated default timer config: {self._default_timer_enabled}, {self._default_timer_duration} {self._default_timer_unit}")
 
+    async def _update_accumulation_config(self):
+        """Switch between realtime and lazy accumulation when the config changes."""
+        lazy = self._entry.data.get("lazy_accumulation", False)
+        interval = self._parse_state_write_interval(self._entry.data.get("state_write_interval"))
+        if lazy == self._lazy_accumulation and interval == self._state_write_interval:
+            return
+
+        # Fold runtime under the old mode, then restart accumulation under the new one
+        was_accumulating = self._accumulating
+        await self._stop_realtime_accumulation()
+        self._lazy_accumulation = lazy
+        self._state_write_interval = interval
+
+        if was_accumulating and self._is_switch_on():
+            # _state already holds the folded session, so start a fresh one now
+            self._last_on_timestamp = dt_util.utcnow()
+            await self._start_realtime_accumulation()
+        self._async_sync_tick_listener()
+
+        self.async_write_ha_state()
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Accumulation mode: {'lazy' if lazy else 'realtime'} (write interval {interval}s)")
+
     async def async_added_to_hass(self):
         """Called when entity is added to hass - startup-safe initialization."""
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Entity added to hass - startup safe mode")
@@ -1322,6 +2030,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._entry_id not in self.hass.data[DOMAIN]:
             self.hass.data[DOMAIN][self._entry_id] = {}
         self.hass.data[DOMAIN][self._entry_id]["sensor"] = self
+        async_get_timer_index(self.hass).async_add_sensor(self._entry_id, self)
         
         # Restore basic state immediately to prevent history gaps
         await self._restore_basic_state()
@@ -1329,8 +2038,13 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # Register shutdown handler
         self.hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, self._handle_ha_shutdown)
         
-        # Defer complex initialization until after startup
-        asyncio.create_task(self._wait_for_startup_completion())
+        # Setup switch entity ID from config early so the bootstrap can group by switch
+        self._switch_entity_id = getattr(self._entry, 'data', {}).get('switch_entity_id')
+        
+        # Defer complex initialization until after startup; the domain bootstrap
+        # restores all timers together once core, services and switches are ready
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Waiting for HA startup or dependencies...")
+        async_get_bootstrap(self.hass).async_register(self)
 
     async def _restore_basic_state(self):
         """Restore basic state values immediately to prevent history gaps."""
@@ -1366,19 +2080,18 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     
                     # Restore runtime_at_timer_start from storage if timer was active
                     if self._timer_state == "active":
-                        async with self._storage_lock:
-                            try:
-                                storage_data = await self._store.async_load()
-                                if storage_data and "runtime_at_start" in storage_data:
-                                    self._runtime_at_timer_start = storage_data["runtime_at_start"]
-                                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_timer_start: {self._runtime_at_timer_start}s")
+                        try:
+                            storage_data = await self._store.async_load()
+                            if storage_data and "runtime_at_start" in storage_data:
+                                self._runtime_at_timer_start = storage_data["runtime_at_start"]
+                                _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_timer_start: {self._runtime_at_timer_start}s")
                                     
-                                # Also restore reverse mode from storage if available (takes precedence)
-                                if "reverse_mode" in storage_data:
-                                    self._timer_reverse_mode = storage_data["reverse_mode"]
-                                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
-                            except Exception as e:
-                                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not restore runtime_at_start or reverse_mode: {e}")
+                            # Also restore reverse mode from storage if available (takes precedence)
+                            if "reverse_mode" in storage_data:
+                                self._timer_reverse_mode = storage_data["reverse_mode"]
+                                _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
+                        except Exception as e:
+                            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not restore runtime_at_start or reverse_mode: {e}")
                         
                 except (ValueError, TypeError) as e:
                     _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not restore state: {e}")
@@ -1390,115 +2103,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error during basic state restoration: {e}")
             self._state = 0.0
 
-    async def _wait_for_startup_completion(self):
-        """Wait for HA startup or essential dependencies with defensive checks."""
-        try:
-            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Waiting for HA startup or dependencies...")
-            
-            # Setup switch entity ID from config early for checks
-            self._switch_entity_id = getattr(self._entry, 'data', {}).get('switch_entity_id')
-            
-            max_wait = 60
-            start_time = dt_util.utcnow()
-            check_interval = 1
-            
-            # 1. Wait for Core State Running
-            if self.hass.state != CoreState.running:
-                _LOGGER.info(f"Simple Timer: [{self._entry_id}] Waiting for HA Core (current: {self.hass.state})...")
-                await self._wait_for_core_state(CoreState.running)
-            
-            # 2. Wait for dependencies even after Core is running
-            # This ensures that even if Core says "running", we give integrations like Z-Wave/Zigbee
-            # a chance to fully initialize their entities.
-            while (dt_util.utcnow() - start_time).total_seconds() < max_wait:
-                if await self._are_dependencies_ready():
-                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Dependencies ready")
-                    break
-                await asyncio.sleep(check_interval)
-            
-            elapsed = (dt_util.utcnow() - start_time).total_seconds()
-            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Startup wait completed after {elapsed:.1f}s")
-            
-            await self._complete_initialization()
-            
-        except Exception as e:
-            _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error during startup wait: {e}")
-            # Always try to initialize even if startup wait fails
-            try:
-                await self._complete_initialization()
-            except Exception as init_error:
-                _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error during fallback initialization: {init_error}")
-
-    async def _wait_for_core_state(self, target_state: CoreState):
-        """Wait for HA core to reach a specific state."""
-        start = dt_util.utcnow()
-        while self.hass.state != target_state:
-            if (dt_util.utcnow() - start).total_seconds() > 60:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Timed out waiting for CoreState.{target_state}")
-                return
-            await asyncio.sleep(1)
-        _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Reached CoreState.{target_state}")
-
-    async def _are_dependencies_ready(self) -> bool:
-        """Check if all essential dependencies are ready."""
-        # 1. Entity Registry
-        if not await self._safe_check_entity_registry():
-            return False
-            
-        # 2. Service Registry
-        if not await self._safe_check_service_registry():
-            return False
-            
-        # 3. Switch Entity (if configured)
-        if not await self._safe_check_switch_entity():
-            return False
-            
-        return True
-
-    async def _safe_check_entity_registry(self) -> bool:
-        """Safely check if entity registry is ready."""
-        try:
-            from homeassistant.helpers import entity_registry as er
-            entity_registry = er.async_get(self.hass)
-            
-            # Basic availability test
-            return entity_registry is not None
-        except ImportError:
-            # Module not available yet
-            return False
-        except Exception:
-            # Any other error
-            return False
-
-    async def _safe_check_service_registry(self) -> bool:
-        """Safely check if essential services are available."""
-        try:
-            services = self.hass.services.async_services()
-            
-            # Check for homeassistant domain (most critical)
-            ha_services = services.get("homeassistant", {})
-            has_turn_on = "turn_on" in ha_services
-            has_turn_off = "turn_off" in ha_services
-            
-            return has_turn_on and has_turn_off
-        except Exception:
-            return False
-
-    async def _safe_check_switch_entity(self) -> bool:
-        """Safely check if switch entity is available."""
-        if not self._switch_entity_id:
-            return True
-        
-        try:
-            switch_state = self.hass.states.get(self._switch_entity_id)
-            if not switch_state:
-                return False
-            
-            # Accept any state except unavailable/unknown
-            return switch_state.state not in ["unavailable", "unknown"]
-        except Exception:
-            return False
-
     async def _complete_initialization(self):
         """Complete full initialization after HA startup."""
         try:
@@ -1516,6 +2120,21 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             # Initialize reset scheduling with configurable reset time
             await self._setup_reset_scheduling(storage_data)
             
+            # Per-member runtime of a group (today)
+            if self._group_members and storage_data.get("member_runtime"):
+                self._member_runtime = {
+                    member: float(seconds) for member, seconds in storage_data["member_runtime"].items()
+                    if member in self._group_members
+                }
+
+            # Power sensor feeding the energy total
+            self._async_setup_power_listener()
+
+            # Long-term statistics: pending intervals and running sum
+            self._runtime_intervals = RuntimeIntervals.from_storage(storage_data.get(STORAGE_KEY_STATISTICS))
+            if self._statistics_unsub is None:
+                self._statistics_unsub = async_get_statistics_publisher(self.hass).async_register(self)
+
             # Set up listeners and handlers
             await self._setup_listeners_and_handlers()
             
@@ -1547,11 +2166,17 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                         _LOGGER.info(f"Simple Timer: [{self._entry_id}] No active timer restoration needed")
                 except Exception as e:
                     _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error during timer restoration check: {e}")
+            elif storage_data.get("paused_remaining") is not None:
+                self._restore_paused_timer(storage_data)
             else:
                 _LOGGER.info(f"Simple Timer: [{self._entry_id}] No timer data in storage")
+                if self._timer_state == "paused":
+                    self._timer_state = "idle"
 
             # Restore any armed scheduled-start
             await self._restore_schedule(storage_data)
+            self._restore_schedule_slots(storage_data)
+            await self._restore_cycle(storage_data)
 
             # Start accumulation if needed
             await self._start_accumulation_if_needed()
@@ -1564,31 +2189,27 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error during initialization: {e}")
 
     async def _load_storage_data(self) -> dict:
-        """Load storage data with migration support."""
-        storage_data = None
-        async with self._storage_lock:
-            try:
-                storage_data = await self._store.async_load()
-            except NotImplementedError:
-                # Handle storage migration
-                _LOGGER.info(f"Simple Timer: [{self._entry_id}] Migrating storage format")
-                try:
-                    v1_store = Store(self.hass, 1, self.STORAGE_KEY_FORMAT.format(self._entry_id))
-                    old_data = await v1_store.async_load()
-                    if old_data:
-                        new_data = old_data.copy()
-                        new_data["next_reset_date"] = None
-                        await self._store.async_save(new_data)
-                        storage_data = new_data
-                except Exception as migration_error:
-                    _LOGGER.error(f"Simple Timer: [{self._entry_id}] Storage migration failed: {migration_error}")
-            except Exception as e:
-                _LOGGER.error(f"Simple Timer: [{self._entry_id}] Error loading storage: {e}")
-        
-        return storage_data or {}
+        """Load storage data (migration is handled by the store)."""
+        # Copy so callers can't mutate the cached document behind the store's back
+        return dict(await self._store.async_load())
+
+    async def _restore_reset_state(self, storage_data: dict) -> bool:
+        """Restore the next reset date and catch up a missed reset.
+
+        Normally run for all instances at once by the reset coordinator during
+        startup. Returns True if a missed reset was performed.
+        """
+        self._reset_state_restored = True
+        caught_up = False
+
+        # Before a catch-up reset pushes into it
+        self._daily_totals = DailyTotals.from_storage(storage_data.get("daily_totals"))
+        # The rolling sensors were added before the restore; show the restored sums
+        for rolling_sensor in self._rolling_sensors:
+            if rolling_sensor.hass is not None:
+                rolling_sensor.async_write_ha_state()
+        self._restore_energy(storage_data)
 
-    async def _setup_reset_scheduling(self, storage_data: dict):
-        """Set up daily reset scheduling with configurable reset time."""
         # Initialize next reset date
         self._next_reset_date = self._get_next_reset_datetime()
         
@@ -1606,18 +2227,19 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
         # Check for missed resets only if we have historical data
         if storage_data.get("next_reset_date"):
-            await self._check_missed_reset()
+            caught_up = await self._check_missed_reset()
+        return caught_up
 
-        # Set up scheduled reset with configurable time
+    async def _setup_reset_scheduling(self, storage_data: dict):
+        """Set up daily reset scheduling with configurable reset time."""
+        if not self._reset_state_restored:
+            await self._restore_reset_state(storage_data)
+
+        # Join the shared reset group for the configured time
         reset_time_str = self._reset_time.strftime("%H:%M:%S")
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Scheduling daily reset at {reset_time_str}")
         
-        self._reset_time_tracker = async_track_time_change(
-            self.hass, self._reset_at_scheduled_time, 
-            hour=self._reset_time.hour, 
-            minute=self._reset_time.minute, 
-            second=self._reset_time.second
-        )
+        self._reset_time_tracker = async_get_reset_coordinator(self.hass).async_register(self)
 
     # ------------------------------------------------------------------
     # Scheduled-start (fire async_start_timer at a future absolute clock time)
@@ -1679,8 +2301,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if not self._scheduled_fire_at:
             return
         fire_at_utc = dt_util.as_utc(self._scheduled_fire_at)
-        self._schedule_unsub = async_track_point_in_utc_time(
-            self.hass, self._schedule_fired, fire_at_utc
+        self._schedule_unsub = async_get_deadline_scheduler(self.hass).async_schedule(
+            fire_at_utc, self._schedule_fired
         )
 
     @callback
@@ -1728,32 +2350,28 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._schedule_repeat = False
         self._schedule_days = []
 
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                if data.pop("schedule", None) is not None:
-                    await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not clear schedule storage: {e}")
+        try:
+            await self._store.async_remove("schedule")
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not clear schedule storage: {e}")
 
         if write_state:
             self.async_write_ha_state()
 
     async def _save_schedule(self) -> None:
         """Persist the current schedule to storage."""
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load() or {}
-                data["schedule"] = {
+        try:
+            await self._store.async_update({
+                "schedule": {
                     "fire_at": self._scheduled_fire_at.isoformat() if self._scheduled_fire_at else None,
                     "duration": self._scheduled_duration,
                     "unit": self._scheduled_unit,
                     "repeat": self._schedule_repeat,
                     "days": self._schedule_days,
                 }
-                await self._store.async_save(data)
-            except Exception as e:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not save schedule: {e}")
+            })
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not save schedule: {e}")
 
     async def _restore_schedule(self, storage_data: dict) -> None:
         """Re-arm a stored schedule on startup; discard missed one-shots."""
@@ -1795,6 +2413,207 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
             _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Discarding missed one-shot schedule ({fire_at.isoformat()})")
             await self._clear_schedule()
 
+    async def async_add_schedule_slot(self, slot_id: str | None, cron: str,
+                                      duration: float, unit: str = "min") -> None:
+        """Add (or replace) a cron schedule slot starting a bounded timer."""
+        expression = CronExpression(cron)
+        if not slot_id:
+            number = len(self._slots.slots) + 1
+            while f"slot_{number}" in self._slots.slots:
+                number += 1
+            slot_id = f"slot_{number}"
+
+        self._slots.add(ScheduleSlot(slot_id, expression, duration, unit), dt_util.now())
+        slot = self._slots.slots[slot_id]
+        if slot.next_fire is None:
+            self._slots.remove(slot_id)
+            raise ValueError(f"Schedule '{expression.expression}' never fires")
+
+        self._arm_schedule_slots()
+        await self._save_schedule_slots()
+
+        _LOGGER.info(
+            f"Simple Timer: [{self._entry_id}] Schedule slot '{slot_id}' ({expression.expression}) "
+            f"for {duration} {unit} - next start {slot.next_fire.isoformat()}"
+        )
+        self.async_write_ha_state()
+
+    async def async_remove_schedule_slot(self, slot_id: str) -> None:
+        """Remove one schedule slot."""
+        if not self._slots.remove(slot_id):
+            raise ValueError(f"No schedule slot '{slot_id}'")
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Removed schedule slot '{slot_id}'")
+        self._arm_schedule_slots()
+        await self._save_schedule_slots()
+        self.async_write_ha_state()
+
+    async def async_clear_schedule_slots(self) -> None:
+        """Remove every schedule slot."""
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Clearing {len(self._slots.slots)} schedule slot(s)")
+        self._slots.clear()
+        self._arm_schedule_slots()
+        await self._save_schedule_slots()
+        self.async_write_ha_state()
+
+    def _arm_schedule_slots(self) -> None:
+        """Point the single slot deadline at the earliest slot (or drop it)."""
+        next_slot = self._slots.peek()
+        deadlines = async_get_deadline_scheduler(self.hass)
+        if next_slot is None:
+            if self._slot_unsub:
+                self._slot_unsub()
+                self._slot_unsub = None
+            return
+
+        fire_at_utc = dt_util.as_utc(next_slot.next_fire)
+        if self._slot_unsub is None:
+            self._slot_unsub = deadlines.async_schedule(fire_at_utc, self._schedule_slot_fired)
+        elif not self._slot_unsub.active or self._slot_unsub.when != fire_at_utc:
+            self._slot_unsub = deadlines.async_reschedule(self._slot_unsub, fire_at_utc)
+
+    @callback
+    def _schedule_slot_fired(self, now) -> None:
+        """Deadline callback - fire the due slots on the event loop."""
+        self.hass.async_create_task(self._async_schedule_slot_fired())
+
+    async def _async_schedule_slot_fired(self) -> None:
+        """Start the run for the due slot(s) and re-arm for the next one."""
+        due = self._slots.pop_due(dt_util.now())
+        self._arm_schedule_slots()
+        if not due:
+            self.async_write_ha_state()
+            return
+
+        # Slots due together start one run: the longest one wins
+        slot = max(due, key=lambda s: self._duration_to_minutes(s.duration, s.unit))
+        _LOGGER.info(
+            f"Simple Timer: [{self._entry_id}] Schedule slot '{slot.slot_id}' fired - starting bounded timer"
+        )
+        await self.async_start_timer(slot.duration, slot.unit, reverse_mode=False, start_method="schedule")
+        self.async_write_ha_state()
+
+    @staticmethod
+    def _duration_to_minutes(duration: float, unit: str) -> float:
+        """Convert a service duration to minutes."""
+        if unit in ["s", "sec", "seconds"]:
+            return duration / 60.0
+        if unit in ["h", "hr", "hours"]:
+            return duration * 60
+        if unit in ["d", "day", "days"]:
+            return duration * 1440
+        return duration
+
+    async def _save_schedule_slots(self) -> None:
+        """Persist the slot table in its compact form."""
+        try:
+            if self._slots.slots:
+                await self._store.async_update({"slots": self._slots.as_storage()})
+            else:
+                await self._store.async_remove("slots")
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not save schedule slots: {e}")
+
+    def _restore_schedule_slots(self, storage_data: dict) -> None:
+        """Rebuild the slot table from storage; slots missed while offline are skipped."""
+        if not storage_data.get("slots"):
+            return
+        self._slots = ScheduleTable.from_storage(storage_data["slots"], dt_util.now())
+        self._arm_schedule_slots()
+        if next_slot := self._slots.peek():
+            _LOGGER.info(
+                f"Simple Timer: [{self._entry_id}] Restored {len(self._slots.slots)} schedule slot(s) "
+                f"- next start {next_slot.next_fire.isoformat()}"
+            )
+
+    async def async_start_cycle(self, on_duration: float, off_duration: float,
+                                repeats: int, unit: str = "min") -> None:
+        """Run the switch on/off repeats times from one state machine."""
+        if self._timer_state != "idle":
+            raise ServiceValidationError("A timer is running - cancel it before starting a cycle")
+
+        if self._cycle_unsub:
+            self._cycle_unsub()
+        self._cycle = DutyCycle(
+            dt_util.utcnow(),
+            self._duration_to_minutes(on_duration, unit) * 60,
+            self._duration_to_minutes(off_duration, unit) * 60,
+            repeats,
+        )
+        await self._store.async_update({"cycle": self._cycle.as_storage()})
+
+        _LOGGER.info(
+            f"Simple Timer: [{self._entry_id}] Starting cycle: on {on_duration} {unit}, "
+            f"off {off_duration} {unit}, {repeats} time(s)"
+        )
+        await self._send_notification(
+            f"Cycle started - on {on_duration} {unit}, off {off_duration} {unit}, {repeats} time(s)"
+        )
+        await self._async_apply_cycle_phase()
+
+    async def async_stop_cycle(self) -> None:
+        """Stop a running duty cycle and turn the switch off."""
+        if not self._cycle:
+            raise ServiceValidationError("No cycle is running")
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Stopping cycle")
+        await self._async_end_cycle(turn_off=True)
+        await self._send_notification("Cycle stopped")
+
+    async def _async_apply_cycle_phase(self, now: datetime | None = None) -> None:
+        """Drive the switch to the current phase and arm the deadline for its end."""
+        phase = self._cycle.phase_at(now or dt_util.utcnow())
+        if phase.phase == PHASE_DONE:
+            _LOGGER.info(f"Simple Timer: [{self._entry_id}] Cycle finished after {self._cycle.repeats} repeat(s)")
+            await self._async_end_cycle(turn_off=True)
+            await self._send_notification("Cycle finished")
+            return
+
+        if phase[:2] != (self._cycle_phase[:2] if self._cycle_phase else None):
+            _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Cycle {phase.repeat}/{self._cycle.repeats}: {phase.phase}")
+            if self._switch_entity_id:
+                self._async_command_switches("on" if phase.phase == PHASE_ON else "off")
+        self._cycle_phase = phase
+
+        deadlines = async_get_deadline_scheduler(self.hass)
+        if self._cycle_unsub:
+            self._cycle_unsub = deadlines.async_reschedule(self._cycle_unsub, phase.ends_at)
+        else:
+            self._cycle_unsub = deadlines.async_schedule(phase.ends_at, self._cycle_phase_ended)
+        self.async_write_ha_state()
+
+    @callback
+    def _cycle_phase_ended(self, now) -> None:
+        """Deadline callback - move to the next phase on the event loop."""
+        if self._cycle:
+            self.hass.async_create_task(self._async_apply_cycle_phase(now))
+
+    async def _async_end_cycle(self, turn_off: bool) -> None:
+        """Tear down cycle state + storage."""
+        if self._cycle_unsub:
+            self._cycle_unsub()
+            self._cycle_unsub = None
+        self._cycle = None
+        self._cycle_phase = None
+        if turn_off and self._switch_entity_id:
+            self._async_command_switches("off")
+        try:
+            await self._store.async_remove("cycle")
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not clear cycle storage: {e}")
+        self.async_write_ha_state()
+
+    async def _restore_cycle(self, storage_data: dict) -> None:
+        """Resume a stored cycle in whatever phase the clock says it is in."""
+        if not storage_data.get("cycle"):
+            return
+        try:
+            self._cycle = DutyCycle.from_storage(storage_data["cycle"])
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Bad stored cycle: {e}")
+            await self._async_end_cycle(turn_off=False)
+            return
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restoring cycle started at {self._cycle.started_at.isoformat()}")
+        await self._async_apply_cycle_phase()
+
     async def _setup_listeners_and_handlers(self):
         """Set up event listeners and handlers."""
         await self._async_setup_switch_listener()
@@ -1844,23 +2663,20 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
     async def _handle_expired_timer(self):
         """Handle timer that expired while HA was offline."""
-        await asyncio.sleep(2)  # Safety delay
-        
         # Load timer data from storage including reverse mode
         reverse_mode = False
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load()
-                if data:
-                    if "runtime_at_start" in data:
-                        self._runtime_at_timer_start = data["runtime_at_start"]
-                        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_start for expired timer: {self._runtime_at_timer_start}s")
-                    if "reverse_mode" in data:
-                        reverse_mode = data["reverse_mode"]
-                        self._timer_reverse_mode = reverse_mode
-                        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode for expired timer: {reverse_mode}")
-            except Exception as e:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not load timer data: {e}")
+        try:
+            data = await self._store.async_load()
+            if data:
+                if "runtime_at_start" in data:
+                    self._runtime_at_timer_start = data["runtime_at_start"]
+                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_start for expired timer: {self._runtime_at_timer_start}s")
+                if "reverse_mode" in data:
+                    reverse_mode = data["reverse_mode"]
+                    self._timer_reverse_mode = reverse_mode
+                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode for expired timer: {reverse_mode}")
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not load timer data: {e}")
         
         # Handle runtime calculation based on timer mode
         if reverse_mode:
@@ -1887,7 +2703,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         self._last_on_timestamp = None
 
         # Clean up timer state FIRST to ensure we are in a clean idle state
-        await self._cleanup_timer_state()
+        await self._cleanup_timer_state("finished")
         
         # Add watchdog message AFTER cleanup so it persists
         self._watchdog_message = WARNING_MSG_OFFLINE
@@ -1909,7 +2725,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not turn on switch: {e}")
             
             # Send notification
-            await asyncio.sleep(1)
             await self._send_notification(f"Delayed start timer completed - device turned ON")
         else:
             # For normal mode: timer finished, turn switch OFF
@@ -1921,7 +2736,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not turn off switch: {e}")
             
             # Send notification
-            await asyncio.sleep(1)
             await self._send_notification(f"Timer was turned off - daily usage {formatted_time} {label}")
 
     async def _ensure_switch_state_with_retries(self, desired_state: str, context: str, force: bool = False):
@@ -1939,51 +2753,49 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # Schedule background verification
         self.hass.async_create_task(self._verify_and_retry_switch_state(desired_state, self._switch_entity_id, force=force))
 
-    async def _verify_and_retry_switch_state(self, desired_state: str, entity_id: str, attempt: int = 1, force: bool = False):
-        """Background task to verify switch state and retry if needed."""
-        # Wait before checking (exponential-ish backoff: 2s, 5s, 10s, 20s)
-        delays = [2, 5, 10, 20]
-        if attempt > len(delays):
-            return
-            
-        await asyncio.sleep(delays[attempt-1])
-        
-        # Safety Check: If we are trying to turn OFF, but a new timer has started and is active, ABORT.
-        # This prevents the retry logic from fighting a user who just started a new timer.
-        if desired_state == "off" and self._timer_state == "active":
-             _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Aborting switch retry (off) because timer is now active")
-             return
-             
-        current_state_obj = self.hass.states.get(entity_id)
-        if not current_state_obj:
-             # Entity missing, definitely retry
-             _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch entity missing during verify, scheduling retry {attempt+1}")
-             self.hass.async_create_task(self._verify_and_retry_switch_state(desired_state, entity_id, attempt + 1, force=force))
-             return
-             
-        actual = current_state_obj.state
-        
-        # Check if state matches
-        # If forcing (on first retry attempt), we ignore the match check to deal with stale HA state
-        state_match = (actual == desired_state)
-        should_skip_check = (force and attempt == 1)
-        
-        if state_match and not should_skip_check:
-             return
-             
-        # If unavailable/unknown, we retry
-        # If definitive mismatch (e.g. ON when should be OFF), we retry
-        
-        _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Switch state mismatch detected (Expected {desired_state}, got {actual}). Retrying attempt {attempt}...")
-        
-        action = "turn_on" if desired_state == "on" else "turn_off"
-        try:
-            await self.hass.services.async_call("homeassistant", action, {"entity_id": entity_id}, blocking=True)
-        except Exception as e:
-            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Retry attempt {attempt} failed: {e}")
-        
-        # Schedule next check
-        self.hass.async_create_task(self._verify_and_retry_switch_state(desired_state, entity_id, attempt + 1, force=force))
+    async def _verify_and_retry_switch_state(self, desired_state: str, entity_id: str, force: bool = False):
+        """Background task to verify switch state and retry if needed.
+
+        Each attempt waits for the switch's state_changed event (bounded by
+        RETRY_TIMEOUTS) instead of sleeping a fixed delay.
+        """
+        for attempt, timeout in enumerate(RETRY_TIMEOUTS, start=1):
+            # Safety Check: If we are trying to turn OFF, but a new timer has started and is active, ABORT.
+            # This prevents the retry logic from fighting a user who just started a new timer.
+            if desired_state == "off" and self._timer_state == "active":
+                _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Aborting switch retry (off) because timer is now active")
+                return
+
+            current_state_obj = self.hass.states.get(entity_id)
+            if not current_state_obj:
+                # Entity missing - wait for it to appear before retrying
+                _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Switch entity missing during verify, waiting for it (attempt {attempt})")
+                await async_wait_for_state(self.hass, entity_id, timeout)
+                continue
+
+            actual = current_state_obj.state
+
+            # Check if state matches
+            # If forcing (on first retry attempt), we ignore the match check to deal with stale HA state
+            if actual == desired_state and not (force and attempt == 1):
+                return
+
+            if actual != desired_state:
+                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Switch state mismatch detected (Expected {desired_state}, got {actual}). Retrying attempt {attempt}...")
+
+            try:
+                if actual == desired_state:
+                    # Forced re-send: no state change will follow
+                    await async_get_actuation_queue(self.hass).async_enqueue(entity_id, desired_state, None, blocking=True)
+                    continue
+                if await self._async_actuate_switch(desired_state, timeout):
+                    return
+            except CommandSuperseded:
+                return
+            except Exception as e:
+                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Retry attempt {attempt} failed: {e}")
+                # Integration likely still loading: wait for any state change before retrying
+                await async_wait_for_state(self.hass, entity_id, timeout)
 
     async def _handle_expired_reverse_timer(self):
         """Handle reverse mode timer that expired while HA was offline."""
@@ -2007,18 +2819,6 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     _LOGGER.error(f"Simple Timer: [{self._entry_id}] Switch entity not found in hass.states!")
                 
                 try:
-                    await self.hass.services.async_call(
-                        "homeassistant", "turn_on", {"entity_id": self._switch_entity_id}, blocking=False
-                    )
-                    
-                    # Wait and check if it worked
-                    await asyncio.sleep(2)
-                    updated_state = self.hass.states.get(self._switch_entity_id)
-                    if updated_state:
-                        pass  # State updated successfully
-                    else:
-                        _LOGGER.error(f"Simple Timer: [{self._entry_id}] Could not get updated switch state!")
-                    
                     await self._ensure_switch_state("on", "Expired reverse timer completion turn-on", blocking=False, force=True)
                     
                 except Exception as switch_error:
@@ -2034,7 +2834,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                 _LOGGER.error(f"Simple Timer: [{self._entry_id}] No switch entity configured!")
             
             # Clean up timer state AFTER switch is turned on
-            await self._cleanup_timer_state()
+            await self._cleanup_timer_state("finished")
             
             # Start accumulation after cleanup
             if self._switch_entity_id and self._last_on_timestamp:
@@ -2058,25 +2858,22 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
 
     async def _restore_active_timer(self, now: datetime):
         """Restore an active timer after restart."""
-        await asyncio.sleep(1)  # Safety delay
-        
         # Load timer data from storage including runtime_at_start
-        async with self._storage_lock:
-            try:
-                data = await self._store.async_load()
-                if data:
-                    self._timer_duration = data.get("duration", self._timer_duration)
-                    if data.get("timer_start"):
-                        self._timer_start_moment = datetime.fromisoformat(data["timer_start"])
-                    if "runtime_at_start" in data:
-                        self._runtime_at_timer_start = data["runtime_at_start"]
-                        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_start from storage: {self._runtime_at_timer_start}s")
-                    # Ensure reverse mode is restored from storage
-                    if "reverse_mode" in data:
-                        self._timer_reverse_mode = data["reverse_mode"]
-                        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
-            except Exception as e:
-                _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not load timer data: {e}")
+        try:
+            data = await self._store.async_load()
+            if data:
+                self._timer_duration = data.get("duration", self._timer_duration)
+                if data.get("timer_start"):
+                    self._timer_start_moment = datetime.fromisoformat(data["timer_start"])
+                if "runtime_at_start" in data:
+                    self._runtime_at_timer_start = data["runtime_at_start"]
+                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored runtime_at_start from storage: {self._runtime_at_timer_start}s")
+                # Ensure reverse mode is restored from storage
+                if "reverse_mode" in data:
+                    self._timer_reverse_mode = data["reverse_mode"]
+                    _LOGGER.info(f"Simple Timer: [{self._entry_id}] Restored reverse mode from storage: {self._timer_reverse_mode}")
+        except Exception as e:
+            _LOGGER.warning(f"Simple Timer: [{self._entry_id}] Could not load timer data: {e}")
         
         # Add offline time and set watchdog message
         last_state = await self.async_get_last_state()
@@ -2108,8 +2905,8 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     _LOGGER.info(f"Simple Timer: [{self._entry_id}] Reverse mode timer - not adding offline time during countdown")
         
         # Restore timer tracking
-        self._timer_unsub = async_track_point_in_utc_time(
-            self.hass, self._async_timer_finished, self._timer_finishes_at
+        self._timer_unsub = async_get_deadline_scheduler(self.hass).async_schedule(
+            self._timer_finishes_at, self._async_timer_finished
         )
         await self._start_timer_update_task()
         
@@ -2138,9 +2935,11 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
                     # Switch should be OFF during reverse timer countdown
                     _LOGGER.info(f"Simple Timer: [{self._entry_id}] Ensuring switch stays OFF during reverse timer countdown")
                     try:
-                        await self.hass.services.async_call(
-                            "homeassistant", "turn_off", {"entity_id": self._switch_entity_id}, blocking=True
+                        await async_get_actuation_queue(self.hass).async_enqueue(
+                            self._switch_entity_id, "off", None, blocking=True
                         )
+                    except CommandSuperseded:
+                        pass
                     except Exception as e:
                         _LOGGER.error(f"Simple Timer: [{self._entry_id}] Failed to turn off switch during reverse timer: {e}")
             
@@ -2151,19 +2950,13 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         if self._is_switch_on() and not self._last_on_timestamp:
             self._last_on_timestamp = dt_util.utcnow()
             await self._start_realtime_accumulation()
-        elif self._is_switch_on() and self._last_on_timestamp:
-            await self._delayed_start_accumulation()
-
-    async def _delayed_start_accumulation(self):
-        """Start accumulation with a delay."""
-        await asyncio.sleep(0.5)
-        if self._is_switch_on() and self._last_on_timestamp and not self._stop_event_received:
+        elif self._is_switch_on() and self._last_on_timestamp and not self._stop_event_received:
             await self._start_realtime_accumulation()
         
     def _calculate_timer_elapsed_since_start(self) -> int:
-        """Calculate elapsed time in seconds since the timer started."""
-        if self._timer_state == "active" and self._timer_start_moment:
-            now = dt_util.utcnow()
+        """Calculate elapsed time in seconds since the timer started (excluding pauses)."""
+        if self._timer_state in ("active", "paused") and self._timer_start_moment:
+            now = self._timer_paused_at if self._timer_state == "paused" else dt_util.utcnow()
             elapsed = (now - self._timer_start_moment).total_seconds()
             return max(0, round(elapsed))
         return 0
@@ -2173,6 +2966,7 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         _LOGGER.info(f"Simple Timer: [{self._entry_id}] Manual daily usage reset requested")
         
         # Get current usage for notification
+        self._async_fold_accumulated_runtime()
         current_usage = self._state
         notification_entity, show_seconds = await self._get_card_notification_config()
         formatted_time, label = self._format_time_for_notification(current_usage, show_seconds)
@@ -2181,10 +2975,10 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         await self._stop_realtime_accumulation()
         
         # If timer is active, adjust the runtime_at_timer_start to maintain timer accuracy
-        if self._timer_state == "active":
+        if self._timer_state in ("active", "paused"):
             # Set runtime_at_timer_start to negative elapsed time so final calculation remains correct
             if self._timer_start_moment:
-                elapsed_seconds = (dt_util.utcnow() - self._timer_start_moment).total_seconds()
+                elapsed_seconds = self._calculate_timer_elapsed_since_start()
                 self._runtime_at_timer_start = -elapsed_seconds
                 _LOGGER.debug(f"Simple Timer: [{self._entry_id}] Adjusted runtime_at_timer_start for active timer: {self._runtime_at_timer_start}s")
         else:
@@ -2192,15 +2986,15 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         
         # Reset the state
         old_state = self._state
+        await self._async_reset_energy()
         self._state = 0.0
         self._last_on_timestamp = None
+        await self._async_reset_member_runtime()
         
         # If switch is currently on, restart accumulation from zero
-        if self._switch_entity_id:
-            current_switch_state = self.hass.states.get(self._switch_entity_id)
-            if current_switch_state and current_switch_state.state == STATE_ON:
-                self._last_on_timestamp = dt_util.utcnow()
-                await self._start_realtime_accumulation()
+        if self._is_switch_on():
+            self._last_on_timestamp = dt_util.utcnow()
+            await self._start_realtime_accumulation()
         
         # Update state immediately
         self.async_write_ha_state()
@@ -2208,4 +3002,112 @@ class TimerRuntimeSensor(SensorEntity, RestoreEntity):
         # Send notification
         await self._send_notification(f"Daily usage reset from {formatted_time} {label} to 00:00")
         
-        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Daily usage reset: {old_state}s -> 0s")
\ No newline at end of file
+        _LOGGER.info(f"Simple Timer: [{self._entry_id}] Daily usage reset: {old_state}s -> 0s")
+
+class RollingUsageSensor(SensorEntity):
+    """Runtime of the last 7 or 30 finished days, read from the instance's ring buffer."""
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:timer-sand"
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, timer: TimerRuntimeSensor, window: int):
+        """Initialize the sensor."""
+        self._timer = timer
+        self._window = window
+        self._attr_unique_id = f"timer_runtime_{timer._entry_id}_{window}d"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return f"{self._timer.instance_title} Runtime {self._window}d ({self._timer._entry_id_short})"
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Group with the timer's device."""
+        return self._timer.device_info
+
+    @property
+    def available(self) -> bool:
+        """Unavailable until the ring buffer is restored, so no false 0 is recorded."""
+        return self._timer._reset_state_restored
+
+    @property
+    def native_value(self) -> float:
+        """Return the runtime of the last finished days in seconds."""
+        return self._timer._daily_totals.total(self._window)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return how many days the total covers so far."""
+        return {"days": self._timer._daily_totals.days(self._window), "entry_id": self._timer._entry_id}
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh whenever the timer pushes a finished day."""
+        self._timer._rolling_sensors.append(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop following the timer."""
+        if self in self._timer._rolling_sensors:
+            self._timer._rolling_sensors.remove(self)
+
+
+class EnergyUsageSensor(SensorEntity):
+    """Energy used during the timer's on-sessions today, from the linked power sensor."""
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:lightning-bolt"
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(self, timer: TimerRuntimeSensor):
+        """Initialize the sensor."""
+        self._timer = timer
+        self._attr_unique_id = f"timer_energy_{timer._entry_id}"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return f"{self._timer.instance_title} Energy ({self._timer._entry_id_short})"
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Group with the timer's device."""
+        return self._timer.device_info
+
+    @property
+    def available(self) -> bool:
+        """Unavailable until the stored total is restored, so no false 0 is recorded."""
+        return self._timer._energy_restored
+
+    @property
+    def native_value(self) -> float:
+        """Return today's energy in kWh."""
+        return round(self._timer._energy.energy, 3)
+
+    @property
+    def last_reset(self) -> datetime | None:
+        """Return when the total last started over."""
+        return self._timer._energy_last_reset
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the power source and integration method."""
+        return {
+            "power_sensor": self._timer._power_sensor,
+            "method": self._timer._energy.method,
+            "entry_id": self._timer._entry_id,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh whenever the timer's energy changes."""
+        self._timer._energy_sensor = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop following the timer."""
+        if self._timer._energy_sensor is self:
+            self._timer._energy_sensor = None
@@ -0,0 +1,150 @@
+"""Shared startup readiness gate for all Simple Timer sensors.
+
+Instead of every sensor polling core state, services and its switch once per
+second, the gate listens for the events that signal readiness and lets each
+sensor await them:
+
+* EVENT_HOMEASSISTANT_STARTED (core running)
+* EVENT_SERVICE_REGISTERED for homeassistant.turn_on / turn_off
+* state_changed of each tracked switch (first usable state)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_SERVICE_REGISTERED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_GATE = "startup_gate"
+
+# Longest a sensor waits for readiness before initializing anyway (seconds)
+STARTUP_TIMEOUT = 60
+
+REQUIRED_SERVICES = ("turn_on", "turn_off")
+
+
+class StartupGate:
+    """Resolve once core, services and switches are ready; shared by all sensors."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the gate."""
+        self.hass = hass
+        self._started = asyncio.Event()
+        self._services_ready = asyncio.Event()
+        self._switches: dict[str, asyncio.Event] = {}
+        self._switch_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._unsub_started: CALLBACK_TYPE | None = None
+        self._unsub_services: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start listening for the readiness events that have not happened yet."""
+        if self.hass.state == CoreState.running:
+            self._started.set()
+        else:
+            self._unsub_started = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, self._async_handle_started
+            )
+
+        if self._services_available():
+            self._services_ready.set()
+        else:
+            self._unsub_services = self.hass.bus.async_listen(
+                EVENT_SERVICE_REGISTERED, self._async_handle_service_registered
+            )
+
+    @callback
+    def _async_handle_started(self, event: Event) -> None:
+        """Mark core as running."""
+        self._unsub_started = None
+        self._started.set()
+
+    def _services_available(self) -> bool:
+        """Return True once homeassistant.turn_on/turn_off are registered."""
+        return all(
+            self.hass.services.has_service("homeassistant", service)
+            for service in REQUIRED_SERVICES
+        )
+
+    @callback
+    def _async_handle_service_registered(self, event: Event) -> None:
+        """Resolve the services gate when the last required service registers."""
+        if event.data.get("domain") != "homeassistant" or not self._services_available():
+            return
+        if self._unsub_services is not None:
+            self._unsub_services()
+            self._unsub_services = None
+        self._services_ready.set()
+
+    @staticmethod
+    def _switch_usable(state) -> bool:
+        """Accept any state except unavailable/unknown."""
+        return state is not None and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+    @callback
+    def _async_switch_event(self, entity_id: str) -> asyncio.Event:
+        """Return the (shared) readiness event for a switch, tracking it if needed."""
+        if (ready := self._switches.get(entity_id)) is not None:
+            return ready
+
+        ready = self._switches[entity_id] = asyncio.Event()
+        if self._switch_usable(self.hass.states.get(entity_id)):
+            ready.set()
+            return ready
+
+        @callback
+        def _async_handle_switch_change(event: Event) -> None:
+            if not self._switch_usable(event.data.get("new_state")):
+                return
+            if (unsub := self._switch_unsubs.pop(entity_id, None)) is not None:
+                unsub()
+            ready.set()
+
+        self._switch_unsubs[entity_id] = async_track_state_change_event(
+            self.hass, [entity_id], _async_handle_switch_change
+        )
+        return ready
+
+    async def async_wait(self, switch_entity_id: str | None, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """Wait until core, services and the given switch are ready.
+
+        Returns False if readiness was not reached within timeout.
+        """
+        waits = [self._started.wait(), self._services_ready.wait()]
+        if switch_entity_id:
+            waits.append(self._async_switch_event(switch_entity_id).wait())
+
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(*waits)
+        except TimeoutError:
+            return False
+        return True
+
+    @callback
+    def async_is_ready(self, switch_entity_id: str | None) -> bool:
+        """Return True if everything async_wait waits for is already ready."""
+        if not (self._started.is_set() and self._services_ready.is_set()):
+            return False
+        return not switch_entity_id or self._async_switch_event(switch_entity_id).is_set()
+
+
+@callback
+def async_get_startup_gate(hass: HomeAssistant) -> StartupGate:
+    """Return the domain-wide startup gate, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (gate := domain_data.get(DATA_STARTUP_GATE)) is None:
+        gate = domain_data[DATA_STARTUP_GATE] = StartupGate(hass)
+        gate.async_setup()
+    return gate
@@ -0,0 +1,248 @@
+"""Hourly long-term runtime statistics pushed straight into the recorder.
+
+Each instance keeps the on/off intervals of its switch (RuntimeIntervals).
+Once an hour a single domain-wide listener turns the intervals of every
+finished hour into one external statistic row per instance (hours switched
+on in that hour plus the running sum), so long-range history is read from
+compact pre-aggregated rows instead of being sampled from the sensor's state.
+Pending intervals and the running sum are kept in each instance's storage, so
+hours are neither lost nor counted twice across restarts.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant < 2025.2
+    StatisticMeanType = None
+
+if TYPE_CHECKING:
+    from .sensor import TimerRuntimeSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATISTICS = "statistics"
+
+# Per-instance storage key of the pending intervals and running sum
+STORAGE_KEY_STATISTICS = "statistics"
+
+# Hours published at most in one go (e.g. after a long downtime)
+MAX_BACKFILL_HOURS = 72
+
+
+def _hour_floor(when: datetime) -> datetime:
+    """Return the start of the UTC hour containing when."""
+    return when.astimezone(dt_util.UTC).replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class RuntimeIntervals:
+    """Switch-on intervals not yet published, and the published running sum."""
+
+    total: float = 0.0                       # hours published so far
+    published_until: datetime | None = None  # end of the last published hour
+    closed: list[tuple[datetime, datetime]] = field(default_factory=list)
+    on_since: datetime | None = None
+    seen: datetime | None = None             # last time the state was known
+
+    @callback
+    def switch_on(self, when: datetime) -> None:
+        """Open an interval (no-op if one is open)."""
+        if self.on_since is None:
+            self.on_since = when
+        self.seen = when
+
+    @callback
+    def switch_off(self, when: datetime) -> None:
+        """Close the open interval, if any."""
+        if self.on_since is not None and when > self.on_since:
+            self.closed.append((self.on_since, when))
+        self.on_since = None
+        self.seen = when
+
+    @callback
+    def take_hours(self, until: datetime) -> list[tuple[datetime, float]]:
+        """Return (hour start, seconds on) for each finished hour before until.
+
+        The returned hours are consumed: intervals ending before until are
+        dropped and the rest are clipped to start at until.
+        """
+        until = _hour_floor(until)
+        start = self.published_until or until
+        if self.closed and self.closed[0][0] < start:
+            start = _hour_floor(self.closed[0][0])
+        if self.on_since is not None and self.on_since < start:
+            start = _hour_floor(self.on_since)
+        start = max(start, until - timedelta(hours=MAX_BACKFILL_HOURS))
+        if self.published_until is not None:
+            start = max(start, self.published_until)
+
+        intervals = [*self.closed]
+        if self.on_since is not None:
+            intervals.append((self.on_since, until))
+
+        hours: list[tuple[datetime, float]] = []
+        hour = start
+        while hour < until:
+            hour_end = hour + timedelta(hours=1)
+            seconds = sum(
+                (min(end, hour_end) - max(begin, hour)).total_seconds()
+                for begin, end in intervals
+                if begin < hour_end and end > hour
+            )
+            hours.append((hour, seconds))
+            hour = hour_end
+
+        self.closed = [(max(begin, until), end) for begin, end in self.closed if end > until]
+        if self.on_since is not None and self.on_since < until:
+            self.on_since = until
+        self.published_until = max(until, self.published_until or until)
+        self.seen = max(until, self.seen or until)
+        return hours
+
+    def as_storage(self) -> dict:
+        """Return the persisted form."""
+        return {
+            "total": self.total,
+            "published_until": self.published_until.isoformat() if self.published_until else None,
+            "closed": [[begin.isoformat(), end.isoformat()] for begin, end in self.closed],
+            "on_since": self.on_since.isoformat() if self.on_since else None,
+            "seen": self.seen.isoformat() if self.seen else None,
+        }
+
+    @classmethod
+    def from_storage(cls, stored: dict | None) -> RuntimeIntervals:
+        """Rebuild from the persisted form; an interval open at shutdown is closed when last seen."""
+        if not stored:
+            return cls()
+        try:
+            intervals = cls(
+                float(stored.get("total", 0.0)),
+                datetime.fromisoformat(stored["published_until"]) if stored.get("published_until") else None,
+                [(datetime.fromisoformat(begin), datetime.fromisoformat(end)) for begin, end in stored.get("closed", [])],
+                datetime.fromisoformat(stored["on_since"]) if stored.get("on_since") else None,
+                datetime.fromisoformat(stored["seen"]) if stored.get("seen") else None,
+            )
+        except (KeyError, TypeError, ValueError):
+            return cls()
+        # Whether the switch stayed on while Home Assistant was down is unknown
+        if intervals.on_since is not None:
+            intervals.switch_off(intervals.seen or intervals.on_since)
+        return intervals
+
+
+class RuntimeStatisticsPublisher:
+    """Publish every instance's finished hours once an hour."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the publisher."""
+        self.hass = hass
+        self._sensors: dict[str, TimerRuntimeSensor] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._last_run: dict | None = None
+
+    @staticmethod
+    def statistic_id(entry_id: str) -> str:
+        """Return the external statistic id of an instance."""
+        return f"{DOMAIN}:runtime_{slugify(entry_id)}"
+
+    @callback
+    def async_register(self, sensor: TimerRuntimeSensor) -> CALLBACK_TYPE:
+        """Include a sensor in the hourly push; returns the remover."""
+        entry_id = sensor._entry_id
+        self._sensors[entry_id] = sensor
+        if self._unsub is None:
+            self._unsub = async_track_utc_time_change(self.hass, self._async_hour_ended, minute=0, second=0)
+
+        @callback
+        def _async_unregister() -> None:
+            if self._sensors.get(entry_id) is sensor:
+                del self._sensors[entry_id]
+            if not self._sensors and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unregister
+
+    @callback
+    def _async_hour_ended(self, now: datetime) -> None:
+        """Publish the finished hours of every registered instance."""
+        recorder_loaded = "recorder" in self.hass.config.components
+        rows = 0
+        for sensor in list(self._sensors.values()):
+            try:
+                rows += self._async_publish(sensor, now, recorder_loaded)
+            except Exception as e:
+                _LOGGER.error(f"Simple Timer: [{sensor._entry_id}] Publishing runtime statistics failed: {e}")
+
+        self._last_run = {
+            "hour": _hour_floor(now).isoformat(),
+            "instances": len(self._sensors),
+            "rows": rows,
+            "recorder": recorder_loaded,
+        }
+
+    @callback
+    def _async_publish(self, sensor: TimerRuntimeSensor, now: datetime, recorder_loaded: bool) -> int:
+        """Push one instance's finished hours; returns the number of rows."""
+        intervals = sensor._runtime_intervals
+        hours = intervals.take_hours(now)
+        if not hours:
+            return 0
+
+        statistics: list[StatisticData] = []
+        for hour, seconds in hours:
+            on_hours = round(seconds / 3600, 6)
+            intervals.total = round(intervals.total + on_hours, 6)
+            statistics.append(StatisticData(start=hour, state=on_hours, sum=intervals.total))
+
+        # Progress is saved even without a recorder, so hours are never pushed twice
+        self.hass.async_create_task(
+            sensor._store.async_update({STORAGE_KEY_STATISTICS: intervals.as_storage()})
+        )
+        if not recorder_loaded:
+            return 0
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{sensor.name} runtime",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(sensor._entry_id),
+            unit_of_measurement=UnitOfTime.HOURS,
+        )
+        if StatisticMeanType is not None:
+            metadata["mean_type"] = StatisticMeanType.NONE
+        async_add_external_statistics(self.hass, metadata, statistics)
+        return len(statistics)
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return registered instances and the last push for diagnostics."""
+        return {
+            "instances": len(self._sensors),
+            "last_run": self._last_run,
+        }
+
+
+@callback
+def async_get_statistics_publisher(hass: HomeAssistant) -> RuntimeStatisticsPublisher:
+    """Return the domain-wide statistics publisher, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (publisher := domain_data.get(DATA_STATISTICS)) is None:
+        publisher = domain_data[DATA_STATISTICS] = RuntimeStatisticsPublisher(hass)
+    return publisher
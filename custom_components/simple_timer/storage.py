@@ -0,0 +1,264 @@
+"""Consolidated, cached persistence for all Simple Timer instances."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STORAGE = "storage"
+
+# One document for the whole domain:
+# {"entries": {entry_id: {...}}, "settings": {key: value}}
+STORAGE_VERSION = 1
+STORAGE_KEY = DOMAIN
+
+# Per-entry files used by versions before the consolidated store
+LEGACY_STORAGE_VERSION = 2
+LEGACY_STORAGE_KEY_FORMAT = f"{DOMAIN}_{{}}"
+
+# Non-critical changes are coalesced and written after this many seconds
+SAVE_DELAY = 10
+
+# Fields needed to restore a running timer correctly after a crash. Any change
+# to one of these is written to disk immediately instead of being debounced.
+CRITICAL_FIELDS = frozenset({
+    "finishes_at",
+    "duration",
+    "timer_start",
+    "runtime_at_start",
+    "reverse_mode",
+    "paused_remaining",
+    "cycle",
+})
+
+
+class SimpleTimerStorage:
+    """Single storage document shared by every Simple Timer instance.
+
+    Loaded once in async_setup. Debounced saves from all instances coalesce into
+    one write, and immediate (crash-critical) flushes requested in the same loop
+    iteration share a single write as well.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, Any] | None = None
+        self._load_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._views: dict[str, TimerStore] = {}
+        self._batch_depth = 0
+        self._flush_requested = False
+
+    async def async_load(self) -> dict[str, Any]:
+        """Return the document, reading it from disk on first use."""
+        if self._data is None:
+            async with self._load_lock:
+                if self._data is None:
+                    try:
+                        data = await self._store.async_load()
+                    except Exception as e:
+                        _LOGGER.error(f"Simple Timer: Error loading storage: {e}")
+                        data = None
+                    if not isinstance(data, dict):
+                        data = {}
+                    data.setdefault("entries", {})
+                    data.setdefault("settings", {})
+                    self._data = data
+        return self._data
+
+    async def async_migrate_legacy(self, entry_ids: list[str]) -> None:
+        """Import per-entry storage files into the consolidated document."""
+        data = await self.async_load()
+        pending = [entry_id for entry_id in entry_ids if entry_id not in data["entries"]]
+        if not pending:
+            return
+
+        results = await asyncio.gather(*(self._async_load_legacy(entry_id) for entry_id in pending))
+        migrated = []
+        for entry_id, (legacy_store, legacy_data) in zip(pending, results):
+            if legacy_data is None:
+                continue
+            data["entries"][entry_id] = legacy_data
+            migrated.append(legacy_store)
+
+        if not migrated:
+            return
+
+        # Persist the consolidated document before deleting the old files
+        await self.async_flush()
+        for legacy_store in migrated:
+            try:
+                await legacy_store.async_remove()
+            except Exception as e:
+                _LOGGER.warning(f"Simple Timer: Could not remove legacy storage file: {e}")
+        _LOGGER.info(f"Simple Timer: Migrated {len(migrated)} per-entry storage file(s) to consolidated storage")
+
+    async def _async_load_legacy(self, entry_id: str) -> tuple[Store, dict | None]:
+        """Read one legacy per-entry file, with v1 -> v2 migration support."""
+        legacy_store = Store(self.hass, LEGACY_STORAGE_VERSION, LEGACY_STORAGE_KEY_FORMAT.format(entry_id))
+        try:
+            return legacy_store, await legacy_store.async_load()
+        except NotImplementedError:
+            # Handle storage migration
+            _LOGGER.info(f"Simple Timer: [{entry_id}] Migrating storage format")
+            try:
+                v1_store = Store(self.hass, 1, LEGACY_STORAGE_KEY_FORMAT.format(entry_id))
+                old_data = await v1_store.async_load()
+                if old_data:
+                    new_data = old_data.copy()
+                    new_data["next_reset_date"] = None
+                    return v1_store, new_data
+            except Exception as migration_error:
+                _LOGGER.error(f"Simple Timer: [{entry_id}] Storage migration failed: {migration_error}")
+        except Exception as e:
+            _LOGGER.error(f"Simple Timer: [{entry_id}] Error loading storage: {e}")
+        return legacy_store, None
+
+    @callback
+    def async_entry(self, entry_id: str) -> TimerStore:
+        """Return the storage view for one config entry."""
+        if (view := self._views.get(entry_id)) is None:
+            view = self._views[entry_id] = TimerStore(self, entry_id)
+        return view
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Drop an entry's data when its config entry is deleted."""
+        self._views.pop(entry_id, None)
+        data = await self.async_load()
+        if data["entries"].pop(entry_id, None) is not None:
+            await self.async_flush()
+
+    @callback
+    def async_get_setting(self, key: str, default: Any = None) -> Any:
+        """Return a domain-wide setting (the document must be loaded)."""
+        if self._data is None:
+            return default
+        return self._data["settings"].get(key, default)
+
+    async def async_set_setting(self, key: str, value: Any) -> None:
+        """Store a domain-wide setting and write it out."""
+        data = await self.async_load()
+        data["settings"][key] = value
+        await self.async_flush()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Coalesce pending changes into one delayed write."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @asynccontextmanager
+    async def async_batch(self, flush: bool = False) -> AsyncIterator[None]:
+        """Hold back immediate writes inside the block and write once at its end.
+
+        Used for operations touching many instances at once (daily reset,
+        startup catch-up). With flush=True the document is written at the end
+        even if only debounced fields changed.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and (self._flush_requested or flush):
+                self._flush_requested = False
+                await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the document now, batching flushes requested in the same iteration."""
+        if self._data is None:
+            return
+        if self._batch_depth:
+            self._flush_requested = True
+            return
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(self._async_write())
+        await asyncio.shield(self._flush_task)
+
+    async def _async_write(self) -> None:
+        """Yield once so concurrent flushes join, then write."""
+        await asyncio.sleep(0)
+        # Flushes requested from here on need a new write
+        self._flush_task = None
+        # async_save also cancels any pending delayed write
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the document to persist and clear every view's dirty set."""
+        for view in self._views.values():
+            view.dirty.clear()
+        data = self._data or {"entries": {}}
+        return {
+            **data,
+            "entries": {entry_id: dict(entry) for entry_id, entry in data["entries"].items()},
+        }
+
+
+class TimerStore:
+    """Cached view of one instance's part of the consolidated document.
+
+    Mutations update the in-memory copy and record which fields changed. Writes
+    are debounced, except when a crash-critical field changed.
+    """
+
+    def __init__(self, storage: SimpleTimerStorage, entry_id: str) -> None:
+        """Initialize the view."""
+        self._storage = storage
+        self._entry_id = entry_id
+        self.dirty: set[str] = set()
+
+    async def async_load(self) -> dict[str, Any]:
+        """Return this entry's cached document."""
+        data = await self._storage.async_load()
+        return data["entries"].setdefault(self._entry_id, {})
+
+    async def async_update(self, changes: dict[str, Any]) -> None:
+        """Merge changes into the document and schedule a save for changed fields."""
+        data = await self.async_load()
+        for key, value in changes.items():
+            if key not in data or data[key] != value:
+                data[key] = value
+                self.dirty.add(key)
+        await self._async_schedule_save()
+
+    async def async_remove(self, *keys: str) -> None:
+        """Drop fields from the document and schedule a save if any existed."""
+        data = await self.async_load()
+        for key in keys:
+            if key in data:
+                del data[key]
+                self.dirty.add(key)
+        await self._async_schedule_save()
+
+    async def _async_schedule_save(self) -> None:
+        """Write now if a crash-critical field changed, otherwise debounce."""
+        if not self.dirty:
+            return
+        if self.dirty & CRITICAL_FIELDS:
+            await self._storage.async_flush()
+        else:
+            self._storage.async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write pending changes for this entry to disk immediately."""
+        if self.dirty:
+            await self._storage.async_flush()
+
+
+@callback
+def async_get_storage(hass: HomeAssistant) -> SimpleTimerStorage:
+    """Return the domain-wide storage, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (storage := domain_data.get(DATA_STORAGE)) is None:
+        storage = domain_data[DATA_STORAGE] = SimpleTimerStorage(hass)
+    return storage
@@ -0,0 +1,127 @@
+"""Shared one-second tick for all Simple Timer sensors.
+
+One wall-clock-aligned callback per second for the whole domain. Only sensors
+that are accumulating runtime or counting down are subscribed, and the loop
+time spent per tick is recorded for diagnostics.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TICK_HUB = "tick_hub"
+
+# Ticks slower than this (seconds) are logged at debug level
+SLOW_TICK_THRESHOLD = 0.05
+
+
+class TickHub:
+    """Fan a single aligned 1 s tick out to the subscribed sensors."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._listeners: dict[int, Callable[[datetime], None]] = {}
+        self._next_id = 0
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+        # Loop-time statistics (seconds)
+        self._tick_count = 0
+        self._last_duration = 0.0
+        self._max_duration = 0.0
+        self._total_duration = 0.0
+        self._last_listener_count = 0
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of sensors currently subscribed."""
+        return len(self._listeners)
+
+    @callback
+    def async_add_listener(self, action: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Subscribe a callback to the shared tick and return its remover."""
+        listener_id = self._next_id
+        self._next_id += 1
+        self._listeners[listener_id] = action
+
+        if self._unsub_tick is None:
+            self._schedule_next_tick()
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.pop(listener_id, None)
+            if not self._listeners and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return _remove_listener
+
+    @callback
+    def _schedule_next_tick(self) -> None:
+        """Arm the next tick on the next whole wall-clock second."""
+        next_second = dt_util.utcnow().replace(microsecond=0) + timedelta(seconds=1)
+        self._unsub_tick = async_track_point_in_utc_time(
+            self.hass, self._handle_tick, next_second
+        )
+
+    @callback
+    def _handle_tick(self, now: datetime) -> None:
+        """Run every subscribed callback once, then re-arm."""
+        self._unsub_tick = None
+        started = time.perf_counter()
+
+        # Snapshot: listeners may unsubscribe themselves while we iterate.
+        listeners = list(self._listeners.values())
+        for action in listeners:
+            try:
+                action(now)
+            except Exception as e:
+                _LOGGER.error(f"Simple Timer: Tick listener failed: {e}")
+
+        duration = time.perf_counter() - started
+        self._tick_count += 1
+        self._last_duration = duration
+        self._total_duration += duration
+        self._max_duration = max(self._max_duration, duration)
+        self._last_listener_count = len(listeners)
+
+        if duration > SLOW_TICK_THRESHOLD:
+            _LOGGER.debug(
+                f"Simple Timer: Slow tick - {len(listeners)} listeners took {duration * 1000:.1f} ms"
+            )
+
+        # A listener added during this tick may already have re-armed us.
+        if self._listeners and self._unsub_tick is None:
+            self._schedule_next_tick()
+
+    @callback
+    def async_get_stats(self) -> dict:
+        """Return loop-time statistics for diagnostics."""
+        average = self._total_duration / self._tick_count if self._tick_count else 0.0
+        return {
+            "listeners": len(self._listeners),
+            "ticks": self._tick_count,
+            "last_tick_listeners": self._last_listener_count,
+            "last_tick_ms": round(self._last_duration * 1000, 3),
+            "average_tick_ms": round(average * 1000, 3),
+            "max_tick_ms": round(self._max_duration * 1000, 3),
+        }
+
+
+@callback
+def async_get_tick_hub(hass: HomeAssistant) -> TickHub:
+    """Return the domain-wide tick hub, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (hub := domain_data.get(DATA_TICK_HUB)) is None:
+        hub = domain_data[DATA_TICK_HUB] = TickHub(hass)
+    return hub
@@ -0,0 +1 @@
+"""Tests for the Simple Timer integration."""
@@ -0,0 +1,98 @@
+"""Shared fixtures for the Simple Timer tests.
+
+The tests run on pytest-homeassistant-custom-component (requirements_test.txt);
+every module skips itself when it is not installed.
+"""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+DOMAIN = "simple_timer"
+
+# input_boolean helpers stand in for the switches a timer drives
+SWITCH = "input_boolean.pump"
+SECOND_SWITCH = "input_boolean.valve"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load custom_components/simple_timer in every test."""
+    yield
+
+
+@pytest.fixture
+async def switch(hass) -> str:
+    """Set up real on/off entities controllable via homeassistant.turn_on/turn_off."""
+    from homeassistant.setup import async_setup_component
+
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(
+        hass, "input_boolean", {"input_boolean": {"pump": None, "valve": None}}
+    )
+    await hass.async_block_till_done()
+    return SWITCH
+
+
+def stored_entry(hass_storage: dict, entry_id: str, data: dict[str, Any]) -> None:
+    """Seed the consolidated storage document with one instance, as left by a previous run."""
+    hass_storage[DOMAIN] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": DOMAIN,
+        "data": {"entries": {entry_id: data}, "settings": {}},
+    }
+
+
+def timer_entry(hass, switch_entity_id: str, entry_id: str | None = None, **data: Any):
+    """Add (without setting up) a Simple Timer config entry driving switch_entity_id."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=data.get("name", "Pump"),
+        data={"name": "Pump", "switch_entity_id": switch_entity_id, **data},
+        entry_id=entry_id,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def async_load_entry(hass, entry) -> None:
+    """Set up an entry; the bootstrap restores its sensor in the background."""
+    # The card is served over http and registered with lovelace, neither of
+    # which is under test here
+    if getattr(hass, "http", None) is None:
+        hass.http = Mock(async_register_static_paths=AsyncMock())
+    with patch(f"custom_components.{DOMAIN}.init_resource", AsyncMock(return_value=False)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+
+@pytest.fixture
+def setup_timer(hass, switch):
+    """Return a coroutine that sets up one Simple Timer instance and waits for its restore."""
+
+    async def _setup(entry_id: str | None = None, **data: Any):
+        data.setdefault("switch_entity_id", switch)
+        entry = timer_entry(hass, entry_id=entry_id, **data)
+        await async_load_entry(hass, entry)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        return entry
+
+    return _setup
+
+
+def get_timer(hass, entry):
+    """Return the TimerRuntimeSensor of a loaded entry."""
+    return hass.data[DOMAIN][entry.entry_id]["sensor"]
+
+
+def entity_id_of(hass, unique_id: str) -> str:
+    """Return the entity_id registered for one of our unique ids."""
+    from homeassistant.helpers import entity_registry as er
+
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, unique_id)
+    assert entity_id is not None, unique_id
+    return entity_id
@@ -0,0 +1,133 @@
+"""Tests for switch actuation with event-driven confirmation."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.simple_timer.actuation import (
+    DEFAULT_LANE,
+    CommandSuperseded,
+    async_actuate_and_confirm,
+    async_get_actuation_queue,
+    async_wait_for_state,
+)
+
+from .conftest import SECOND_SWITCH, SWITCH, get_timer
+
+
+async def test_wait_for_state(hass: HomeAssistant) -> None:
+    """The wait resolves on the matching state_changed event and times out otherwise."""
+    hass.states.async_set("switch.heater", "off")
+
+    waiter = hass.async_create_task(async_wait_for_state(hass, "switch.heater", 5, "on"))
+    # Let the waiter subscribe before the state changes
+    await asyncio.sleep(0)
+    hass.states.async_set("switch.heater", "off", {"changed": True})
+    hass.states.async_set("switch.heater", "on")
+    assert await waiter
+
+    assert not await async_wait_for_state(hass, "switch.heater", 0.01, "off")
+
+
+async def test_confirmed_actuation_reports_latency(hass: HomeAssistant, switch: str) -> None:
+    """A switch that follows the command resolves with its latency."""
+    latency = await async_actuate_and_confirm(hass, switch, "on", 5)
+    assert latency is not None
+    assert latency >= 0
+    assert hass.states.get(switch).state == "on"
+
+
+async def test_ensure_switch_state_records_latency(hass: HomeAssistant, setup_timer) -> None:
+    """Correcting the switch waits for its event instead of polling, and records the latency."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+
+    await timer._ensure_switch_state("on", "Test")
+    assert hass.states.get(SWITCH).state == "on"
+    stats = timer._actuation_stats.as_dict()[SWITCH]
+    assert stats["confirmed"] == 1
+    assert stats["timeouts"] == 0
+    assert timer.extra_state_attributes["actuation_latency_ms"] == stats["last_ms"]
+
+
+async def test_unresponsive_switch_is_retried_then_reported(hass: HomeAssistant, setup_timer) -> None:
+    """A switch that never confirms is retried once per timeout and then warned about."""
+    hass.states.async_set("switch.stuck", "off")
+    turn_on_calls = async_mock_service(hass, "switch", "turn_on")
+    entry = await setup_timer(switch_entity_id="switch.stuck")
+    timer = get_timer(hass, entry)
+
+    with (
+        patch("custom_components.simple_timer.sensor.CONFIRM_TIMEOUTS", (0.01, 0.01)),
+        patch.object(timer, "_send_notification") as send_notification,
+    ):
+        await timer._ensure_switch_state("on", "Test")
+
+    assert len(turn_on_calls) == 2
+    assert timer._actuation_stats.as_dict()["switch.stuck"]["timeouts"] == 2
+    send_notification.assert_awaited_once()
+    assert "remains 'off'" in send_notification.await_args.args[0]
+
+
+async def _throttled_queue(hass: HomeAssistant):
+    """Return the queue with the lane of the test switches throttled, its first slot taken."""
+    queue = async_get_actuation_queue(hass)
+    queue.async_set_limits({DEFAULT_LANE: {"min_interval": 0.05, "jitter": 0}})
+    # Sent right away; commands queued behind it wait for the spacing
+    first = queue.async_enqueue(SECOND_SWITCH, "on", None)
+    return queue, first
+
+
+async def test_opposite_command_supersedes_a_queued_one(hass: HomeAssistant, switch: str) -> None:
+    """The newer of two opposite commands wins; the older is not retried by its waiter."""
+    queue, first = await _throttled_queue(hass)
+
+    turn_off = queue.async_enqueue(switch, "off", 5)
+    turn_on = queue.async_enqueue(switch, "on", 5)
+    with pytest.raises(CommandSuperseded):
+        await turn_off
+    assert await turn_on is not None
+    await first
+    assert hass.states.get(switch).state == "on"
+
+    stats = queue.async_get_stats()[DEFAULT_LANE]
+    assert stats["superseded"] == 1
+    assert stats["sent"] == 2
+
+
+async def test_same_command_is_merged(hass: HomeAssistant, switch: str) -> None:
+    """Repeating a queued command shares it instead of sending twice."""
+    queue, first = await _throttled_queue(hass)
+
+    turn_on = queue.async_enqueue(switch, "on", None)
+    assert queue.async_enqueue(switch, "on", 5) is turn_on
+    await turn_on
+    await first
+
+    stats = queue.async_get_stats()[DEFAULT_LANE]
+    assert stats["merged"] == 1
+    assert stats["sent"] == 2
+
+
+async def test_superseded_command_is_not_a_timeout(hass: HomeAssistant, setup_timer) -> None:
+    """A timer whose command was replaced neither retries nor records a timeout."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    queue, first = await _throttled_queue(hass)
+
+    actuate = hass.async_create_task(timer._async_actuate_switch("on", 5))
+    await asyncio.sleep(0)
+    queue.async_enqueue(SWITCH, "off", None)
+
+    assert await actuate
+    await first
+    await hass.async_block_till_done()
+    assert SWITCH not in timer._actuation_stats.as_dict()
+    assert hass.states.get(SWITCH).state == "off"
@@ -0,0 +1,47 @@
+"""Tests for the recorder-excluded attributes and the cached attribute snapshot."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.sensor import TimerRuntimeSensor
+
+from .conftest import entity_id_of, get_timer
+
+
+def test_static_attributes_are_not_recorded() -> None:
+    """Config echoes and the per-second countdown stay out of the recorder."""
+    for attribute in ("timer_remaining", "entry_id", "switch_entity_id", "instance_title", "reset_time", "show_seconds"):
+        assert attribute in TimerRuntimeSensor._unrecorded_attributes
+    for attribute in ("timer_state", "timer_finishes_at", "last_on_timestamp"):
+        assert attribute not in TimerRuntimeSensor._unrecorded_attributes
+
+
+async def test_countdown_reuses_the_snapshot(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """A countdown tick only recomputes timer_remaining; a transition rebuilds the rest."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+
+    await timer.async_start_timer(1, "min")
+    await hass.async_block_till_done()
+    snapshot = timer._attributes_snapshot
+    assert hass.states.get(entity_id).attributes["timer_remaining"] == 60
+
+    freezer.tick(5)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    attributes = hass.states.get(entity_id).attributes
+    assert attributes["timer_remaining"] == 55
+    assert attributes["timer_state"] == "active"
+    assert timer._attributes_snapshot is snapshot
+
+    await timer.async_cancel_timer()
+    await hass.async_block_till_done()
+    assert timer._attributes_snapshot is not snapshot
+    assert hass.states.get(entity_id).attributes["timer_state"] == "idle"
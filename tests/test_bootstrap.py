@@ -0,0 +1,52 @@
+"""Tests for the batched post-startup restore of all timers."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+
+from custom_components.simple_timer.bootstrap import async_get_bootstrap
+
+from .conftest import SECOND_SWITCH, SWITCH, async_load_entry, get_timer, timer_entry
+
+
+async def test_timers_are_restored_in_one_batch(hass: HomeAssistant, switch: str) -> None:
+    """Timers added while core starts are restored together once it is running, grouped by switch."""
+    hass.set_state(CoreState.starting)
+    entries = [
+        timer_entry(hass, SWITCH, name="Pump"),
+        timer_entry(hass, SWITCH, name="Pump boost"),
+        timer_entry(hass, SECOND_SWITCH, name="Valve"),
+    ]
+    # Setting up the domain sets up all of its entries
+    await async_load_entry(hass, entries[0])
+    await hass.async_block_till_done()
+
+    timers = [get_timer(hass, entry) for entry in entries]
+    assert all(timer is not None for timer in timers)
+    assert not any(timer._reset_state_restored for timer in timers)
+    assert async_get_bootstrap(hass).async_get_stats() is None
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    stats = async_get_bootstrap(hass).async_get_stats()
+    assert stats["sensors"] == 3
+    assert stats["switch_groups"] == 2
+    for timer in timers:
+        assert timer._reset_state_restored
+        assert timer._state_listener_disposer is not None
+
+
+async def test_late_timer_is_restored_on_its_own(hass: HomeAssistant, setup_timer) -> None:
+    """A timer added after startup doesn't wait for another batch."""
+    first = await setup_timer(name="Pump")
+    second = await setup_timer(name="Valve", switch_entity_id=SECOND_SWITCH)
+
+    assert async_get_bootstrap(hass).async_get_stats()["sensors"] == 1
+    assert get_timer(hass, first)._state_listener_disposer is not None
+    assert get_timer(hass, second)._state_listener_disposer is not None
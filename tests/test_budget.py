@@ -0,0 +1,90 @@
+"""Tests for the daily runtime budget cutoff."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_capture_events, async_fire_time_changed
+
+from .conftest import SECOND_SWITCH, SWITCH, entity_id_of, get_timer
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def _turn(hass: HomeAssistant, entity_id: str, state: str) -> None:
+    """Switch an input_boolean by hand."""
+    await hass.services.async_call("input_boolean", f"turn_{state}", {"entity_id": entity_id}, blocking=True)
+    await hass.async_block_till_done()
+
+
+async def test_switch_is_turned_off_at_the_budget(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """Usage earlier in the day counts; the switch goes off the moment the budget is used up."""
+    entry = await setup_timer(daily_budget=1)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+
+    await _turn(hass, SWITCH, "on")
+    await _advance(hass, freezer, 20 * 60)
+    await _turn(hass, SWITCH, "off")
+    assert hass.states.get(entity_id).attributes["budget_cutoff_at"] is None
+
+    await _turn(hass, SWITCH, "on")
+    cutoff = dt_util.utcnow() + timedelta(minutes=40)
+    assert hass.states.get(entity_id).attributes["budget_cutoff_at"] == cutoff.isoformat()
+
+    await _advance(hass, freezer, 40 * 60 - 1)
+    assert hass.states.get(SWITCH).state == "on"
+    await _advance(hass, freezer, 1)
+    assert hass.states.get(SWITCH).state == "off"
+    assert round(get_timer(hass, entry)._state) == 3600
+
+
+async def test_budget_cancels_a_running_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A timer that would run past the budget is cut short."""
+    entry = await setup_timer(daily_budget=0.5)
+    timer = get_timer(hass, entry)
+    await timer.async_start_timer(60, "min")
+    await hass.async_block_till_done()
+
+    await _advance(hass, freezer, 30 * 60)
+    assert hass.states.get(SWITCH).state == "off"
+    assert timer._timer_state == "idle"
+
+
+async def test_group_members_are_turned_off_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """The cutoff sends each member a single turn_off."""
+    await setup_timer(daily_budget=0.5, group_members=[SECOND_SWITCH])
+    await _turn(hass, SWITCH, "on")
+    await _turn(hass, SECOND_SWITCH, "on")
+    calls = async_capture_events(hass, EVENT_CALL_SERVICE)
+
+    await _advance(hass, freezer, 30 * 60)
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(SECOND_SWITCH).state == "off"
+
+    def _targets(event) -> list[str]:
+        entity_ids = event.data["service_data"].get("entity_id", [])
+        return [entity_ids] if isinstance(entity_ids, str) else list(entity_ids)
+
+    member_offs = [
+        event for event in calls
+        if event.data["service"] == "turn_off" and SECOND_SWITCH in _targets(event)
+    ]
+    assert len(member_offs) == 1
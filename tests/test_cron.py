@@ -0,0 +1,131 @@
+"""Tests for cron expressions and the multi-slot schedule table."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+import voluptuous as vol
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.cron import CronError, CronExpression, ScheduleSlot, ScheduleTable
+
+from .conftest import SWITCH, entity_id_of, get_timer, stored_entry
+
+# A Saturday
+SATURDAY = datetime(2026, 10, 17, 10, 7, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("*/15 * * * *", datetime(2026, 10, 17, 10, 15)),
+        ("7 10 * * *", datetime(2026, 10, 18, 10, 7)),
+        ("0 9-17/4 * * *", datetime(2026, 10, 17, 13, 0)),
+        ("0 6 * * mon-fri", datetime(2026, 10, 19, 6, 0)),
+        ("0 6 * * 7", datetime(2026, 10, 18, 6, 0)),
+        ("30 8 1 * *", datetime(2026, 11, 1, 8, 30)),
+        # Both day fields restricted: either one matching is enough
+        ("0 0 13 * fri", datetime(2026, 10, 23, 0, 0)),
+        ("0 0 29 feb *", datetime(2028, 2, 29, 0, 0)),
+    ],
+)
+def test_next_after(expression: str, expected: datetime) -> None:
+    """The next match is strictly after the given time and keeps its tzinfo."""
+    assert CronExpression(expression).next_after(SATURDAY) == expected.replace(tzinfo=timezone.utc)
+
+
+def test_expression_that_never_fires() -> None:
+    """An impossible date gives up instead of searching forever."""
+    assert CronExpression("0 0 30 2 *").next_after(SATURDAY) is None
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "a * * * *", "* * * 13 *"],
+)
+def test_invalid_expressions(expression: str) -> None:
+    """Malformed expressions raise CronError."""
+    with pytest.raises(CronError):
+        CronExpression(expression)
+
+
+def test_table_pops_due_slots_and_advances_them() -> None:
+    """Slots due together are returned at once and moved to their next fire."""
+    table = ScheduleTable()
+    table.add(ScheduleSlot("noon", CronExpression("0 12 * * *"), 10), SATURDAY)
+    table.add(ScheduleSlot("short", CronExpression("30 10 * * *"), 5), SATURDAY)
+    table.add(ScheduleSlot("long", CronExpression("30 10 * * *"), 20), SATURDAY)
+    assert table.peek().slot_id == "short"
+
+    due = table.pop_due(SATURDAY.replace(minute=30))
+    assert {slot.slot_id for slot in due} == {"short", "long"}
+    assert table.peek().slot_id == "noon"
+    assert table.slots["short"].next_fire == datetime(2026, 10, 18, 10, 30, tzinfo=timezone.utc)
+
+    assert table.remove("noon")
+    assert not table.remove("noon")
+    assert table.peek().slot_id in ("short", "long")
+
+
+def test_table_storage_round_trip() -> None:
+    """The compact stored form rebuilds the table; invalid rows are skipped."""
+    table = ScheduleTable()
+    table.add(ScheduleSlot("morning", CronExpression("0 6 * * mon-fri"), 15, "min"), SATURDAY)
+    stored = table.as_storage()
+    assert stored == [["morning", "0 6 * * mon-fri", 15, "min"]]
+
+    restored = ScheduleTable.from_storage([*stored, ["bad", "not cron", 5, "min"], ["short"]], SATURDAY)
+    assert list(restored.slots) == ["morning"]
+    assert restored.peek().next_fire == datetime(2026, 10, 19, 6, 0, tzinfo=timezone.utc)
+
+
+async def test_slot_starts_a_bounded_run(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """When a slot fires the instance runs its timer and the slot moves to the next day."""
+    freezer.move_to(dt_util.start_of_local_day() + timedelta(hours=12))
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    start = dt_util.now() + timedelta(minutes=2)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "add_schedule_slot",
+        {"entry_id": entry.entry_id, "slot_id": "noon", "cron": f"{start.minute} {start.hour} * * *", "duration": 5},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id_of(hass, f"timer_runtime_{entry.entry_id}"))
+    assert state.attributes["schedule_slots"][0]["next_start"] == start.replace(second=0, microsecond=0).isoformat()
+
+    freezer.move_to(start.replace(second=0, microsecond=0))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert timer._timer_state == "active"
+    assert hass.states.get(SWITCH).state == "on"
+    assert timer._slots.slots["noon"].next_fire.date() == (start + timedelta(days=1)).date()
+
+
+async def test_service_rejects_invalid_cron(hass: HomeAssistant, setup_timer) -> None:
+    """The service schema validates the expression before any timer sees it."""
+    entry = await setup_timer()
+    with pytest.raises(vol.Invalid, match="Invalid cron expression"):
+        await hass.services.async_call(
+            DOMAIN, "add_schedule_slot", {"entry_id": entry.entry_id, "cron": "61 * * * *", "duration": 5}, blocking=True
+        )
+
+
+async def test_slots_survive_a_restart(hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer) -> None:
+    """Stored slots are restored and the earliest one armed."""
+    stored_entry(hass_storage, "abc", {"slots": [["morning", "0 6 * * *", 15, "min"], ["evening", "0 18 * * *", 10, "min"]]})
+
+    timer = get_timer(hass, await setup_timer(entry_id="abc"))
+
+    assert set(timer._slots.slots) == {"morning", "evening"}
+    assert timer._slot_unsub is not None
+    assert timer._slot_unsub.when == dt_util.as_utc(timer._slots.peek().next_fire)
@@ -0,0 +1,117 @@
+"""Tests for duty-cycle (pulse) mode."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.cycle import PHASE_DONE, PHASE_OFF, PHASE_ON, DutyCycle
+
+from .conftest import SWITCH, entity_id_of, get_timer, stored_entry
+
+START = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _at(seconds: float) -> datetime:
+    """Return the moment `seconds` into the cycle."""
+    return START + timedelta(seconds=seconds)
+
+
+def test_phase_is_a_function_of_the_clock() -> None:
+    """Every phase and its end follow from the start time alone."""
+    cycle = DutyCycle(START, on_seconds=60, off_seconds=120, repeats=3)
+
+    assert cycle.phase_at(START) == (PHASE_ON, 1, _at(60))
+    assert cycle.phase_at(_at(59)) == (PHASE_ON, 1, _at(60))
+    assert cycle.phase_at(_at(60)) == (PHASE_OFF, 1, _at(180))
+    assert cycle.phase_at(_at(200)) == (PHASE_ON, 2, _at(240))
+    assert cycle.phase_at(_at(400)) == (PHASE_ON, 3, _at(420))
+    assert cycle.phase_at(_at(420)) == (PHASE_DONE, 3, None)
+
+
+def test_trailing_off_phase_is_skipped() -> None:
+    """The cycle ends with the last on phase."""
+    assert DutyCycle(START, 60, 120, 3).finishes_at == _at(420)
+    assert DutyCycle(START, 60, 0, 1).finishes_at == _at(60)
+
+
+def test_storage_round_trip() -> None:
+    """Only the start and the three parameters are stored."""
+    cycle = DutyCycle(START, 60.0, 120.0, 3)
+    assert cycle.as_storage() == [START.isoformat(), 60.0, 120.0, 3]
+    assert DutyCycle.from_storage(cycle.as_storage()) == cycle
+
+    with pytest.raises(ValueError):
+        DutyCycle.from_storage(["yesterday", 60, 120, 3])
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_cycle_drives_the_switch(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """The switch follows each phase and is left off when the cycle finishes."""
+    entry = await setup_timer()
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+    await hass.services.async_call(
+        DOMAIN,
+        "start_cycle",
+        {"entry_id": entry.entry_id, "on_duration": 1, "off_duration": 2, "repeats": 2},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH).state == "on"
+    assert hass.states.get(entity_id).attributes["cycle_repeats"] == 2
+
+    await _advance(hass, freezer, 60)
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(entity_id).attributes["cycle_state"] == PHASE_OFF
+
+    await _advance(hass, freezer, 120)
+    assert hass.states.get(SWITCH).state == "on"
+    assert hass.states.get(entity_id).attributes["cycle_repeat"] == 2
+
+    await _advance(hass, freezer, 60)
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(entity_id).attributes["cycle_state"] == "idle"
+    assert get_timer(hass, entry)._cycle_unsub is None
+
+
+async def test_cycle_rejected_in_the_wrong_state(hass: HomeAssistant, setup_timer) -> None:
+    """A cycle can't start over a running timer, and stopping needs a running cycle."""
+    entry = await setup_timer()
+    with pytest.raises(ServiceValidationError, match="No cycle is running"):
+        await hass.services.async_call(DOMAIN, "stop_cycle", {"entry_id": entry.entry_id}, blocking=True)
+
+    await get_timer(hass, entry).async_start_timer(10, "min")
+    with pytest.raises(ServiceValidationError, match="A timer is running"):
+        await hass.services.async_call(
+            DOMAIN, "start_cycle", {"entry_id": entry.entry_id, "on_duration": 1, "repeats": 2}, blocking=True
+        )
+
+
+async def test_cycle_resumes_in_its_phase_after_a_restart(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A stored cycle picks up in whatever phase the clock says it is in."""
+    started_at = dt_util.utcnow() - timedelta(seconds=90)
+    stored_entry(hass_storage, "abc", {"cycle": [started_at.isoformat(), 60.0, 120.0, 2]})
+
+    timer = get_timer(hass, await setup_timer(entry_id="abc"))
+
+    assert timer._cycle_phase == (PHASE_OFF, 1, started_at + timedelta(seconds=180))
+    assert timer._cycle_unsub.when == started_at + timedelta(seconds=180)
+    assert hass.states.get(SWITCH).state == "off"
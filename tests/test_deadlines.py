@@ -0,0 +1,140 @@
+"""Tests for the domain deadline heap."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.deadlines import async_get_deadline_scheduler
+
+from .conftest import SWITCH, get_timer
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_deadlines_fire_in_order(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Deadlines fire at their time, earliest first, from one armed listener."""
+    scheduler = async_get_deadline_scheduler(hass)
+    now = dt_util.utcnow()
+    fired = []
+    for seconds in (30, 10, 20):
+        scheduler.async_schedule(now + timedelta(seconds=seconds), lambda _now, s=seconds: fired.append(s))
+    assert scheduler.async_get_stats()["next_deadline"] == (now + timedelta(seconds=10)).isoformat()
+
+    await _advance(hass, freezer, 10)
+    assert fired == [10]
+    await _advance(hass, freezer, 10)
+    assert fired == [10, 20]
+    await _advance(hass, freezer, 10)
+    assert fired == [10, 20, 30]
+
+    stats = scheduler.async_get_stats()
+    assert stats["fired"] == 3
+    assert stats["pending"] == 0
+    assert stats["next_deadline"] is None
+
+
+async def test_due_deadlines_fire_in_one_batch(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Deadlines due together fire in one batch; a slightly later one waits for its time."""
+    scheduler = async_get_deadline_scheduler(hass)
+    now = dt_util.utcnow()
+    fired, later = [], []
+    scheduler.async_schedule(now + timedelta(seconds=5), fired.append)
+    scheduler.async_schedule(now + timedelta(seconds=5), fired.append)
+    scheduler.async_schedule(now + timedelta(seconds=5.2), later.append)
+
+    await _advance(hass, freezer, 5)
+    assert len(fired) == 2
+    assert not later
+    stats = scheduler.async_get_stats()
+    assert stats["batches"] == 1
+    assert stats["max_batch"] == 2
+
+    await _advance(hass, freezer, 0.2)
+    assert len(later) == 1
+
+
+async def test_cancel_and_reschedule(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """A cancelled deadline never fires; a moved one fires at its new time only."""
+    scheduler = async_get_deadline_scheduler(hass)
+    now = dt_util.utcnow()
+    cancelled, moved = [], []
+    cancel = scheduler.async_schedule(now + timedelta(seconds=5), cancelled.append)
+    handle = scheduler.async_schedule(now + timedelta(seconds=10), moved.append)
+
+    cancel()
+    scheduler.async_reschedule(handle, now + timedelta(seconds=20))
+    assert scheduler.async_get_stats()["pending"] == 1
+
+    await _advance(hass, freezer, 10)
+    assert not cancelled
+    assert not moved
+    await _advance(hass, freezer, 10)
+    assert len(moved) == 1
+
+
+async def test_stale_entries_are_compacted(hass: HomeAssistant) -> None:
+    """Repeated rescheduling doesn't grow the heap without bound."""
+    scheduler = async_get_deadline_scheduler(hass)
+    now = dt_util.utcnow()
+    handle = scheduler.async_schedule(now + timedelta(minutes=1), lambda _now: None)
+
+    for seconds in range(100):
+        scheduler.async_reschedule(handle, now + timedelta(minutes=2, seconds=seconds))
+    stats = scheduler.async_get_stats()
+    assert stats["pending"] == 1
+    assert stats["heap_size"] < 20
+
+
+async def test_timer_completes_from_its_deadline(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A running timer finishes and turns its switch off when its deadline fires."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    await timer.async_start_timer(1, "min")
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH).state == "on"
+    assert async_get_deadline_scheduler(hass).async_get_stats()["pending"] == 1
+
+    await _advance(hass, freezer, 30)
+    await timer.async_add_timer(1, "min")
+    await _advance(hass, freezer, 31)
+    assert timer._timer_state == "active"
+
+    await _advance(hass, freezer, 60)
+    assert timer._timer_state == "idle"
+    assert hass.states.get(SWITCH).state == "off"
+
+
+async def test_repeating_schedule_starts_once(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A daily scheduled start runs its timer once and re-arms for the next day."""
+    freezer.move_to(dt_util.start_of_local_day() + timedelta(hours=12))
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    start = dt_util.now() + timedelta(minutes=1)
+    await timer.async_schedule_timer(start.time(), 5, "min", repeat=True)
+    fire_at = timer._scheduled_fire_at
+
+    with patch.object(timer, "async_start_timer", wraps=timer.async_start_timer) as start_timer:
+        await _advance(hass, freezer, 60)
+        await _advance(hass, freezer, 1)
+
+    assert start_timer.call_count == 1
+    assert timer._timer_state == "active"
+    assert timer._scheduled_fire_at == fire_at + timedelta(days=1)
@@ -0,0 +1,102 @@
+"""Tests for energy integration from a linked power sensor."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE
+from homeassistant.core import CoreState, HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.energy import METHOD_LEFT, EnergyIntegrator, power_to_watts
+
+from .conftest import SWITCH, async_load_entry, entity_id_of, stored_entry, timer_entry
+
+POWER = "sensor.pump_power"
+START = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _at(minutes: float) -> datetime:
+    """Return the moment `minutes` after the session start."""
+    return START + timedelta(minutes=minutes)
+
+
+@pytest.mark.parametrize(("method", "expected"), [("trapezoidal", 1.75), (METHOD_LEFT, 1.5)])
+def test_riemann_sum(method: str, expected: float) -> None:
+    """Power is integrated between samples and the last value held until the session ends."""
+    energy = EnergyIntegrator(method)
+    energy.start(_at(0), 1000)
+    assert energy.sample(_at(30), 2000)
+    energy.stop(_at(60))
+    assert energy.energy == pytest.approx(expected)
+    assert not energy.sample(_at(90), 5000)
+
+
+def test_unknown_power_adds_nothing() -> None:
+    """Stretches with no usable power value don't count, nor does negative power; unknown methods fall back."""
+    energy = EnergyIntegrator()
+    energy.start(_at(0), None)
+    assert not energy.sample(_at(30), -200)
+    energy.stop(_at(60))
+    assert energy.energy == 0
+    assert EnergyIntegrator("simpson").method == "trapezoidal"
+
+
+@pytest.mark.parametrize(
+    ("state", "unit", "expected"),
+    [("200", "W", 200.0), ("1.5", "kW", 1500.0), ("200", None, 200.0), ("unavailable", "W", None), ("5", "BTU/h", None)],
+)
+def test_power_to_watts(state: str, unit: str | None, expected: float | None) -> None:
+    """States are converted to watts; unusable ones are ignored."""
+    assert power_to_watts(state, unit) == expected
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, minutes: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(timedelta(minutes=minutes))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_energy_follows_the_switch_sessions(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """Power only counts while the switch is on."""
+    hass.states.async_set(POWER, "1000", {"unit_of_measurement": "W"})
+    entry = await setup_timer(power_sensor=POWER)
+    energy = entity_id_of(hass, f"timer_energy_{entry.entry_id}")
+
+    await _advance(hass, freezer, 30)
+    await hass.services.async_call("input_boolean", "turn_on", {"entity_id": SWITCH}, blocking=True)
+    await _advance(hass, freezer, 30)
+    hass.states.async_set(POWER, "2", {"unit_of_measurement": "kW"})
+    await _advance(hass, freezer, 30)
+    await hass.services.async_call("input_boolean", "turn_off", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    await _advance(hass, freezer, 30)
+
+    assert float(hass.states.get(energy).state) == pytest.approx(1.75)
+
+
+async def test_energy_total_is_restored(hass: HomeAssistant, hass_storage: dict[str, Any], switch: str) -> None:
+    """The energy sensor is unavailable until the restore, then shows the stored total."""
+    stored_entry(hass_storage, "abc", {"energy": [2.5, START.isoformat()]})
+
+    hass.set_state(CoreState.starting)
+    await async_load_entry(hass, timer_entry(hass, SWITCH, entry_id="abc", power_sensor=POWER))
+    await hass.async_block_till_done()
+    energy = entity_id_of(hass, "timer_energy_abc")
+    assert hass.states.get(energy).state == STATE_UNAVAILABLE
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get(energy)
+    assert float(state.state) == pytest.approx(2.5)
+    assert state.attributes["last_reset"] == START.isoformat()
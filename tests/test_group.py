@@ -0,0 +1,67 @@
+"""Tests for switch groups driven by one timer."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from .conftest import SECOND_SWITCH, SWITCH, entity_id_of, get_timer, stored_entry
+
+
+async def _turn(hass: HomeAssistant, entity_id: str, state: str) -> None:
+    """Switch an input_boolean by hand."""
+    await hass.services.async_call("input_boolean", f"turn_{state}", {"entity_id": entity_id}, blocking=True)
+    await hass.async_block_till_done()
+
+
+async def test_group_is_on_while_any_member_is(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A member alone turns the group on, and its own on-time is tracked."""
+    entry = await setup_timer(group_members=[SECOND_SWITCH])
+    timer = get_timer(hass, entry)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+    assert hass.states.get(entity_id).attributes["group_members"] == [SECOND_SWITCH]
+
+    await _turn(hass, SECOND_SWITCH, "on")
+    assert timer._group_state == "on"
+    assert timer._is_switch_on()
+
+    freezer.tick(60)
+    async_fire_time_changed(hass)
+    await _turn(hass, SECOND_SWITCH, "off")
+    assert timer._group_state == "off"
+    assert hass.states.get(entity_id).attributes["member_runtime"] == {SECOND_SWITCH: 60}
+    assert int(timer._state) == 60
+
+
+async def test_switch_and_members_follow_the_timer(hass: HomeAssistant, setup_timer) -> None:
+    """Starting and cancelling a timer drives every member along with the switch."""
+    entry = await setup_timer(group_members=[SECOND_SWITCH])
+    timer = get_timer(hass, entry)
+
+    await timer.async_start_timer(5, "min")
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH).state == "on"
+    assert hass.states.get(SECOND_SWITCH).state == "on"
+
+    await timer.async_cancel_timer()
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(SECOND_SWITCH).state == "off"
+
+
+async def test_member_runtime_is_restored(hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer) -> None:
+    """Today's per-member runtime survives a restart; removed members are dropped."""
+    stored_entry(hass_storage, "abc", {"member_runtime": {SECOND_SWITCH: 120.0, "switch.removed": 5.0}})
+
+    await setup_timer(entry_id="abc", group_members=[SECOND_SWITCH])
+
+    state = hass.states.get(entity_id_of(hass, "timer_runtime_abc"))
+    assert state.attributes["member_runtime"] == {SECOND_SWITCH: 120}
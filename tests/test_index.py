@@ -0,0 +1,59 @@
+"""Tests for the entity_id / entry_id index used by the services."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.simple_timer.index import async_get_timer_index
+
+from .conftest import entity_id_of, get_timer
+
+
+async def test_entities_resolve_without_registry_lookups(hass: HomeAssistant, setup_timer) -> None:
+    """A loaded timer's entities resolve to its entry from the index."""
+    entry = await setup_timer()
+    index = async_get_timer_index(hass)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+
+    assert index.async_resolve(None, entity_id) == (entry.entry_id, f"entity_id: {entity_id}")
+    assert index.async_resolve(None, entity_id_of(hass, f"timer_runtime_{entry.entry_id}_7d"))[0] == entry.entry_id
+    assert index.async_get_sensor(entry.entry_id, "test") is get_timer(hass, entry)
+    assert index.async_get_stats()["misses"] == 0
+
+
+async def test_renames_and_removals_are_followed(hass: HomeAssistant, setup_timer) -> None:
+    """Registry updates keep the index current."""
+    entry = await setup_timer()
+    index = async_get_timer_index(hass)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+    registry = er.async_get(hass)
+
+    registry.async_update_entity(entity_id, new_entity_id="sensor.garden_pump")
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert index.async_resolve(None, "sensor.garden_pump")[0] == entry.entry_id
+    assert index.async_get_sensor(entry.entry_id, "test") is get_timer(hass, entry)
+    with pytest.raises(ServiceValidationError):
+        index.async_resolve(None, entity_id)
+
+    registry.async_remove("sensor.garden_pump")
+    await hass.async_block_till_done()
+    with pytest.raises(ServiceValidationError):
+        index.async_resolve(None, "sensor.garden_pump")
+
+
+async def test_unknown_targets_raise_clear_errors(hass: HomeAssistant, setup_timer) -> None:
+    """Foreign entities and unloaded entries are rejected as validation errors."""
+    entry = await setup_timer()
+    index = async_get_timer_index(hass)
+
+    with pytest.raises(ServiceValidationError, match="is not a Simple Timer entity"):
+        index.async_resolve(None, "input_boolean.pump")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    with pytest.raises(ServiceValidationError, match="No Simple Timer sensor loaded"):
+        index.async_get_sensor(entry.entry_id, f"entry_id: {entry.entry_id}")
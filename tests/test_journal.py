@@ -0,0 +1,101 @@
+"""Tests for the session journal and its rolling compaction."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.journal import STORAGE_KEY, STORAGE_VERSION, async_get_session_journal
+
+from .conftest import async_load_entry, get_timer
+
+
+def _run(days_ago: int, runtime: int, duration: int = 600) -> list:
+    """Return a compact run row that started at this time `days_ago` days back."""
+    start = int((dt_util.utcnow() - timedelta(days=days_ago)).timestamp())
+    return [start, start + runtime, "normal", "button", duration, runtime, "finished"]
+
+
+async def test_old_runs_fold_into_days_and_weeks(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Runs past retention become day totals, old days week totals, and ancient weeks go."""
+    freezer.move_to(dt_util.start_of_local_day() + timedelta(hours=12))
+    today = dt_util.now().date()
+    old_day = today - timedelta(days=200)
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "abc": {
+                "runs": [_run(40, 300), _run(40, 120), _run(10, 60)],
+                "days": [[old_day.isoformat(), 2, 900, 1200]],
+                "weeks": [["2020-01-06", 5, 3600, 3600]],
+            }
+        },
+    }
+
+    journal = async_get_session_journal(hass)
+    await journal.async_load()
+
+    stats = journal.async_get_stats()
+    assert stats["runs"] == 1
+    assert stats["last_compaction"]["runs_folded"] == 2
+    assert stats["last_compaction"]["days_folded"] == 1
+
+    sessions = journal.async_query("abc", 3650)
+    assert [run["runtime"] for run in sessions["runs"]] == [60]
+    assert sessions["days"] == [
+        {"date": (today - timedelta(days=40)).isoformat(), "runs": 2, "runtime": 420, "duration": 1200}
+    ]
+    monday = old_day - timedelta(days=old_day.weekday())
+    assert sessions["weeks"] == [{"week": monday.isoformat(), "runs": 2, "runtime": 900, "duration": 1200}]
+
+    # Only the window asked for is returned
+    assert journal.async_query("abc", 30)["days"] == []
+
+
+async def test_finished_run_is_returned_by_get_sessions(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A cancelled run is journalled with its real runtime."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    await timer.async_start_timer(10, "min")
+    await hass.async_block_till_done()
+    freezer.tick(90)
+    await timer.async_cancel_timer()
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN, "get_sessions", {"entry_id": entry.entry_id}, blocking=True, return_response=True
+    )
+    [run] = response["sessions"][entry.entry_id]["runs"]
+    assert run["mode"] == "normal"
+    assert run["outcome"] == "cancelled"
+    assert run["duration"] == 600
+    assert run["runtime"] == 90
+
+
+async def test_compaction_stops_with_the_last_instance(hass: HomeAssistant, setup_timer) -> None:
+    """Unloading every instance cancels the daily compaction; loading one restarts it."""
+    first = await setup_timer(name="Pump")
+    second = await setup_timer(name="Valve")
+    journal = async_get_session_journal(hass)
+    assert journal._compact_unsub is not None
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert journal._compact_unsub is not None
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert journal._compact_unsub is None
+
+    await async_load_entry(hass, first)
+    assert journal._compact_unsub is not None
@@ -0,0 +1,62 @@
+"""Tests for the lazy (computed-on-read) runtime accumulation mode."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.tick import async_get_tick_hub
+
+from .conftest import SWITCH, entity_id_of, get_timer
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: int) -> None:
+    """Move the clock forward and run whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_runtime_is_computed_on_read(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """Runtime grows on read; the state is only written at the coarse cadence and on transitions."""
+    entry = await setup_timer(lazy_accumulation=True, state_write_interval=10)
+    timer = get_timer(hass, entry)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+
+    await hass.services.async_call("input_boolean", "turn_on", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    assert async_get_tick_hub(hass).listener_count == 0
+    assert hass.states.get(entity_id).attributes["accumulation_mode"] == "lazy"
+
+    await _advance(hass, freezer, 4)
+    assert timer.native_value == 4
+    assert float(hass.states.get(entity_id).state) == 0
+
+    await _advance(hass, freezer, 6)
+    assert float(hass.states.get(entity_id).state) == 10
+
+    await _advance(hass, freezer, 3)
+    assert float(hass.states.get(entity_id).state) == 10
+
+    # Switching off folds the pending seconds and writes them
+    await hass.services.async_call("input_boolean", "turn_off", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) == 13
+
+    await _advance(hass, freezer, 30)
+    assert timer.native_value == 13
+
+
+async def test_realtime_mode_stays_the_default(hass: HomeAssistant, setup_timer) -> None:
+    """Without the option the timer accumulates from the per-second tick."""
+    entry = await setup_timer()
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+    assert hass.states.get(entity_id).attributes["accumulation_mode"] == "realtime"
+
+    await hass.services.async_call("input_boolean", "turn_on", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    assert async_get_tick_hub(hass).listener_count == 1
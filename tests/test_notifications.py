@@ -0,0 +1,131 @@
+"""Tests for background notification delivery."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant, ServiceCall
+from pytest_homeassistant_custom_component.common import async_fire_time_changed, async_mock_service
+
+from custom_components.simple_timer.notifications import async_get_notification_dispatcher
+
+
+async def test_targets_are_notified_in_the_background(hass: HomeAssistant) -> None:
+    """async_notify returns at once; every target receives the message."""
+    phone = async_mock_service(hass, "notify", "phone")
+    tablet = async_mock_service(hass, "notify", "tablet")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    dispatcher.async_notify("abc", "Pump", "Timer finished", ["notify.phone", "notify.tablet"])
+    assert not phone and not tablet
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    for calls in (phone, tablet):
+        assert len(calls) == 1
+        assert calls[0].data == {"message": "Timer finished", "title": "Pump"}
+    assert dispatcher.async_get_stats()["targets"]["notify.phone"]["sent"] == 1
+
+
+async def test_slow_target_times_out_alone(hass: HomeAssistant) -> None:
+    """A hung endpoint is cut off by its timeout and doesn't hold up other targets."""
+    hang = asyncio.Event()
+
+    async def _async_hang(call: ServiceCall) -> None:
+        await hang.wait()
+
+    hass.services.async_register("notify", "slow", _async_hang)
+    phone = async_mock_service(hass, "notify", "phone")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    with patch("custom_components.simple_timer.notifications.TARGET_TIMEOUT", 0.05):
+        dispatcher.async_notify("abc", "Pump", "Timer finished", ["notify.slow", "notify.phone"])
+        dispatcher.async_notify("def", "Valve", "Timer finished", ["notify.phone"])
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(phone) == 2
+    targets = dispatcher.async_get_stats()["targets"]
+    assert targets["notify.slow"]["timeouts"] == 1
+    assert targets["notify.phone"]["sent"] == 2
+
+
+async def test_entity_targets_are_switched_on(hass: HomeAssistant) -> None:
+    """Switch-like targets are turned on instead of receiving a message."""
+    turn_on = async_mock_service(hass, "input_boolean", "turn_on")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    dispatcher.async_notify("abc", "Pump", "Timer finished", ["input_boolean.alert"])
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert turn_on[0].data == {"entity_id": "input_boolean.alert"}
+
+
+async def test_invalid_target_is_counted_as_failure(hass: HomeAssistant) -> None:
+    """A malformed target is reported without affecting the others."""
+    phone = async_mock_service(hass, "notify", "phone")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    dispatcher.async_notify("abc", "Pump", "Timer finished", ["phone", "notify.phone"])
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(phone) == 1
+    assert dispatcher.async_get_stats()["targets"]["phone"]["failures"] == 1
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and let due flushes deliver."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_window_merges_messages_into_one_digest(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Messages within an instance's coalescing window reach each target once."""
+    phone = async_mock_service(hass, "notify", "phone")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    for message in ("Timer started", "Switch turned off", "Timer finished"):
+        dispatcher.async_notify("abc", "Pump", message, ["notify.phone"], window=30)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert not phone
+    assert dispatcher.async_get_stats()["pending_digests"] == 1
+
+    await _advance(hass, freezer, 31)
+    assert len(phone) == 1
+    assert phone[0].data["message"] == "3 updates:\n- Timer started\n- Switch turned off\n- Timer finished"
+    stats = dispatcher.async_get_stats()
+    assert stats["coalesced"] == 2
+    assert stats["pending_digests"] == 0
+
+
+async def test_rate_limit_holds_messages_back(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """A target over its per-minute limit gets the rest once the minute has passed."""
+    phone = async_mock_service(hass, "notify", "phone")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    for number in range(4):
+        dispatcher.async_notify("abc", "Pump", f"Message {number}", ["notify.phone"], rate_limit=2)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [call.data["message"] for call in phone] == ["Message 0", "Message 1"]
+    assert dispatcher.async_get_stats()["rate_limited"] == 1
+
+    await _advance(hass, freezer, 61)
+    assert len(phone) == 3
+    assert phone[2].data["message"] == "2 updates:\n- Message 2\n- Message 3"
+
+
+async def test_identical_digests_share_one_queue_item(hass: HomeAssistant) -> None:
+    """Targets receiving the same digest at the same time are delivered from one item."""
+    phone = async_mock_service(hass, "notify", "phone")
+    tablet = async_mock_service(hass, "notify", "tablet")
+    dispatcher = async_get_notification_dispatcher(hass)
+
+    with patch.object(dispatcher, "async_enqueue", wraps=dispatcher.async_enqueue) as enqueue:
+        dispatcher.async_notify("abc", "Pump", "Timer finished", ["notify.phone", "notify.tablet"])
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    enqueue.assert_called_once()
+    assert enqueue.call_args.args[0].targets == ["notify.phone", "notify.tablet"]
+    assert len(phone) == len(tablet) == 1
@@ -0,0 +1,101 @@
+"""Tests for pausing and resuming a running timer."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.const import DOMAIN
+
+from .conftest import SWITCH, entity_id_of, get_timer, stored_entry
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def _call(hass: HomeAssistant, service: str, entry_id: str, **data: Any) -> None:
+    """Call one of our services for a single entry."""
+    await hass.services.async_call(DOMAIN, service, {"entry_id": entry_id, **data}, blocking=True)
+
+
+async def test_pause_freezes_and_resume_continues(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """Time spent paused doesn't count; the timer finishes with what was left."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+    await _call(hass, "start_timer", entry.entry_id, duration=10)
+    await hass.async_block_till_done()
+
+    await _advance(hass, freezer, 120)
+    await _call(hass, "pause_timer", entry.entry_id)
+    await hass.async_block_till_done()
+    assert timer._timer_state == "paused"
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(entity_id).attributes["paused_remaining"] == 480
+
+    await _advance(hass, freezer, 300)
+    assert timer._timer_state == "paused"
+    assert hass.states.get(entity_id).attributes["paused_remaining"] == 480
+
+    await _call(hass, "resume_timer", entry.entry_id)
+    await hass.async_block_till_done()
+    assert timer._timer_state == "active"
+    assert hass.states.get(SWITCH).state == "on"
+    assert timer._timer_finishes_at == dt_util.utcnow() + timedelta(seconds=480)
+
+    await _advance(hass, freezer, 481)
+    assert timer._timer_state == "idle"
+    assert hass.states.get(SWITCH).state == "off"
+
+
+async def test_pause_and_resume_in_the_wrong_state(hass: HomeAssistant, setup_timer) -> None:
+    """Pausing an idle timer or resuming a running one is a validation error."""
+    entry = await setup_timer()
+    with pytest.raises(ServiceValidationError, match="Timer is not active"):
+        await _call(hass, "pause_timer", entry.entry_id)
+
+    await _call(hass, "start_timer", entry.entry_id, duration=10)
+    with pytest.raises(ServiceValidationError, match="Timer is not paused"):
+        await _call(hass, "resume_timer", entry.entry_id)
+
+
+async def test_paused_timer_survives_a_restart(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """A stored paused timer comes back paused, with nothing armed, and can be resumed."""
+    stored_entry(
+        hass_storage,
+        "abc",
+        {
+            "paused_remaining": 300.0,
+            "paused_at": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            "duration": 10,
+            "runtime_at_start": 0,
+        },
+    )
+
+    entry = await setup_timer(entry_id="abc")
+    timer = get_timer(hass, entry)
+    assert timer._timer_state == "paused"
+    assert timer._timer_finishes_at is None
+    assert hass.states.get(entity_id_of(hass, "timer_runtime_abc")).attributes["paused_remaining"] == 300
+    assert hass.states.get(SWITCH).state == "off"
+
+    await _call(hass, "resume_timer", "abc")
+    assert timer._timer_state == "active"
+    assert timer._timer_finishes_at == dt_util.utcnow() + timedelta(seconds=300)
@@ -0,0 +1,133 @@
+"""Tests for sequenced multi-zone programs."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.programs import SETTING_PROGRAMS, ProgramRun, ProgramStep, async_get_program_runner
+from custom_components.simple_timer.storage import async_get_storage
+
+from .conftest import SECOND_SWITCH, SWITCH, async_load_entry, get_timer, stored_entry, timer_entry
+
+START = datetime(2026, 10, 18, 6, 0, tzinfo=timezone.utc)
+
+
+def test_step_times_follow_from_the_start() -> None:
+    """Gaps push later steps back, overlaps pull them forward."""
+    steps = [ProgramStep("a", 600), ProgramStep("b", 300), ProgramStep("c", 60)]
+
+    run = ProgramRun("p", START, steps, gap=30)
+    assert run.step_start(1) == START + timedelta(seconds=630)
+    assert run.step_start(2) == START + timedelta(seconds=960)
+    assert run.finishes_at == START + timedelta(seconds=1020)
+
+    run = ProgramRun("p", START, steps, overlap=120)
+    assert run.step_start(1) == START + timedelta(seconds=480)
+    # The short last step ends before the overlapping one before it
+    assert run.step_end(2) == START + timedelta(seconds=720)
+    assert run.finishes_at == START + timedelta(seconds=780)
+
+
+def test_progress_round_trip() -> None:
+    """Stored progress rebuilds the same run."""
+    run = ProgramRun("p", START, [ProgramStep("a", 600.0), ProgramStep("b", 300.0)], gap=30.0, next_step=1)
+    restored = ProgramRun.from_storage("p", run.as_storage())
+    assert restored.as_storage() == run.as_storage()
+    assert restored.step_start(1) == run.step_start(1)
+
+
+async def _advance(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float) -> None:
+    """Move the clock forward and fire whatever became due."""
+    freezer.tick(seconds)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+async def test_steps_hand_over_on_time(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """Each zone starts as the previous one ends; progress is cleared on completion."""
+    pump = await setup_timer(name="Pump")
+    valve = await setup_timer(name="Valve", switch_entity_id=SECOND_SWITCH)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "run_program",
+        {"steps": [{"entry_id": pump.entry_id, "duration": 1}, {"entry_id": valve.entry_id, "duration": 2}]},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert [step["entry_id"] for step in response["steps"]] == [pump.entry_id, valve.entry_id]
+    assert response["steps"][1]["start"] == response["steps"][0]["end"]
+    assert get_timer(hass, pump)._timer_state == "active"
+    assert get_timer(hass, valve)._timer_state == "idle"
+
+    await _advance(hass, freezer, 60)
+    assert hass.states.get(SWITCH).state == "off"
+    assert hass.states.get(SECOND_SWITCH).state == "on"
+    assert get_timer(hass, valve)._timer_state == "active"
+
+    await _advance(hass, freezer, 120)
+    assert hass.states.get(SECOND_SWITCH).state == "off"
+    runner = async_get_program_runner(hass)
+    assert runner.async_get_stats() == {"running": {}, "completed": 1}
+    assert async_get_storage(hass).async_get_setting(SETTING_PROGRAMS) == {}
+
+
+async def test_stop_cancels_the_running_step(hass: HomeAssistant, setup_timer) -> None:
+    """Stopping a program cancels its running zone; an unknown program is an error."""
+    pump = await setup_timer(name="Pump")
+    await hass.services.async_call(
+        DOMAIN, "run_program", {"program_id": "morning", "steps": [{"entry_id": pump.entry_id, "duration": 5}]}, blocking=True
+    )
+    assert get_timer(hass, pump)._timer_state == "active"
+
+    await hass.services.async_call(DOMAIN, "stop_program", {"program_id": "morning"}, blocking=True)
+    await hass.async_block_till_done()
+    assert get_timer(hass, pump)._timer_state == "idle"
+    assert async_get_program_runner(hass).async_get_stats()["running"] == {}
+
+    with pytest.raises(ServiceValidationError, match="not running"):
+        await hass.services.async_call(DOMAIN, "stop_program", {"program_id": "morning"}, blocking=True)
+
+
+async def test_program_continues_after_a_restart(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory, switch: str
+) -> None:
+    """The step due after a restart is started for what is left of it; earlier ones aren't rerun."""
+    started_at = dt_util.utcnow() - timedelta(seconds=90)
+    stored_entry(hass_storage, "pump", {})
+    hass_storage[DOMAIN]["data"]["settings"][SETTING_PROGRAMS] = {
+        "default": {
+            "started_at": started_at.isoformat(),
+            "steps": [["pump", 60.0], ["valve", 120.0]],
+            "gap": 0.0,
+            "overlap": 0.0,
+            "next_step": 1,
+        }
+    }
+
+    hass.set_state(CoreState.starting)
+    pump = timer_entry(hass, SWITCH, entry_id="pump", name="Pump")
+    valve = timer_entry(hass, SECOND_SWITCH, entry_id="valve", name="Valve")
+    await async_load_entry(hass, pump)
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert get_timer(hass, pump)._timer_state == "idle"
+    valve_timer = get_timer(hass, valve)
+    assert valve_timer._timer_state == "active"
+    assert valve_timer._timer_finishes_at == started_at + timedelta(seconds=180)
+    assert async_get_program_runner(hass).async_get_stats()["running"]["default"]["step"] == 2
@@ -0,0 +1,89 @@
+"""Tests for the shared daily-reset engine."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.reset import async_get_reset_coordinator
+
+from .conftest import SECOND_SWITCH, get_timer, stored_entry
+
+
+async def test_instances_are_grouped_by_reset_time(hass: HomeAssistant, setup_timer) -> None:
+    """Instances sharing a reset time share one group; unloading leaves it."""
+    first = await setup_timer(name="Pump", reset_time="00:00")
+    await setup_timer(name="Pump boost", reset_time="00:00:00")
+    await setup_timer(name="Valve", switch_entity_id=SECOND_SWITCH, reset_time="03:00")
+    coordinator = async_get_reset_coordinator(hass)
+    assert coordinator.async_get_stats()["groups"] == {"00:00:00": 2, "03:00:00": 1}
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert coordinator.async_get_stats()["groups"] == {"00:00:00": 1, "03:00:00": 1}
+
+
+async def test_group_resets_together_with_one_flush(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """At the reset time every member is reset and the new dates reach disk at once."""
+    freezer.move_to(dt_util.start_of_local_day() + timedelta(hours=12))
+    reset_time = (dt_util.now() + timedelta(minutes=1)).strftime("%H:%M:%S")
+    entries = [
+        await setup_timer(name="Pump", reset_time=reset_time),
+        await setup_timer(name="Valve", switch_entity_id=SECOND_SWITCH, reset_time=reset_time),
+    ]
+    timers = [get_timer(hass, entry) for entry in entries]
+    for timer in timers:
+        timer._state = 120.0
+
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    stats = async_get_reset_coordinator(hass).async_get_stats()["last_run"]
+    assert stats["reset_time"] == reset_time
+    assert stats["instances"] == 2
+    saved = hass_storage[DOMAIN]["data"]["entries"]
+    for entry, timer in zip(entries, timers):
+        assert timer._state == 0.0
+        assert timer._next_reset_date > dt_util.now()
+        assert saved[entry.entry_id]["next_reset_date"] == timer._next_reset_date.isoformat()
+
+
+async def test_missed_reset_is_caught_up_on_startup(
+    hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer
+) -> None:
+    """A reset date passed while offline is caught up once restored."""
+    missed = dt_util.now() - timedelta(days=2, hours=1)
+    stored_entry(hass_storage, "abc", {"next_reset_date": missed.isoformat()})
+
+    entry = await setup_timer(entry_id="abc")
+    timer = get_timer(hass, entry)
+
+    assert timer._last_reset_was_catchup
+    assert timer._next_reset_date > dt_util.now()
+    assert timer._state == 0.0
+    catch_up = async_get_reset_coordinator(hass).async_get_stats()["last_catch_up"]
+    assert catch_up["instances"] == 1
+    assert catch_up["caught_up"] == 1
+
+
+async def test_future_reset_date_is_kept(hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer) -> None:
+    """A stored reset date still ahead is restored without a catch-up."""
+    upcoming = (dt_util.now() + timedelta(hours=3)).replace(microsecond=0)
+    stored_entry(hass_storage, "abc", {"next_reset_date": upcoming.isoformat()})
+
+    timer = get_timer(hass, await setup_timer(entry_id="abc"))
+
+    assert timer._next_reset_date == upcoming
+    assert not timer._last_reset_was_catchup
+    assert async_get_reset_coordinator(hass).async_get_stats()["last_catch_up"]["caught_up"] == 0
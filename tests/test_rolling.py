@@ -0,0 +1,84 @@
+"""Tests for the daily-total ring buffer and the rolling usage sensors."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.simple_timer.rolling import RING_DAYS, DailyTotals
+
+from .conftest import SWITCH, async_load_entry, entity_id_of, stored_entry, timer_entry
+
+# Ten stored days of one hour each, next day goes to slot 10
+TEN_HOURS = [10, 10, [3600.0] * 10 + [0.0] * (RING_DAYS - 10)]
+
+
+def test_windows_sum_the_latest_days() -> None:
+    """Each window sums only its most recent days."""
+    totals = DailyTotals()
+    for day in range(1, 11):
+        totals.push(day * 100)
+    assert totals.total(7) == 4900
+    assert totals.total(30) == 5500
+    assert (totals.days(7), totals.days(30)) == (7, 10)
+
+    # Once full, the oldest day drops out of each window
+    for _ in range(40):
+        totals.push(1)
+    assert (totals.total(7), totals.total(30)) == (7, 30)
+    assert totals.days(30) == RING_DAYS
+
+
+def test_storage_round_trip() -> None:
+    """The window sums are recomputed from the stored buffer."""
+    totals = DailyTotals()
+    for day in range(1, 11):
+        totals.push(day * 100)
+    restored = DailyTotals.from_storage(totals.as_storage())
+    assert (restored.total(7), restored.total(30), restored.days(30)) == (4900, 5500, 10)
+
+    for invalid in (None, "x", [0, 5, [1.0] * 3]):
+        assert DailyTotals.from_storage(invalid).days(7) == 0
+
+
+async def test_rolling_sensors_are_restored(
+    hass: HomeAssistant, hass_storage: dict[str, Any], switch: str
+) -> None:
+    """Rolling sensors are unavailable until the restore, then show the stored totals."""
+    upcoming = dt_util.now() + timedelta(hours=3)
+    stored_entry(hass_storage, "abc", {"daily_totals": TEN_HOURS, "next_reset_date": upcoming.isoformat()})
+
+    hass.set_state(CoreState.starting)
+    await async_load_entry(hass, timer_entry(hass, SWITCH, entry_id="abc"))
+    await hass.async_block_till_done()
+    seven_days = entity_id_of(hass, "timer_runtime_abc_7d")
+    thirty_days = entity_id_of(hass, "timer_runtime_abc_30d")
+    assert hass.states.get(seven_days).state == STATE_UNAVAILABLE
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Shown in the suggested unit (hours)
+    assert float(hass.states.get(seven_days).state) == pytest.approx(7)
+    assert float(hass.states.get(thirty_days).state) == pytest.approx(10)
+    assert hass.states.get(thirty_days).attributes["days"] == 10
+
+
+async def test_missed_days_count_as_zero(hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer) -> None:
+    """A catch-up reset pushes the finished day plus a zero for each day missed."""
+    missed = dt_util.now() - timedelta(days=2, hours=1)
+    stored_entry(hass_storage, "abc", {"daily_totals": TEN_HOURS, "next_reset_date": missed.isoformat()})
+
+    await setup_timer(entry_id="abc")
+
+    seven_days = hass.states.get(entity_id_of(hass, "timer_runtime_abc_7d"))
+    assert float(seven_days.state) == pytest.approx(4)
+    assert hass.states.get(entity_id_of(hass, "timer_runtime_abc_30d")).attributes["days"] == 13
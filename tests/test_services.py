@@ -0,0 +1,83 @@
+"""Tests for multi-target (bulk) service calls."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+from custom_components.simple_timer.const import DOMAIN
+
+from .conftest import SECOND_SWITCH, entity_id_of, get_timer
+
+
+async def _two_timers(hass: HomeAssistant, setup_timer):
+    """Set up a pump and a valve timer; return their entries and runtime entity ids."""
+    pump = await setup_timer(name="Pump")
+    valve = await setup_timer(name="Valve", switch_entity_id=SECOND_SWITCH)
+    return (pump, valve), [entity_id_of(hass, f"timer_runtime_{entry.entry_id}") for entry in (pump, valve)]
+
+
+async def test_bulk_call_reports_each_target(hass: HomeAssistant, setup_timer) -> None:
+    """Every matched timer runs the action; a bad target is reported, not raised."""
+    entries, entity_ids = await _two_timers(hass, setup_timer)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "start_timer",
+        {"entity_id": [*entity_ids, "sensor.not_a_timer"], "duration": 5},
+        blocking=True,
+        return_response=True,
+    )
+
+    results = response["results"]
+    for entry, entity_id in zip(entries, entity_ids):
+        assert results[entity_id] == {"entry_id": entry.entry_id, "success": True}
+        assert get_timer(hass, entry)._timer_state == "active"
+    assert results["sensor.not_a_timer"]["success"] is False
+
+
+async def test_single_target_keeps_raising(hass: HomeAssistant, setup_timer) -> None:
+    """A call naming one bad target still fails loudly."""
+    await setup_timer()
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, "start_timer", {"entity_id": "sensor.not_a_timer", "duration": 5}, blocking=True
+        )
+
+
+async def test_targets_are_deduplicated(hass: HomeAssistant, setup_timer) -> None:
+    """Naming the same instance by entry_id and entity_id runs it once."""
+    entry = await setup_timer()
+    entity_id = entity_id_of(hass, f"timer_runtime_{entry.entry_id}")
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "cancel_timer",
+        {"entry_id": entry.entry_id, "entity_id": entity_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(response["results"]) == [entry.entry_id]
+
+
+async def test_area_targets(hass: HomeAssistant, setup_timer) -> None:
+    """area_id selects only the timers placed in that area."""
+    (pump, valve), entity_ids = await _two_timers(hass, setup_timer)
+    garden = ar.async_get(hass).async_create("Garden")
+    er.async_get(hass).async_update_entity(entity_ids[1], area_id=garden.id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, "start_timer", {"area_id": garden.id, "duration": 5}, blocking=True
+    )
+    assert get_timer(hass, valve)._timer_state == "active"
+    assert get_timer(hass, pump)._timer_state == "idle"
+
+    with pytest.raises(ServiceValidationError, match="No Simple Timer entities matched"):
+        await hass.services.async_call(
+            DOMAIN, "start_timer", {"area_id": "cellar", "duration": 5}, blocking=True
+        )
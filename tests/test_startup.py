@@ -0,0 +1,58 @@
+"""Tests for the shared startup readiness gate."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.simple_timer.startup import async_get_startup_gate
+
+
+async def test_gate_opens_on_events(hass: HomeAssistant) -> None:
+    """Core start, the turn_on/turn_off services and the switch are awaited as events."""
+    hass.set_state(CoreState.starting)
+    hass.states.async_set("switch.pump", "unavailable")
+    gate = async_get_startup_gate(hass)
+
+    waiter = hass.async_create_task(gate.async_wait("switch.pump", timeout=5))
+    await asyncio.sleep(0)
+    assert not gate.async_is_ready("switch.pump")
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    assert await async_setup_component(hass, "homeassistant", {})
+    await asyncio.sleep(0)
+    assert gate.async_is_ready(None)
+    assert not waiter.done()
+
+    hass.states.async_set("switch.pump", "unknown")
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    hass.states.async_set("switch.pump", "off")
+    assert await waiter
+    assert gate.async_is_ready("switch.pump")
+
+
+async def test_gate_times_out(hass: HomeAssistant) -> None:
+    """A switch that never becomes usable doesn't block forever."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    gate = async_get_startup_gate(hass)
+    assert not await gate.async_wait("switch.missing", timeout=0.01)
+
+
+async def test_ready_switches_pass_immediately(hass: HomeAssistant) -> None:
+    """Once everything is up, waiting costs nothing and the gate is shared."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    hass.states.async_set("switch.pump", "on")
+    gate = async_get_startup_gate(hass)
+
+    assert gate.async_is_ready("switch.pump")
+    assert await gate.async_wait("switch.pump", timeout=0.01)
+    assert async_get_startup_gate(hass) is gate
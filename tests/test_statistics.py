@@ -0,0 +1,105 @@
+"""Tests for the hourly long-term runtime statistics."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.statistics import (
+    MAX_BACKFILL_HOURS,
+    STORAGE_KEY_STATISTICS,
+    RuntimeIntervals,
+    RuntimeStatisticsPublisher,
+    async_get_statistics_publisher,
+)
+
+from .conftest import SWITCH, get_timer, stored_entry
+
+TEN = datetime(2026, 10, 18, 10, 0, tzinfo=timezone.utc)
+
+
+def _at(minutes: float) -> datetime:
+    """Return the moment `minutes` after 10:00 UTC."""
+    return TEN + timedelta(minutes=minutes)
+
+
+def test_intervals_are_split_into_hours() -> None:
+    """Finished hours are returned once; an open interval carries on into the next hour."""
+    intervals = RuntimeIntervals()
+    intervals.switch_on(_at(30))
+    intervals.switch_off(_at(75))
+    intervals.switch_on(_at(105))
+
+    assert intervals.take_hours(_at(125)) == [(_at(0), 1800.0), (_at(60), 1800.0)]
+    assert intervals.closed == []
+    assert intervals.on_since == _at(120)
+    assert intervals.published_until == _at(120)
+
+    assert intervals.take_hours(_at(180)) == [(_at(120), 3600.0)]
+    assert intervals.take_hours(_at(190)) == []
+
+
+def test_backfill_is_capped() -> None:
+    """A long downtime publishes at most MAX_BACKFILL_HOURS hours."""
+    intervals = RuntimeIntervals(published_until=TEN - timedelta(hours=100))
+    hours = intervals.take_hours(TEN)
+    assert len(hours) == MAX_BACKFILL_HOURS
+    assert hours[0][0] == TEN - timedelta(hours=MAX_BACKFILL_HOURS)
+
+
+def test_open_interval_is_closed_when_last_seen() -> None:
+    """After a restart the switch only counts as on until it was last seen."""
+    intervals = RuntimeIntervals(1.5, _at(0), [], on_since=_at(10), seen=_at(20))
+    restored = RuntimeIntervals.from_storage(intervals.as_storage())
+
+    assert restored.total == 1.5
+    assert restored.published_until == _at(0)
+    assert restored.closed == [(_at(10), _at(20))]
+    assert restored.on_since is None
+    assert RuntimeIntervals.from_storage({"closed": [["nonsense"]]}) == RuntimeIntervals()
+
+
+async def test_finished_hour_is_published(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer
+) -> None:
+    """On the hour every instance pushes one row with its on-time and running sum."""
+    freezer.move_to(_at(30))
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    await hass.services.async_call("input_boolean", "turn_on", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+
+    hass.config.components.add("recorder")
+    with patch("custom_components.simple_timer.statistics.async_add_external_statistics") as add_statistics:
+        freezer.move_to(_at(60))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    metadata, rows = add_statistics.call_args.args[1:]
+    assert metadata["statistic_id"] == RuntimeStatisticsPublisher.statistic_id(entry.entry_id)
+    assert metadata["has_sum"]
+    assert rows == [{"start": _at(0), "state": 0.5, "sum": 0.5}]
+    assert timer._runtime_intervals.on_since == _at(60)
+    assert async_get_statistics_publisher(hass).async_get_stats()["last_run"]["rows"] == 1
+
+
+async def test_pending_intervals_are_restored(
+    hass: HomeAssistant, hass_storage: dict[str, Any], setup_timer
+) -> None:
+    """The running sum and unpublished intervals survive a restart."""
+    stored = RuntimeIntervals(3.25, _at(0), [(_at(5), _at(15))], on_since=_at(30), seen=_at(40))
+    stored_entry(hass_storage, "abc", {STORAGE_KEY_STATISTICS: stored.as_storage()})
+
+    timer = get_timer(hass, await setup_timer(entry_id="abc"))
+
+    assert timer._runtime_intervals.total == 3.25
+    assert timer._runtime_intervals.closed == [(_at(5), _at(15)), (_at(30), _at(40))]
+    assert async_get_statistics_publisher(hass).async_get_stats()["instances"] == 1
@@ -0,0 +1,156 @@
+"""Tests for the cached, debounced timer storage."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.const import DOMAIN
+from custom_components.simple_timer.storage import (
+    LEGACY_STORAGE_KEY_FORMAT,
+    SAVE_DELAY,
+    SimpleTimerStorage,
+    async_get_storage,
+)
+
+from .conftest import stored_entry
+
+
+def _saved_entry(hass_storage: dict[str, Any], entry_id: str) -> dict[str, Any] | None:
+    """Return what was last written to disk for one instance."""
+    if DOMAIN not in hass_storage:
+        return None
+    return hass_storage[DOMAIN]["data"]["entries"].get(entry_id)
+
+
+async def test_reads_are_served_from_the_cache(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """The document is read once; later loads return the cached copy."""
+    stored_entry(hass_storage, "abc", {"next_reset_date": "2026-01-01T00:00:00+00:00"})
+    view = async_get_storage(hass).async_entry("abc")
+
+    first = await view.async_load()
+    hass_storage.pop(DOMAIN)
+    second = await view.async_load()
+    assert second is first
+    assert second["next_reset_date"] == "2026-01-01T00:00:00+00:00"
+
+
+async def test_routine_changes_are_debounced(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Non-critical fields are coalesced into one delayed write."""
+    view = async_get_storage(hass).async_entry("abc")
+    await view.async_update({"next_reset_date": "2026-01-01T00:00:00+00:00"})
+    await view.async_update({"member_runtime": {"switch.a": 12}})
+    await hass.async_block_till_done()
+    assert _saved_entry(hass_storage, "abc") is None
+    assert view.dirty == {"next_reset_date", "member_runtime"}
+
+    freezer.tick(SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert _saved_entry(hass_storage, "abc") == {
+        "next_reset_date": "2026-01-01T00:00:00+00:00",
+        "member_runtime": {"switch.a": 12},
+    }
+    assert not view.dirty
+
+
+async def test_critical_changes_are_written_at_once(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """A running timer's finish time reaches disk before async_update returns."""
+    view = async_get_storage(hass).async_entry("abc")
+    await view.async_update({"finishes_at": "2026-01-01T00:10:00+00:00", "duration": 10})
+    assert _saved_entry(hass_storage, "abc") == {"finishes_at": "2026-01-01T00:10:00+00:00", "duration": 10}
+
+    await view.async_remove("finishes_at", "duration")
+    assert _saved_entry(hass_storage, "abc") == {}
+
+
+async def test_unchanged_values_are_not_written(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Writing the value already stored marks nothing dirty."""
+    stored_entry(hass_storage, "abc", {"duration": 10})
+    view = async_get_storage(hass).async_entry("abc")
+    await view.async_load()
+    hass_storage.pop(DOMAIN)
+
+    await view.async_update({"duration": 10})
+    await view.async_remove("finishes_at")
+    assert not view.dirty
+    assert DOMAIN not in hass_storage
+
+
+async def _count_writes(storage: SimpleTimerStorage) -> list[dict[str, Any]]:
+    """Record every document write of the domain store."""
+    await storage.async_load()
+    writes: list[dict[str, Any]] = []
+    original = storage._store.async_save
+
+    async def _async_save(data: dict[str, Any]) -> None:
+        writes.append(data)
+        await original(data)
+
+    storage._store.async_save = _async_save
+    return writes
+
+
+async def test_instances_share_one_document(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Critical flushes of several instances in the same iteration share one write."""
+    storage = async_get_storage(hass)
+    writes = await _count_writes(storage)
+
+    await asyncio.gather(
+        storage.async_entry("abc").async_update({"finishes_at": "2026-01-01T00:10:00+00:00"}),
+        storage.async_entry("def").async_update({"finishes_at": "2026-01-01T00:20:00+00:00"}),
+    )
+    assert len(writes) == 1
+    assert set(hass_storage[DOMAIN]["data"]["entries"]) == {"abc", "def"}
+
+
+async def test_batch_writes_once_at_the_end(hass: HomeAssistant) -> None:
+    """Immediate writes inside async_batch are held back until the block ends."""
+    storage = async_get_storage(hass)
+    writes = await _count_writes(storage)
+
+    async with storage.async_batch():
+        for entry_id in ("abc", "def", "ghi"):
+            await storage.async_entry(entry_id).async_update({"duration": 5})
+        assert not writes
+    assert len(writes) == 1
+
+
+async def test_legacy_files_are_migrated(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Per-entry files of older versions are folded into the document and deleted."""
+    legacy_key = LEGACY_STORAGE_KEY_FORMAT.format("abc")
+    hass_storage[legacy_key] = {
+        "version": 2,
+        "minor_version": 1,
+        "key": legacy_key,
+        "data": {"next_reset_date": "2026-01-01T00:00:00+00:00"},
+    }
+    storage = async_get_storage(hass)
+
+    await storage.async_migrate_legacy(["abc", "def"])
+    assert legacy_key not in hass_storage
+    assert hass_storage[DOMAIN]["data"]["entries"] == {
+        "abc": {"next_reset_date": "2026-01-01T00:00:00+00:00"},
+    }
+    assert (await storage.async_entry("abc").async_load())["next_reset_date"] == "2026-01-01T00:00:00+00:00"
+
+    # Already consolidated: nothing is read or written again
+    writes = await _count_writes(storage)
+    await storage.async_migrate_legacy(["abc"])
+    assert not writes
+
+
+async def test_removed_entry_is_dropped(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Deleting an instance removes its part of the document."""
+    stored_entry(hass_storage, "abc", {"duration": 10})
+    await async_get_storage(hass).async_remove_entry("abc")
+    assert hass_storage[DOMAIN]["data"]["entries"] == {}
@@ -0,0 +1,80 @@
+"""Tests for the shared domain tick."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simple_timer.tick import async_get_tick_hub
+
+from .conftest import SWITCH, get_timer
+
+
+async def _tick(hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: int = 1) -> None:
+    """Advance the clock second by second, firing each tick."""
+    for _ in range(seconds):
+        freezer.tick(1)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+
+async def test_one_tick_drives_every_listener(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """All listeners run from the same tick, which stops with the last listener."""
+    hub = async_get_tick_hub(hass)
+    first, second = [], []
+    remove_first = hub.async_add_listener(first.append)
+    remove_second = hub.async_add_listener(second.append)
+
+    await _tick(hass, freezer, 3)
+    assert len(first) == len(second) == 3
+    assert first == second
+    assert hub.async_get_stats()["ticks"] == 3
+
+    remove_first()
+    await _tick(hass, freezer)
+    assert len(first) == 3
+    assert len(second) == 4
+
+    remove_second()
+    assert hub.listener_count == 0
+    await _tick(hass, freezer, 2)
+    assert hub.async_get_stats()["ticks"] == 4
+
+
+async def test_failing_listener_does_not_stop_the_tick(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """An exception in one listener is logged and the others still run."""
+    hub = async_get_tick_hub(hass)
+    calls = []
+
+    def _fail(now) -> None:
+        raise RuntimeError("boom")
+
+    hub.async_add_listener(_fail)
+    hub.async_add_listener(calls.append)
+
+    await _tick(hass, freezer, 2)
+    assert len(calls) == 2
+
+
+async def test_only_busy_timers_subscribe(hass: HomeAssistant, freezer: FrozenDateTimeFactory, setup_timer) -> None:
+    """An idle timer costs no tick; a running switch subscribes until it turns off."""
+    entry = await setup_timer()
+    timer = get_timer(hass, entry)
+    hub = async_get_tick_hub(hass)
+    assert hub.listener_count == 0
+
+    await hass.services.async_call("input_boolean", "turn_on", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    assert hub.listener_count == 1
+
+    await _tick(hass, freezer, 5)
+    assert timer.native_value == 5
+
+    await hass.services.async_call("input_boolean", "turn_off", {"entity_id": SWITCH}, blocking=True)
+    await hass.async_block_till_done()
+    assert hub.listener_count == 0
+    assert timer.native_value == 5